@@ -15,17 +15,22 @@
 import logging
 import multiprocessing as mp
 from contextlib import contextmanager
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from math import ceil, log10
 from os import PathLike
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from openmdao.utils.mpi import FakeComm
 
 from fastoad._utils.files import as_path, make_parent_dir
 from fastoad.io import DataFile
 from fastoad.io.configuration import FASTOADProblemConfigurator
+from fastoad.models.performances.mission.openmdao.base import BaseMissionComp
+from fastoad.openmdao.problem import FASTOADProblem
 from fastoad.openmdao.variables import VariableList
 
 # Import MPI4Py at the module level to avoid repeated imports
@@ -119,6 +124,80 @@ class CalcRunner:
 
         return output_data
 
+    def run_with_reused_problem(
+        self,
+        input_values: Optional[VariableList] = None,
+        calculation_folder: Optional[Union[str, PathLike]] = None,
+        max_problem_uses: Optional[int] = None,
+    ) -> DataFile:
+        """
+        Same as :meth:`run`, except that the problem is built and set up only at first call in
+        current process. Next calls reuse it, and only set input values before running it.
+
+        Before each run, variable values of the problem are set back to their state after
+        setup, and mission components forget their previous computations (solver states and
+        baseline computation), so results are the same as the ones of :meth:`run`, provided
+        that no other component keeps an internal state from one computation to the next one.
+
+        Problems are kept until :meth:`clear_reused_problems` is called.
+
+        :param input_values: if provided, these values will supersede the content
+                             of input file (specified in configuration file)
+        :param calculation_folder: if specified, configuration, input and output files
+                                   will be stored in that folder. The input file in this folder
+                                   will contain data from `input_values`
+        :param max_problem_uses: if provided, the problem is built again after being used this
+                                 number of times, to bound memory usage
+        :return: the written output data
+        """
+        reusable_problem = _REUSABLE_PROBLEMS.get(self._problem_key)
+        if reusable_problem is None or (
+            max_problem_uses and reusable_problem.use_count >= max_problem_uses
+        ):
+            reusable_problem = _ReusableProblem.build(self)
+            _REUSABLE_PROBLEMS[self._problem_key] = reusable_problem
+
+        problem = reusable_problem.problem
+        reusable_problem.reset()
+
+        if calculation_folder:
+            make_parent_dir(calculation_folder)
+            # The original configurator is kept unchanged for next calls.
+            configuration = deepcopy(reusable_problem.configuration)
+            configuration.make_local(calculation_folder)
+            if input_values:
+                input_data = DataFile(configuration.input_file_path)
+                input_data.update(input_values)
+                input_data.save()
+            problem.output_file_path = configuration.output_file_path
+        else:
+            problem.output_file_path = reusable_problem.configuration.output_file_path
+
+        if input_values:
+            for input_variable in input_values:
+                problem.set_val(
+                    input_variable.name,
+                    val=input_variable.val,
+                    units=input_variable.units,
+                )
+
+        if self.optimize:
+            problem.run_driver()
+        else:
+            problem.run_model()
+
+        return problem.write_outputs()
+
+    @staticmethod
+    def clear_reused_problems():
+        """Releases the problems kept by current process for :meth:`run_with_reused_problem`."""
+        _REUSABLE_PROBLEMS.clear()
+
+    @property
+    def _problem_key(self) -> Tuple[Path, Optional[Path], bool]:
+        """Identifies the problems that can be reused by :meth:`run_with_reused_problem`."""
+        return self.configuration_file_path, self.input_file_path, self.optimize
+
     def run_cases(
         self,
         input_list: List[VariableList],
@@ -127,6 +206,8 @@ class CalcRunner:
         max_workers: Optional[int] = None,
         use_MPI_if_available: bool = True,
         overwrite_subfolders: bool = False,
+        reuse_problems: bool = False,
+        max_cases_per_worker: Optional[int] = None,
     ):
         """
         Run computations concurrently.
@@ -145,6 +226,14 @@ class CalcRunner:
                                      library.
         :param overwrite_subfolders: if False, calculations that match existing subfolders won't be
                                      run (allows batch continuation)
+        :param reuse_problems: if True, each worker builds and sets up the problem only once,
+                               and next computations only set input values before running it
+                               (see :meth:`run_with_reused_problem`). This is relevant when
+                               only input values differ between computations, e.g. for a DOE.
+        :param max_cases_per_worker: if provided, each worker process is replaced after this
+                                     number of computations, to bound memory usage. With MPI,
+                                     processes are kept, but if `reuse_problems` is True, the
+                                     problem is built again.
         """
         destination_folder = as_path(destination_folder).resolve()
 
@@ -168,11 +257,21 @@ class CalcRunner:
                 )
             max_workers = max(1, min(max_workers, max_proc))
 
-        pool_cls = _MPIPool if use_MPI else mp.Pool
+        if use_MPI:
+            pool = _MPIPool(max_workers)
+        else:
+            pool = mp.Pool(max_workers, maxtasksperchild=max_cases_per_worker)
 
-        with pool_cls(max_workers) as pool:
-            pool.starmap(
-                CalcRunner.run,
+        if reuse_problems:
+            run_function = partial(
+                CalcRunner.run_with_reused_problem, max_problem_uses=max_cases_per_worker
+            )
+        else:
+            run_function = CalcRunner.run
+
+        with pool as executor:
+            executor.starmap(
+                run_function,
                 self._calculation_inputs(input_list, destination_folder, overwrite_subfolders),
                 # If a computation crashes, the whole chunk stops.
                 # chunksize=1 ensures all computations will be launched.
@@ -197,6 +296,67 @@ class CalcRunner:
                 _LOGGER.info('Subfolder "%s" exists. Computation skipped', calculation_folder)
 
 
+@dataclass
+class _ReusableProblem:
+    """A problem that is set up once and run for several sets of input values."""
+
+    #: The configuration that provided the problem
+    configuration: FASTOADProblemConfigurator
+
+    #: The problem, ready to run
+    problem: FASTOADProblem
+
+    #: Values of all outputs of the problem model (including independent variables) after
+    #: setup, with absolute names as keys
+    initial_values: Dict[str, np.ndarray]
+
+    #: Number of runs since the problem has been built
+    use_count: int = 0
+
+    @classmethod
+    def build(cls, runner: CalcRunner) -> "_ReusableProblem":
+        """
+        :param runner:
+        :return: an instance with the problem defined by `runner`, set up and with inputs
+                 read from input file
+        """
+        configuration = FASTOADProblemConfigurator(runner.configuration_file_path)
+        if runner.input_file_path:
+            configuration.input_file_path = runner.input_file_path
+
+        problem = configuration.get_problem(read_inputs=True)
+        problem.comm = FakeComm()  # We do not run OpenMDAO in parallel
+        problem.setup()
+        problem.final_setup()
+
+        initial_values = {
+            name: deepcopy(problem.get_val(name))
+            for name in problem.model.get_io_metadata(
+                iotypes="output", metadata_keys=[], return_rel_names=False
+            )
+        }
+
+        return cls(configuration, problem, initial_values)
+
+    def reset(self):
+        """
+        Sets variable values back to their state after setup, and makes mission components
+        forget their previous computations.
+
+        Iteration counters are reset by OpenMDAO at start of each run.
+        """
+        for name, value in self.initial_values.items():
+            self.problem.set_val(name, deepcopy(value))
+        for system in self.problem.model.system_iter(include_self=True, recurse=True):
+            if isinstance(system, BaseMissionComp):
+                system.reset_mission_state()
+        self.use_count += 1
+
+
+# Problems kept by current process for CalcRunner.run_with_reused_problem()
+_REUSABLE_PROBLEMS: Dict[Tuple[Path, Optional[Path], bool], _ReusableProblem] = {}
+
+
 @contextmanager
 def _MPIPool(*args, **kwargs):
     """Assumes availability of MPI environment."""
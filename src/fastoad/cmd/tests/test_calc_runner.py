@@ -17,6 +17,7 @@ from pathlib import Path
 
 import pytest
 
+from fastoad.io.configuration import FASTOADProblemConfigurator
 from fastoad.openmdao.variables import Variable, VariableList
 
 from ..calc_runner import CalcRunner
@@ -167,3 +168,77 @@ def test_multiprocessing_run_2cpu(cleanup):
         max_workers=2,
         use_MPI_if_available=False,
     )
+
+
+def test_multiprocessing_run_with_reused_problems(cleanup):
+    run_case = CalcRunner(configuration_file_path=DATA_FOLDER_PATH / "sellar2.yml")
+
+    input_vars = [
+        VariableList([Variable("x", val=0.0), Variable("z", val=0.0)]),
+        VariableList([Variable("x", val=10.0), Variable("z", val=0.0)]),
+        VariableList([Variable("x", val=10.0), Variable("z", val=10.0)]),
+        VariableList([Variable("z", val=10.0)]),
+    ] * 2
+
+    run_case.run_cases(
+        input_vars,
+        RESULTS_FOLDER_PATH / "without_reuse",
+        max_workers=2,
+        use_MPI_if_available=False,
+    )
+    run_case.run_cases(
+        input_vars,
+        RESULTS_FOLDER_PATH / "with_reuse",
+        max_workers=2,
+        use_MPI_if_available=False,
+        reuse_problems=True,
+        max_cases_per_worker=3,
+    )
+
+    # Results do not depend on previous computations of workers.
+    for i in range(len(input_vars)):
+        for file_name in ["inputs.xml", "outputs.xml"]:
+            assert cmp(
+                RESULTS_FOLDER_PATH / "without_reuse" / f"calc_{i}" / file_name,
+                RESULTS_FOLDER_PATH / "with_reuse" / f"calc_{i}" / file_name,
+                shallow=False,
+            )
+
+
+def test_reused_problem_reset(cleanup, monkeypatch):
+    built_problem_count = 0
+    original_get_problem = FASTOADProblemConfigurator.get_problem
+
+    def get_problem(self, *args, **kwargs):
+        nonlocal built_problem_count
+        built_problem_count += 1
+        return original_get_problem(self, *args, **kwargs)
+
+    monkeypatch.setattr(FASTOADProblemConfigurator, "get_problem", get_problem)
+
+    run_case = CalcRunner(configuration_file_path=DATA_FOLDER_PATH / "sellar2.yml")
+    CalcRunner.clear_reused_problems()
+
+    input_vars = [
+        VariableList([Variable("x", val=10.0)]),
+        VariableList([Variable("z", val=10.0)]),
+        VariableList([Variable("x", val=10.0)]),
+    ]
+    reused_outputs = [
+        run_case.run_with_reused_problem(input_values, RESULTS_FOLDER_PATH / f"reused_{i}")
+        for i, input_values in enumerate(input_vars)
+    ]
+    assert built_problem_count == 1
+
+    # Results do not depend on previous runs of the problem.
+    for i, (input_values, outputs) in enumerate(zip(input_vars, reused_outputs)):
+        ref_outputs = run_case.run(input_values, RESULTS_FOLDER_PATH / f"not_reused_{i}")
+        for variable in ref_outputs:
+            assert outputs[variable.name].val == pytest.approx(variable.val)
+    assert built_problem_count == 1 + len(input_vars)
+
+    # After clearing, the problem is built again.
+    CalcRunner.clear_reused_problems()
+    run_case.run_with_reused_problem(input_vars[0], RESULTS_FOLDER_PATH / "rebuilt")
+    assert built_problem_count == 2 + len(input_vars)
+    CalcRunner.clear_reused_problems()
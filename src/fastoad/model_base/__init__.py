@@ -16,4 +16,4 @@ Base features for FAST-OAD models
 
 # flake8: noqa
 from .atmosphere import Atmosphere, AtmosphereSI
-from .flight_point import FlightPoint
+from .flight_point import FlightPoint, FlightPointBatch
@@ -26,6 +26,7 @@ AIR_GAS_CONSTANT = R / AIR_MOLAR_MASS
 SEA_LEVEL_PRESSURE = atmosphere
 SEA_LEVEL_TEMPERATURE = 288.15
 TROPOPAUSE = 11000
+SEA_LEVEL_DENSITY = SEA_LEVEL_PRESSURE / AIR_GAS_CONSTANT / SEA_LEVEL_TEMPERATURE
 
 
 @deprecated(
@@ -179,9 +180,8 @@ class Atmosphere:
             if self._mach is not None:
                 self._true_airspeed = self._mach * self.speed_of_sound
             if self._equivalent_airspeed is not None:
-                sea_level = Atmosphere(0)
                 self._true_airspeed = self._equivalent_airspeed * np.sqrt(
-                    sea_level.density / self.density
+                    SEA_LEVEL_DENSITY / self.density
                 )
             if self._unitary_reynolds is not None:
                 self._true_airspeed = self._unitary_reynolds * self.kinematic_viscosity
@@ -191,9 +191,8 @@ class Atmosphere:
     def equivalent_airspeed(self) -> Union[float, Sequence[float]]:
         """Equivalent airspeed (EAS) in m/s."""
         if self._equivalent_airspeed is None and self.true_airspeed is not None:
-            sea_level = Atmosphere(0)
             self._equivalent_airspeed = self.true_airspeed / np.sqrt(
-                sea_level.density / self.density
+                SEA_LEVEL_DENSITY / self.density
             )
 
         return self._return_value(self._equivalent_airspeed)
@@ -13,11 +13,11 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from copy import deepcopy
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import dataclass, field, fields
 from numbers import Number
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from fastoad._utils.arrays import scalarize
@@ -25,6 +25,9 @@ from fastoad.constants import EngineSetting
 
 FIELD_DESCRIPTOR = "field_descriptor"
 
+# Types of values that need no scalarization (subclasses are not included on purpose)
+_SCALAR_TYPES = frozenset((float, int, str, bool, type(None)))
+
 
 @dataclass
 class _FieldDescriptor:
@@ -193,9 +196,21 @@ class FlightPoint:
     # Will store field metadata when needed. Must be accessed through _get_field_descriptors()
     __field_descriptors = {}
 
+    # Will store field names for each class when needed. Must be accessed
+    # through _get_field_name_tuple()
+    __field_names = {}
+
     def __post_init__(self):
         self._relative_parameters = {"ground_distance", "time"}
 
+    def __copy__(self) -> "FlightPoint":
+        # A shallow copy is enough for field values, as they are expected to be scalars,
+        # but the set of relative fields must not be shared.
+        new_point = object.__new__(type(self))
+        new_point.__dict__.update(self.__dict__)
+        new_point._relative_parameters = set(self._relative_parameters)
+        return new_point
+
     def set_as_relative(self, field_names: Union[Sequence[str], str]):
         """
         Makes that values for given field_names will be considered as relative when
@@ -236,31 +251,34 @@ class FlightPoint:
         :param reference_point: relative fields will be made absolute using this point.
         :return: the copied flight point with no relative field.
         """
-        new_point = deepcopy(self)
-        for cls_field in fields(new_point):
-            reference_value = getattr(reference_point, cls_field.name)
-            target_value = getattr(new_point, cls_field.name)
-            if isinstance(target_value, Number) and new_point.is_relative(cls_field.name):
-                setattr(new_point, cls_field.name, reference_value + target_value)
-                new_point.set_as_absolute(cls_field.name)
+        new_point = self.__copy__()
         new_point.scalarize()
+        for field_name in self._relative_parameters.intersection(self._get_field_name_tuple()):
+            target_value = getattr(new_point, field_name)
+            if isinstance(target_value, Number):
+                reference_value = scalarize(getattr(reference_point, field_name))
+                setattr(new_point, field_name, reference_value + target_value)
+                new_point.set_as_absolute(field_name)
         return new_point
 
     def scalarize(self):
         """
         Convenience method for converting to scalars all fields that have a
         one-item array-like value.
+
+        Conversion is done in place: the original array-like values are not modified.
         """
-        self_as_dict = asdict(self)
-        for field_name, value in self_as_dict.items():
-            setattr(self, field_name, scalarize(value))
+        for field_name in self._get_field_name_tuple():
+            value = getattr(self, field_name)
+            if type(value) not in _SCALAR_TYPES:
+                setattr(self, field_name, scalarize(value))
 
     @classmethod
     def get_field_names(cls):
         """
         :return: names of all fields of the flight point.
         """
-        return [cls_field.name for cls_field in fields(cls) if not cls_field.name.startswith("_")]
+        return list(cls._get_field_name_tuple())
 
     @classmethod
     def get_units(cls) -> dict:
@@ -380,6 +398,21 @@ class FlightPoint:
 
         return cls.__field_descriptors
 
+    @classmethod
+    def _get_field_name_tuple(cls) -> Tuple[str, ...]:
+        """
+        Uses this method instead of accessing cls.__field_names to ensure it
+        will always be correctly populated.
+        """
+        field_names = cls.__field_names.get(cls)
+        if field_names is None:
+            field_names = tuple(
+                cls_field.name for cls_field in fields(cls) if not cls_field.name.startswith("_")
+            )
+            cls.__field_names[cls] = field_names
+
+        return field_names
+
     @classmethod
     def _get_field_descriptor(cls, field_name) -> _FieldDescriptor:
         """
@@ -402,3 +435,147 @@ class FlightPoint:
             )
 
         cls.__field_descriptors = {}  # Will need to rebuild this dict on next usage.
+        cls.__field_names.clear()  # Same for field names, for all classes.
+
+
+class FlightPointBatch:
+    """
+    Struct-of-arrays storage of several flight points.
+
+    Each field of :class:`FlightPoint` is an attribute of the batch, whose value is None or a
+    NumPy array with one element per flight point (a scalar value is considered as shared by
+    all flight points). A FlightPointBatch instance can therefore be used where a FlightPoint
+    instance with array values is expected, which allows vectorized computations::
+
+        >>> batch = FlightPointBatch(altitude=[0.0, 1000.0], mach=0.3)
+        >>> batch.altitude
+        array([   0., 1000.])
+        >>> len(batch)
+        2
+
+    Flight points can be converted from and to FlightPoint instances::
+
+        >>> batch = FlightPointBatch.from_flight_points([fp1, fp2])
+        >>> fp2bis = batch[1]
+        >>> flight_points = batch.to_flight_points()
+
+    It is the container used by
+    :meth:`~fastoad.model_base.propulsion.IPropulsion.compute_flight_points_batch`.
+    """
+
+    def __init__(self, **field_values):
+        """
+        :param field_values: values for FlightPoint fields, as array-likes or scalars
+        :raise TypeError: if an argument is not a FlightPoint field
+        """
+        field_names = FlightPoint.get_field_names()
+        for name in field_names:
+            setattr(self, name, None)
+
+        for name, value in field_values.items():
+            if name not in field_names:
+                raise TypeError(f'"{name}" is not a field of FlightPoint.')
+            if value is not None:
+                setattr(self, name, np.asarray(value))
+
+    @classmethod
+    def from_flight_points(cls, flight_points: Sequence[FlightPoint]) -> "FlightPointBatch":
+        """
+        Creates a batch from provided flight points.
+
+        A field is left to None if it is None for all flight points.
+
+        :param flight_points:
+        :return: the created FlightPointBatch instance
+        """
+        batch = cls()
+        batch.update_from_flight_points(flight_points)
+        return batch
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Common shape of the arrays of the batch. It is (0,) if no field is defined."""
+        shapes = [
+            np.shape(value) for value in self._get_field_values().values() if value is not None
+        ]
+        if not shapes:
+            return (0,)
+        return np.broadcast_shapes(*shapes)
+
+    def scalarize(self):
+        """
+        Does nothing, as values of a batch are meant to be arrays.
+
+        Provided so that a batch can be processed like a FlightPoint instance.
+        """
+
+    def to_flight_points(self) -> List[FlightPoint]:
+        """
+        Fields that are not defined in the batch get their default value.
+
+        :return: a list of FlightPoint instances with scalar values, one per flight point
+        """
+        flat_values = self._get_flat_values()
+        return [self._get_flight_point(flat_values, i) for i in range(len(self))]
+
+    def update_from_flight_points(self, flight_points: Sequence[FlightPoint]):
+        """
+        Sets all fields of the batch from provided flight points.
+
+        If the batch is not empty, flight points are expected to be as many as those in the
+        batch, and the shape of the batch is kept.
+
+        If a numerical field is None for some flight points only, NaN is used for these
+        flight points.
+
+        :param flight_points:
+        """
+        shape = self.shape if len(self) == len(flight_points) else (len(flight_points),)
+        for name in FlightPoint.get_field_names():
+            values = [scalarize(getattr(flight_point, name)) for flight_point in flight_points]
+            defined_values = [value for value in values if value is not None]
+            if not defined_values:
+                setattr(self, name, None)
+            elif len(defined_values) < len(values) and all(
+                isinstance(value, Number) and not isinstance(value, bool)
+                for value in defined_values
+            ):
+                values = [np.nan if value is None else value for value in values]
+                setattr(self, name, np.array(values, dtype=float).reshape(shape))
+            else:
+                setattr(self, name, np.array(values).reshape(shape))
+
+    def _get_field_values(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in FlightPoint.get_field_names()}
+
+    def _get_flat_values(self) -> Dict[str, Optional[np.ndarray]]:
+        """Field values, broadcast to the shape of the batch and flattened."""
+        shape = self.shape
+        return {
+            name: None if value is None else np.broadcast_to(value, shape).ravel()
+            for name, value in self._get_field_values().items()
+        }
+
+    @staticmethod
+    def _get_flight_point(flat_values: Dict[str, Optional[np.ndarray]], index: int) -> FlightPoint:
+        # Undefined fields are not provided, so they get their default value.
+        # NaN values stand for values that were None in the original flight point.
+        field_values = {
+            name: scalarize(values[index])
+            for name, values in flat_values.items()
+            if values is not None
+        }
+        return FlightPoint(
+            **{
+                name: None if isinstance(value, float) and np.isnan(value) else value
+                for name, value in field_values.items()
+            }
+        )
+
+    def __len__(self):
+        return int(np.prod(self.shape))
+
+    def __getitem__(self, index: int) -> FlightPoint:
+        if not -len(self) <= index < len(self):
+            raise IndexError("FlightPointBatch index out of range")
+        return self._get_flight_point(self._get_flat_values(), index)
@@ -22,7 +22,7 @@ import pandas as pd
 from openmdao import api as om
 from openmdao.core.component import Component
 
-from fastoad.model_base import FlightPoint
+from fastoad.model_base import FlightPoint, FlightPointBatch
 
 
 class IPropulsion(ABC):
@@ -39,6 +39,10 @@ class IPropulsion(ABC):
     The performance model will then be able to call :meth:`get_consumed_mass` to
     know the mass consumption for each flight point.
 
+    When several flight points are available at once, the performance model can call
+    :meth:`compute_flight_points_batch`, which relies on :meth:`compute_flight_points`
+    by default, and can be overloaded by models that cannot process array values.
+
     Note::
 
         If the propulsion model needs fields that are not among defined fields
@@ -82,6 +86,35 @@ class IPropulsion(ABC):
         :return: None (inputs are updated in-place)
         """
 
+    def compute_flight_points_batch(self, flight_points: FlightPointBatch):
+        """
+        Computes propulsion data for a batch of flight points.
+
+        Default implementation calls :meth:`compute_flight_points` once with the whole batch,
+        that behaves like a FlightPoint instance with array values. A propulsion model that
+        can process only scalar values should overload this method as follows::
+
+            def compute_flight_points_batch(self, flight_points: FlightPointBatch):
+                self.compute_flight_points_one_by_one(flight_points)
+
+        :param flight_points: the flight points to compute, updated in place
+        :return: None (inputs are updated in-place)
+        """
+        self.compute_flight_points(flight_points)
+
+    def compute_flight_points_one_by_one(self, flight_points: FlightPointBatch):
+        """
+        Computes propulsion data for a batch of flight points, by calling
+        :meth:`compute_flight_points` for each flight point.
+
+        :param flight_points: the flight points to compute, updated in place
+        :return: None (inputs are updated in-place)
+        """
+        points = flight_points.to_flight_points()
+        for flight_point in points:
+            self.compute_flight_points(flight_point)
+        flight_points.update_from_flight_points(points)
+
     @abstractmethod
     def get_consumed_mass(self, flight_point: FlightPoint, time_step: float) -> float:
         """
@@ -137,8 +170,36 @@ class BaseOMPropulsionComponent(om.ExplicitComponent, ABC):
 
     Classes that implements this interface should add their own inputs in setup()
     and implement :meth:`get_wrapper`.
+
+    Each flight point only depends on its own flight conditions, so partials with respect
+    to flight conditions are diagonal. They are computed by finite differences where all
+    flight points are perturbed at once, which needs only one call to
+    :meth:`IPropulsion.compute_flight_points_batch`, whatever the number of flight points.
+    Partials with respect to inputs added by subclasses are computed by usual finite
+    differences.
     """
 
+    #: Relative step for the finite differences with respect to flight conditions.
+    fd_step = 1.0e-6
+
+    # Flight condition inputs with continuous values, i.e. that have non-null partials.
+    _flight_condition_input_names = [
+        "data:propulsion:mach",
+        "data:propulsion:altitude",
+        "data:propulsion:required_thrust_rate",
+        "data:propulsion:required_thrust",
+    ]
+    # All inputs that define flight points. Engine setting and thrust mode are discrete values.
+    _flight_point_input_names = _flight_condition_input_names + [
+        "data:propulsion:engine_setting",
+        "data:propulsion:use_thrust_rate",
+    ]
+    _output_names = [
+        "data:propulsion:SFC",
+        "data:propulsion:thrust_rate",
+        "data:propulsion:thrust",
+    ]
+
     def setup(self):
         self.add_input("data:propulsion:mach", np.nan, shape_by_conn=True)
         self.add_input("data:propulsion:altitude", np.nan, shape_by_conn=True, units="m")
@@ -158,11 +219,67 @@ class BaseOMPropulsionComponent(om.ExplicitComponent, ABC):
         )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="fd")
+        diagonal = np.arange(self._get_var_meta("data:propulsion:mach", "size"))
+        self.declare_partials(
+            self._output_names, self._flight_condition_input_names, rows=diagonal, cols=diagonal
+        )
+
+        other_input_names = [
+            name
+            for name in self.get_io_metadata(iotypes="input", metadata_keys=[])
+            if name not in self._flight_point_input_names
+        ]
+        if other_input_names:
+            self.declare_partials(self._output_names, other_input_names, method="fd")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         wrapper = self.get_wrapper().get_model(inputs)
-        flight_point = FlightPoint(
+        flight_points = self._get_flight_points(inputs)
+        wrapper.compute_flight_points_batch(flight_points)
+        outputs["data:propulsion:SFC"] = flight_points.sfc
+        outputs["data:propulsion:thrust_rate"] = flight_points.thrust_rate
+        outputs["data:propulsion:thrust"] = flight_points.thrust
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        wrapper = self.get_wrapper().get_model(inputs)
+
+        # One batch contains the unperturbed flight points, followed by the flight points where
+        # each flight condition is perturbed in turn.
+        input_values = {
+            name: np.asarray(inputs[name]).ravel() for name in self._flight_point_input_names
+        }
+        steps = {
+            name: self.fd_step * np.maximum(np.abs(input_values[name]), 1.0)
+            for name in self._flight_condition_input_names
+        }
+        perturbation_count = len(self._flight_condition_input_names) + 1
+        batch_inputs = {
+            name: np.tile(values, perturbation_count) for name, values in input_values.items()
+        }
+        size = len(input_values["data:propulsion:mach"])
+        for i, name in enumerate(self._flight_condition_input_names, start=1):
+            batch_inputs[name][i * size : (i + 1) * size] += steps[name]
+
+        flight_points = self._get_flight_points(batch_inputs)
+        wrapper.compute_flight_points_batch(flight_points)
+
+        output_values = {
+            "data:propulsion:SFC": flight_points.sfc,
+            "data:propulsion:thrust_rate": flight_points.thrust_rate,
+            "data:propulsion:thrust": flight_points.thrust,
+        }
+        for output_name, values in output_values.items():
+            values = np.reshape(values, (perturbation_count, size))
+            for i, input_name in enumerate(self._flight_condition_input_names, start=1):
+                partials[output_name, input_name] = (values[i] - values[0]) / steps[input_name]
+
+    @staticmethod
+    def _get_flight_points(inputs) -> FlightPointBatch:
+        """
+        :param inputs: values of flight condition inputs
+        :return: the flight points that match provided inputs
+        """
+        return FlightPointBatch(
             mach=inputs["data:propulsion:mach"],
             altitude=inputs["data:propulsion:altitude"],
             engine_setting=inputs["data:propulsion:engine_setting"],
@@ -172,10 +289,6 @@ class BaseOMPropulsionComponent(om.ExplicitComponent, ABC):
             thrust_rate=inputs["data:propulsion:required_thrust_rate"],
             thrust=inputs["data:propulsion:required_thrust"],
         )
-        wrapper.compute_flight_points(flight_point)
-        outputs["data:propulsion:SFC"] = flight_point.sfc
-        outputs["data:propulsion:thrust_rate"] = flight_point.thrust_rate
-        outputs["data:propulsion:thrust"] = flight_point.thrust
 
     @staticmethod
     @abstractmethod
@@ -219,3 +332,10 @@ class FuelEngineSet(AbstractFuelPropulsion):
 
         self.engine.compute_flight_points(flight_points)
         flight_points.thrust = flight_points.thrust * self.engine_count
+
+    def compute_flight_points_batch(self, flight_points: FlightPointBatch):
+        if flight_points.thrust is not None:
+            flight_points.thrust = flight_points.thrust / self.engine_count
+
+        self.engine.compute_flight_points_batch(flight_points)
+        flight_points.thrust = flight_points.thrust * self.engine_count
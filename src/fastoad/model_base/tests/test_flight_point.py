@@ -11,12 +11,14 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from copy import copy
+
 import numpy as np
 import pandas as pd
 import pytest
 from numpy.testing import assert_allclose
 
-from ..flight_point import FlightPoint
+from ..flight_point import FlightPoint, FlightPointBatch
 
 
 def test_add_remove_field():
@@ -109,3 +111,78 @@ def test_descriptors():
 
     assert FlightPoint.get_unit("altitude") == "m"
     assert FlightPoint.get_unit("engine_setting") is None
+
+
+def test_copy_and_make_absolute():
+    fp = FlightPoint(time=10.0, ground_distance=np.array([100.0]), mass=70000.0, altitude=1000.0)
+    fp.set_as_relative("altitude")
+
+    fp_copy = copy(fp)
+    assert fp_copy == fp
+    assert fp_copy.is_relative("altitude")
+
+    # Set of relative fields is not shared
+    fp_copy.set_as_absolute("altitude")
+    assert fp.is_relative("altitude")
+
+    # Original array is not modified by scalarization of the copy
+    fp_copy.scalarize()
+    assert isinstance(fp_copy.ground_distance, float)
+    assert isinstance(fp.ground_distance, np.ndarray)
+
+    reference = FlightPoint(time=5.0, ground_distance=50.0, mass=60000.0, altitude=500.0)
+    absolute_fp = fp.make_absolute(reference)
+    assert absolute_fp.time == 15.0
+    assert absolute_fp.ground_distance == 150.0
+    assert absolute_fp.altitude == 1500.0
+    assert absolute_fp.mass == 70000.0
+    assert not any(
+        absolute_fp.is_relative(name) for name in ["time", "ground_distance", "altitude"]
+    )
+
+    # Original point is unchanged
+    assert fp.time == 10.0
+    assert fp.altitude == 1000.0
+    assert fp.is_relative("altitude")
+
+
+def test_flight_point_batch():
+    batch = FlightPointBatch(altitude=[0.0, 1000.0, 2000.0], mach=0.3, name=None)
+    assert len(batch) == 3
+    assert batch.shape == (3,)
+    assert_allclose(batch.altitude, [0.0, 1000.0, 2000.0])
+    assert batch.mach == 0.3
+    assert batch.mass is None
+
+    with pytest.raises(TypeError):
+        FlightPointBatch(foo=42.0)
+
+    # Row access provides scalar values
+    flight_point = batch[-1]
+    assert flight_point == FlightPoint(altitude=2000.0, mach=0.3, time=0.0)
+    assert isinstance(flight_point.altitude, float)
+    with pytest.raises(IndexError):
+        _ = batch[3]
+
+    flight_points = [
+        FlightPoint(time=100.0, mass=70000.0, name="foo"),
+        FlightPoint(time=200.0, mass=69000.0, name="bar", thrust_rate=0.8),
+    ]
+    batch = FlightPointBatch.from_flight_points(flight_points)
+    assert len(batch) == 2
+    assert_allclose(batch.time, [100.0, 200.0])
+    assert_allclose(batch.mass, [70000.0, 69000.0])
+    assert list(batch.name) == ["foo", "bar"]
+    assert batch.sfc is None
+    assert_allclose(batch.thrust_rate, [np.nan, 0.8])
+    assert batch.to_flight_points() == flight_points
+
+    # Updating keeps the shape of the batch
+    batch = FlightPointBatch(mass=np.array([[70000.0], [69000.0]]))
+    flight_points = batch.to_flight_points()
+    for flight_point in flight_points:
+        flight_point.sfc = flight_point.mass * 1.0e-9
+    batch.update_from_flight_points(flight_points)
+    assert_allclose(batch.sfc, [[7.0e-5], [6.9e-5]])
+
+    assert len(FlightPointBatch()) == 0
@@ -0,0 +1,185 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import patch
+
+import numpy as np
+import openmdao.api as om
+import pytest
+from numpy.testing import assert_allclose
+
+from ..flight_point import FlightPoint, FlightPointBatch
+from ..propulsion import (
+    AbstractFuelPropulsion,
+    BaseOMPropulsionComponent,
+    FuelEngineSet,
+    IOMPropulsionWrapper,
+    IPropulsion,
+)
+
+
+class ScalarEngine(AbstractFuelPropulsion):
+    """Engine model that accepts only scalar values."""
+
+    def __init__(self, max_thrust, max_sfc):
+        self.max_thrust = max_thrust
+        self.max_sfc = max_sfc
+        self.call_count = 0
+
+    def compute_flight_points(self, flight_point: FlightPoint):
+        assert np.ndim(flight_point.thrust_rate) == 0
+        self.call_count += 1
+        if flight_point.thrust_is_regulated:
+            flight_point.thrust_rate = flight_point.thrust / self.max_thrust
+        else:
+            flight_point.thrust = self.max_thrust * flight_point.thrust_rate
+
+        flight_point.sfc = self.max_sfc * (1.0 + flight_point.thrust_rate) / 2.0
+
+    def compute_flight_points_batch(self, flight_points: FlightPointBatch):
+        self.compute_flight_points_one_by_one(flight_points)
+
+
+class VectorizedEngine(AbstractFuelPropulsion):
+    """Same as ScalarEngine, but processes array values, so batches are processed at once."""
+
+    def __init__(self, max_thrust, max_sfc):
+        self.max_thrust = max_thrust
+        self.max_sfc = max_sfc
+        self.call_count = 0
+
+    def compute_flight_points(self, flight_points: FlightPoint):
+        self.call_count += 1
+        thrust_is_regulated = flight_points.thrust_is_regulated
+        flight_points.thrust_rate = np.where(
+            thrust_is_regulated, flight_points.thrust / self.max_thrust, flight_points.thrust_rate
+        )
+        flight_points.thrust = self.max_thrust * flight_points.thrust_rate
+        flight_points.sfc = self.max_sfc * (1.0 + flight_points.thrust_rate) / 2.0
+
+
+def _get_batch():
+    return FlightPointBatch(
+        mach=[0.3, 0.5, 0.8],
+        altitude=[0.0, 5000.0, 10000.0],
+        thrust_is_regulated=[False, True, True],
+        thrust_rate=[0.9, 0.0, 0.0],
+        thrust=[0.0, 1.0e5, 5.0e4],
+    )
+
+
+def test_compute_flight_points_batch():
+    scalar_engine = ScalarEngine(1.0e5, 2.0e-5)
+    scalar_batch = _get_batch()
+    FuelEngineSet(scalar_engine, 2).compute_flight_points_batch(scalar_batch)
+    assert scalar_engine.call_count == 3
+
+    vectorized_engine = VectorizedEngine(1.0e5, 2.0e-5)
+    vectorized_batch = _get_batch()
+    FuelEngineSet(vectorized_engine, 2).compute_flight_points_batch(vectorized_batch)
+    assert vectorized_engine.call_count == 1
+
+    for batch in [scalar_batch, vectorized_batch]:
+        assert_allclose(batch.thrust_rate, [0.9, 0.5, 0.25])
+        assert_allclose(batch.thrust, [1.8e5, 1.0e5, 5.0e4])
+        assert_allclose(batch.sfc, [1.9e-5, 1.5e-5, 1.25e-5])
+
+
+class EngineWrapper(IOMPropulsionWrapper):
+    engine_class = ScalarEngine
+
+    def setup(self, component):
+        component.add_input("data:propulsion:max_thrust", 1.0e5, units="N")
+
+    @classmethod
+    def get_model(cls, inputs) -> IPropulsion:
+        return FuelEngineSet(cls.engine_class(inputs["data:propulsion:max_thrust"], 2.0e-5), 2)
+
+
+class EngineComponent(BaseOMPropulsionComponent):
+    def setup(self):
+        super().setup()
+        self.get_wrapper().setup(self)
+
+    @staticmethod
+    def get_wrapper() -> IOMPropulsionWrapper:
+        return EngineWrapper()
+
+
+@pytest.mark.parametrize("engine_class", [ScalarEngine, VectorizedEngine])
+def test_om_propulsion_component(engine_class, monkeypatch):
+    monkeypatch.setattr(EngineWrapper, "engine_class", engine_class)
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("data:propulsion:mach", [0.3, 0.5, 0.8])
+    ivc.add_output("data:propulsion:altitude", [0.0, 5000.0, 10000.0], units="m")
+    ivc.add_output("data:propulsion:engine_setting", [1.0, 2.0, 3.0])
+    ivc.add_output("data:propulsion:use_thrust_rate", [1.0, 0.0, 0.0])
+    ivc.add_output("data:propulsion:required_thrust_rate", [0.9, 0.0, 0.0])
+    ivc.add_output("data:propulsion:required_thrust", [0.0, 1.0e5, 5.0e4], units="N")
+
+    problem = om.Problem()
+    problem.model.add_subsystem("inputs", ivc, promotes=["*"])
+    problem.model.add_subsystem("propulsion", EngineComponent(), promotes=["*"])
+    problem.setup()
+    problem.run_model()
+
+    assert_allclose(problem["data:propulsion:thrust_rate"], [0.9, 0.5, 0.25])
+    assert_allclose(problem.get_val("data:propulsion:thrust", units="N"), [1.8e5, 1.0e5, 5.0e4])
+    assert_allclose(
+        problem.get_val("data:propulsion:SFC", units="kg/N/s"), [1.9e-5, 1.5e-5, 1.25e-5]
+    )
+
+    # Partials with respect to flight conditions are obtained with one call to propulsion
+    # model, where all flight points are perturbed at once. Partials with respect to max thrust
+    # are obtained by usual finite differences (one more call).
+    with patch.object(
+        FuelEngineSet,
+        "compute_flight_points_batch",
+        autospec=True,
+        side_effect=FuelEngineSet.compute_flight_points_batch,
+    ) as compute_flight_points_batch:
+        totals = problem.compute_totals(
+            ["data:propulsion:thrust_rate", "data:propulsion:thrust", "data:propulsion:SFC"],
+            [
+                "data:propulsion:required_thrust_rate",
+                "data:propulsion:required_thrust",
+                "data:propulsion:mach",
+                "data:propulsion:max_thrust",
+            ],
+        )
+    assert compute_flight_points_batch.call_count == 2
+    assert sorted(len(call.args[1]) for call in compute_flight_points_batch.call_args_list) == [
+        3,
+        15,
+    ]
+
+    def check(output_name, input_name, expected_values, rtol=1.0e-5):
+        assert_allclose(totals[output_name, input_name], expected_values, rtol=rtol, atol=1e-15)
+
+    check("data:propulsion:thrust_rate", "data:propulsion:required_thrust_rate", np.diag([1, 0, 0]))
+    check("data:propulsion:thrust", "data:propulsion:required_thrust_rate", np.diag([2e5, 0, 0]))
+    check("data:propulsion:SFC", "data:propulsion:required_thrust_rate", np.diag([1e-5, 0, 0]))
+    check(
+        "data:propulsion:thrust_rate", "data:propulsion:required_thrust", np.diag([0, 5e-6, 5e-6])
+    )
+    check("data:propulsion:thrust", "data:propulsion:required_thrust", np.diag([0, 1, 1]))
+    check("data:propulsion:SFC", "data:propulsion:required_thrust", np.diag([0, 5e-11, 5e-11]))
+    check("data:propulsion:thrust", "data:propulsion:mach", np.zeros((3, 3)))
+    check(
+        "data:propulsion:thrust_rate",
+        "data:propulsion:max_thrust",
+        [[0], [-5e-6], [-2.5e-6]],
+        rtol=1.0e-4,
+    )
+    check("data:propulsion:thrust", "data:propulsion:max_thrust", [[1.8], [0], [0]])
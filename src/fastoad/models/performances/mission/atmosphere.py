@@ -0,0 +1,390 @@
+"""Atmosphere service for mission computation."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+from stdatm import AtmosphereSI
+from stdatm.speed_parameters import SEA_LEVEL_DENSITY
+from stdatm.state_parameters import (
+    AIR_GAS_CONSTANT,
+    SEA_LEVEL_PRESSURE,
+    SEA_LEVEL_TEMPERATURE,
+    TROPOPAUSE,
+    compute_density,
+    compute_pressure,
+    compute_speed_of_sound,
+    compute_temperature,
+)
+
+_STRATOSPHERE_TEMPERATURE = compute_temperature(TROPOPAUSE, 0.0)
+_TEMPERATURE_GRADIENT = (SEA_LEVEL_TEMPERATURE - _STRATOSPHERE_TEMPERATURE) / TROPOPAUSE
+
+# In troposphere, ISA pressure is close to SEA_LEVEL_PRESSURE * (T / SEA_LEVEL_TEMPERATURE) ** N.
+# This exponent provides initial guesses that are refined using compute_pressure().
+_TROPOSPHERE_PRESSURE_EXPONENT = np.log(
+    compute_pressure(0.5 * TROPOPAUSE) / SEA_LEVEL_PRESSURE
+) / np.log(compute_temperature(0.5 * TROPOPAUSE, 0.0) / SEA_LEVEL_TEMPERATURE)
+
+# In stratosphere, pressure decreases exponentially from its value at tropopause.
+_TROPOPAUSE_PRESSURE = compute_pressure(TROPOPAUSE)
+_STRATOSPHERE_PRESSURE_DECAY = (
+    np.log(_TROPOPAUSE_PRESSURE / compute_pressure(2.0 * TROPOPAUSE)) / TROPOPAUSE
+)
+
+# Highest altitude where the troposphere model applies.
+_TROPOSPHERE_TOP = np.nextafter(TROPOPAUSE, 0.0)
+
+
+class AtmosphereState(NamedTuple):
+    """Atmosphere properties at one altitude."""
+
+    #: Temperature in K.
+    temperature: float
+
+    #: Pressure in Pa.
+    pressure: float
+
+    #: Density in kg/m**3.
+    density: float
+
+    #: Speed of sound in m/s.
+    speed_of_sound: float
+
+
+@dataclass
+class AtmosphereProvider:
+    """
+    Provides atmosphere data to flight segments.
+
+    One instance is expected to be shared by all segments of a mission, so that
+    atmosphere data computed by a segment can be reused by the other ones.
+
+    Computed atmosphere states are kept in a cache that stores the
+    :attr:`cache_size` most recently used (altitude, isa_offset) couples.
+
+    If :attr:`tabulated` is False (default), atmosphere states are computed exactly
+    with :class:`stdatm.AtmosphereSI`. Otherwise, they are interpolated in tables
+    computed once for each ISA temperature offset.
+
+    Usage::
+
+        >>> atmosphere = AtmosphereProvider()
+        >>> density = atmosphere.get_state(10000.0, isa_offset=15.0).density
+        >>> true_airspeed, equivalent_airspeed, mach = atmosphere.compute_speeds(
+        ...     10000.0, isa_offset=15.0, mach=0.78
+        ... )
+    """
+
+    #: If True, atmosphere states are interpolated in precomputed tables.
+    tabulated: bool = False
+
+    #: Altitude step, in meters, between two points of atmosphere tables.
+    table_altitude_step: float = 10.0
+
+    #: Altitude range, in meters, of atmosphere tables. Out of this range, atmosphere
+    #: states are computed exactly.
+    table_altitude_bounds: Tuple[float, float] = (-1000.0, 25000.0)
+
+    #: Maximum number of atmosphere states that are kept in memory.
+    cache_size: int = 256
+
+    _cache: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+    _tables: Dict[float, Tuple[np.ndarray, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def get_state(
+        self, altitude: Union[float, np.ndarray], isa_offset: float = 0.0
+    ) -> AtmosphereState:
+        """
+        If an array of altitudes is provided, properties of the returned state are arrays.
+        Such states are not kept in cache.
+
+        :param altitude: in meters
+        :param isa_offset: temperature offset for ISA atmosphere model, in K
+        :return: atmosphere properties at provided altitude
+        """
+        if np.ndim(altitude) > 0:
+            return self._compute_states(np.asarray(altitude, dtype=float), float(isa_offset))
+
+        key = (float(altitude), float(isa_offset))
+        state = self._cache.get(key)
+        if state is None:
+            state = self._compute_state(*key)
+            self._cache[key] = state
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        return state
+
+    def get_atmosphere_point(self, altitude: float, isa_offset: float = 0.0) -> AtmosphereSI:
+        """
+        Provides an atmosphere point for computations that are not covered by
+        :meth:`get_state` and :meth:`compute_speeds`.
+
+        Properties of the returned instance are computed by stdatm, so they are not
+        interpolated, even if :attr:`tabulated` is True.
+
+        :param altitude: in meters
+        :param isa_offset: temperature offset for ISA atmosphere model, in K
+        :return: AtmosphereSI instance for provided altitude
+        """
+        return AtmosphereSI(altitude, isa_offset)
+
+    def compute_speeds(
+        self,
+        altitude: float,
+        isa_offset: float = 0.0,
+        *,
+        true_airspeed: Optional[float] = None,
+        equivalent_airspeed: Optional[float] = None,
+        mach: Optional[float] = None,
+    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Computes consistent values of true airspeed, equivalent airspeed and Mach number.
+
+        The first defined speed, in the order true_airspeed, mach, equivalent_airspeed, is
+        used as reference. Other provided speed values are ignored.
+
+        :param altitude: in meters
+        :param isa_offset: temperature offset for ISA atmosphere model, in K
+        :param true_airspeed: in m/s
+        :param equivalent_airspeed: in m/s
+        :param mach:
+        :return: true airspeed, equivalent airspeed and Mach number, or Nones if no speed
+                 has been provided.
+        """
+        state = self.get_state(altitude, isa_offset)
+        if true_airspeed is not None:
+            mach = true_airspeed / state.speed_of_sound
+            equivalent_airspeed = true_airspeed * np.sqrt(state.density / SEA_LEVEL_DENSITY)
+        elif mach is not None:
+            true_airspeed = mach * state.speed_of_sound
+            equivalent_airspeed = true_airspeed * np.sqrt(state.density / SEA_LEVEL_DENSITY)
+        elif equivalent_airspeed is not None:
+            true_airspeed = equivalent_airspeed * np.sqrt(SEA_LEVEL_DENSITY / state.density)
+            mach = true_airspeed / state.speed_of_sound
+        else:
+            return None, None, None
+
+        return true_airspeed, equivalent_airspeed, mach
+
+    @staticmethod
+    def get_altitude_from_pressure(pressure: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Computes altitude where ISA atmosphere has provided pressure.
+
+        Computation is analytical in stratosphere. In troposphere, an analytical approximation
+        is refined with a few Newton iterations. Pressure does not depend on ISA temperature
+        offset.
+
+        :param pressure: in Pa
+        :return: altitude in meters
+        """
+        pressure = np.asarray(pressure, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stratosphere_altitude = (
+                TROPOPAUSE - np.log(pressure / _TROPOPAUSE_PRESSURE) / _STRATOSPHERE_PRESSURE_DECAY
+            )
+            troposphere_altitude = _solve_troposphere_altitude(
+                (pressure / SEA_LEVEL_PRESSURE) ** (1.0 / _TROPOSPHERE_PRESSURE_EXPONENT),
+                np.log(pressure),
+            )
+
+        return _merge_atmosphere_layers(troposphere_altitude, stratosphere_altitude)
+
+    @staticmethod
+    def get_altitude_from_temperature(
+        temperature: Union[float, np.ndarray], isa_offset: float = 0.0
+    ) -> Union[float, np.ndarray]:
+        """
+        Computes altitude where ISA atmosphere has provided temperature.
+
+        As temperature is constant in stratosphere, computed altitude is in troposphere (or
+        at tropopause).
+
+        :param temperature: in K
+        :param isa_offset: temperature offset for ISA atmosphere model, in K
+        :return: altitude in meters
+        """
+        temperature = np.asarray(temperature, dtype=float)
+        altitude = np.minimum(
+            (SEA_LEVEL_TEMPERATURE + isa_offset - temperature) / _TEMPERATURE_GRADIENT,
+            TROPOPAUSE,
+        )
+        return altitude if altitude.ndim else altitude.item()
+
+    @classmethod
+    def get_altitude_from_density(
+        cls, density: Union[float, np.ndarray], isa_offset: float = 0.0
+    ) -> Union[float, np.ndarray]:
+        """
+        Computes altitude where ISA atmosphere has provided density.
+
+        Computation is analytical in stratosphere. In troposphere, an analytical approximation
+        is refined with a few Newton iterations.
+
+        :param density: in kg/m**3
+        :param isa_offset: temperature offset for ISA atmosphere model, in K
+        :return: altitude in meters
+        """
+        density = np.asarray(density, dtype=float)
+
+        stratosphere_altitude = cls.get_altitude_from_pressure(
+            density * AIR_GAS_CONSTANT * (_STRATOSPHERE_TEMPERATURE + isa_offset)
+        )
+
+        # Without temperature offset, density is close to
+        # SEA_LEVEL_DENSITY * (T / SEA_LEVEL_TEMPERATURE) ** (N - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            troposphere_altitude = _solve_troposphere_altitude(
+                (density * AIR_GAS_CONSTANT * SEA_LEVEL_TEMPERATURE / SEA_LEVEL_PRESSURE)
+                ** (1.0 / (_TROPOSPHERE_PRESSURE_EXPONENT - 1.0)),
+                np.log(density * AIR_GAS_CONSTANT),
+                isa_offset,
+            )
+
+        return _merge_atmosphere_layers(troposphere_altitude, stratosphere_altitude)
+
+    def clear_cache(self):
+        """Removes all stored atmosphere states and tables."""
+        self._cache.clear()
+        self._tables.clear()
+
+    def _compute_state(self, altitude: float, isa_offset: float) -> AtmosphereState:
+        if self.tabulated:
+            lower_bound, upper_bound = self.table_altitude_bounds
+            if lower_bound <= altitude <= upper_bound:
+                return self._interpolate_state(altitude, isa_offset)
+
+        atm = AtmosphereSI(altitude, isa_offset)
+        return AtmosphereState(atm.temperature, atm.pressure, atm.density, atm.speed_of_sound)
+
+    def _compute_states(self, altitudes: np.ndarray, isa_offset: float) -> AtmosphereState:
+        """Array version of :meth:`_compute_state`."""
+        atm = AtmosphereSI(altitudes, isa_offset)
+        if not self.tabulated:
+            return AtmosphereState(atm.temperature, atm.pressure, atm.density, atm.speed_of_sound)
+
+        lower_bound, upper_bound = self.table_altitude_bounds
+        in_table = (lower_bound <= altitudes) & (altitudes <= upper_bound)
+        table_altitudes, temperatures, log_pressures = self._get_table(isa_offset)
+        temperature = np.where(
+            in_table, np.interp(altitudes, table_altitudes, temperatures), atm.temperature
+        )
+        pressure = np.where(
+            in_table, np.exp(np.interp(altitudes, table_altitudes, log_pressures)), atm.pressure
+        )
+        return AtmosphereState(
+            temperature,
+            pressure,
+            compute_density(pressure, temperature),
+            compute_speed_of_sound(temperature),
+        )
+
+    def _interpolate_state(self, altitude: float, isa_offset: float) -> AtmosphereState:
+        """
+        Temperature is linearly interpolated, which is exact as tropopause is a point of
+        the table. Pressure is interpolated as a logarithm.
+
+        As the atmosphere model is slightly discontinuous at tropopause, the table has also
+        a point just below tropopause, so that this discontinuity is not spread over a whole
+        altitude step.
+        """
+        altitudes, temperatures, log_pressures = self._get_table(isa_offset)
+        temperature = float(np.interp(altitude, altitudes, temperatures))
+        pressure = float(np.exp(np.interp(altitude, altitudes, log_pressures)))
+        return AtmosphereState(
+            temperature,
+            pressure,
+            compute_density(pressure, temperature),
+            compute_speed_of_sound(temperature),
+        )
+
+    def _get_table(self, isa_offset: float) -> Tuple[np.ndarray, ...]:
+        table = self._tables.get(isa_offset)
+        if table is None:
+            lower_bound, upper_bound = self.table_altitude_bounds
+            altitudes = np.union1d(
+                np.arange(
+                    lower_bound, upper_bound + self.table_altitude_step, self.table_altitude_step
+                ),
+                [np.nextafter(TROPOPAUSE, -np.inf), TROPOPAUSE],
+            )
+            atm = AtmosphereSI(altitudes, isa_offset)
+            table = (altitudes, atm.temperature, np.log(atm.pressure))
+            self._tables[isa_offset] = table
+
+        return table
+
+
+def _solve_troposphere_altitude(
+    temperature_ratio: np.ndarray, log_target: np.ndarray, isa_offset: Optional[float] = None
+) -> np.ndarray:
+    """
+    Computes troposphere altitude where ISA pressure, or density if `isa_offset` is provided,
+    matches target, using Newton iterations on compute_pressure().
+
+    :param temperature_ratio: initial guess, as ratio of ISA temperature to sea level one
+    :param log_target: logarithm of target pressure, or of density * AIR_GAS_CONSTANT
+    :param isa_offset: temperature offset for ISA atmosphere model, in K
+    :return: altitude in meters, that is not relevant if above tropopause
+    """
+    altitude = np.atleast_1d(
+        SEA_LEVEL_TEMPERATURE * (1.0 - temperature_ratio) / _TEMPERATURE_GRADIENT
+    )
+    log_target = np.broadcast_to(log_target, altitude.shape)
+    for _ in range(10):
+        # Altitude is kept in troposphere for evaluating pressure.
+        troposphere_altitude = np.minimum(altitude, _TROPOSPHERE_TOP)
+        isa_temperature = SEA_LEVEL_TEMPERATURE - _TEMPERATURE_GRADIENT * troposphere_altitude
+        residual = np.log(compute_pressure(troposphere_altitude)) - log_target
+        derivative = -_TROPOSPHERE_PRESSURE_EXPONENT * _TEMPERATURE_GRADIENT / isa_temperature
+        if isa_offset is not None:
+            residual -= np.log(isa_temperature + isa_offset)
+            derivative += _TEMPERATURE_GRADIENT / (isa_temperature + isa_offset)
+
+        altitude_increment = residual / derivative
+        # Iterations are not needed for points that are going further above tropopause.
+        is_solved = ~(np.abs(altitude_increment) > 1.0e-8) | (
+            (altitude >= TROPOPAUSE) & (altitude_increment < 0.0)
+        )
+        altitude = troposphere_altitude - altitude_increment
+        if np.all(is_solved):
+            break
+
+    return altitude.reshape(np.shape(temperature_ratio))
+
+
+def _merge_atmosphere_layers(
+    troposphere_altitude: np.ndarray, stratosphere_altitude: np.ndarray
+) -> Union[float, np.ndarray]:
+    """
+    Selects altitude values that are consistent with the atmosphere layer they are computed
+    for.
+
+    As the atmosphere model is slightly discontinuous at tropopause, some values may be
+    inconsistent in both layers. Tropopause is then returned.
+    """
+    altitude = np.where(
+        troposphere_altitude < TROPOPAUSE,
+        troposphere_altitude,
+        np.maximum(stratosphere_altitude, TROPOPAUSE),
+    )
+    return altitude if altitude.ndim else altitude.item()
@@ -13,16 +13,18 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.datacls import BaseDataClass
 
+from .ensemble import concat_member_flight_points, split_member_flight_points
 from .exceptions import FastUnknownMissionElementError
+from .trajectory import SequenceTrajectory
 
 
 @dataclass
@@ -46,6 +48,53 @@ class IFlightPart(ABC, BaseDataClass):
                  :class:`~fastoad.model_base.flight_point.FlightPoint`
         """
 
+    def _compute_into(self, start: FlightPoint, trajectory: SequenceTrajectory):
+        """
+        Computes the flight part from provided start point, and appends obtained
+        flight points to provided trajectory.
+
+        This method is used when the flight part is computed inside a
+        :class:`FlightSequence`. Default implementation relies on :meth:`compute_from`.
+
+        :param start: the initial flight point
+        :param trajectory: the trajectory shared by all parts of the flight sequence
+        """
+        flight_points = self.compute_from(start)
+        if flight_points is not None:
+            trajectory.extend_from_dataframe(flight_points)
+
+    def compute_ensemble_from(self, starts: Sequence[FlightPoint]) -> pd.DataFrame:
+        """
+        Computes the flight part from each provided start point. Each computation is a
+        member of the ensemble.
+
+        Default implementation calls :meth:`compute_from` for each member. It is overloaded
+        when members can be computed all at once.
+
+        :param starts: the initial flight point of each member
+        :return: a pandas DataFrame where flight points are grouped by member. The first
+                 column, named after :data:`~.ensemble.MEMBER_COLUMN`, contains the index of
+                 the member in `starts`. Other column names match fields of
+                 :class:`~fastoad.model_base.flight_point.FlightPoint`
+        """
+        return concat_member_flight_points([self.compute_from(start) for start in starts])
+
+    def _compute_ensemble_into(
+        self, starts: Sequence[FlightPoint], trajectories: Sequence[SequenceTrajectory]
+    ):
+        """
+        Ensemble version of :meth:`_compute_into`. Default implementation relies on
+        :meth:`compute_ensemble_from`.
+
+        :param starts: the initial flight point of each member
+        :param trajectories: the trajectory of each member
+        """
+        flight_points = self.compute_ensemble_from(starts)
+        member_flight_points = split_member_flight_points(flight_points, len(starts))
+        for trajectory, flight_points in zip(trajectories, member_flight_points):
+            if flight_points is not None:
+                trajectory.extend_from_dataframe(flight_points)
+
 
 @dataclass
 class FlightSequence(IFlightPart):
@@ -59,28 +108,82 @@ class FlightSequence(IFlightPart):
     consumed_mass_before_input_weight: float = field(default=0.0, init=False)
 
     #: List of flight points for each part of the sequence, obtained after
-    #  running :meth:`compute_from`
+    #  running :meth:`compute_from`. These DataFrames are slices of the DataFrame
+    #  returned by :meth:`compute_from` of the outermost flight sequence.
     part_flight_points: List[pd.DataFrame] = field(default_factory=list, init=False)
 
     _sequence: List[IFlightPart] = field(default_factory=list, init=False)
 
     _target: FlightPoint = None
 
+    # Row indices (start included, stop excluded) of each part in the shared trajectory
+    _part_ranges: List[Tuple[int, int]] = field(default_factory=list, init=False)
+
+    # Start point of each part, with the value of consumed_mass_before_input_weight
+    # before computation of the part
+    _part_starts: List[Tuple[FlightPoint, float]] = field(default_factory=list, init=False)
+
+    # Trajectory obtained by last call to compute_from()
+    _trajectory: Optional[SequenceTrajectory] = field(default=None, init=False)
+
     def compute_from(self, start: FlightPoint) -> pd.DataFrame:
+        trajectory = SequenceTrajectory()
+        self._compute_into(start, trajectory)
+        return self._get_flight_points(trajectory)
+
+    def _get_flight_points(self, trajectory: SequenceTrajectory) -> Optional[pd.DataFrame]:
+        """
+        Builds the DataFrame of computed flight points and sets :attr:`part_flight_points`.
+
+        :param trajectory: the trajectory where the sequence has been computed
+        :return: the flight points of the sequence, or None if no point has been computed
+        """
+        self._trajectory = trajectory
+        if len(trajectory) > 0:
+            flight_points = trajectory.to_dataframe()
+            self._set_part_flight_points(flight_points, trajectory)
+            return flight_points
+
+        self.part_flight_points = []
+        return None
+
+    def _compute_into(self, start: FlightPoint, trajectory: SequenceTrajectory):
         if self._target is not None:
             self._sequence[-1].target = self._target
 
-        self.part_flight_points = []
-        part_start = deepcopy(start)
+        self._part_ranges = []
+        self._part_starts = []
+        part_start = copy(start)
         part_start.scalarize()
 
         self.consumed_mass_before_input_weight = 0.0
-        for part in self._sequence:
+        self._compute_parts(self._sequence, part_start, trajectory)
+
+    def _compute_parts(
+        self, parts: List[IFlightPart], start: FlightPoint, trajectory: SequenceTrajectory
+    ) -> FlightPoint:
+        """
+        Computes provided flight parts in sequence, starting from provided flight point.
+
+        Obtained flight points are appended to `trajectory`, start points and boundaries of
+        parts are appended to :attr:`_part_starts` and :attr:`_part_ranges`, and
+        :attr:`consumed_mass_before_input_weight` is updated accordingly.
+
+        :param parts: the flight parts to compute
+        :param start: the start point of first part, assumed to be scalarized
+        :param trajectory: the trajectory shared by all parts
+        :return: the last computed flight point
+        """
+        part_start = start
+        for part in parts:
             # This check has to be done first because relative target parameters
             # will be made absolute during compute_from()
             part_has_target_mass = not (part.target.mass is None or part.target.is_relative("mass"))
 
-            flight_points = part.compute_from(part_start)
+            self._part_starts.append((copy(part_start), self.consumed_mass_before_input_weight))
+            first_row = len(trajectory)
+            part._compute_into(part_start, trajectory)
+            end_row = len(trajectory)
 
             if isinstance(part, FlightSequence):
                 self.consumed_mass_before_input_weight += part.consumed_mass_before_input_weight
@@ -89,35 +192,112 @@ class FlightSequence(IFlightPart):
             # offset so this target will be reached.
             # (mass consumption of previous parts is assumed independent of aircraft mass)
             if part_has_target_mass:
-                mass_offset = flight_points.iloc[0].mass - part_start.mass
-                for previous_flight_points in self.part_flight_points:
-                    previous_flight_points.mass += mass_offset
-                self.consumed_mass_before_input_weight = flight_points.iloc[-1].consumed_fuel
-
-            if len(self.part_flight_points) > 0 and len(flight_points) > 1:
-                # First point of the segment is omitted, as it is the last of previous segment.
-                #
-                # But sometimes (especially in the case of simplistic segments), the new first
-                # point may contain more information than the previous last one. In such case,
-                # it is interesting to complete the previous last one.
-                last_flight_points = self.part_flight_points[-1]
-                last_index = last_flight_points.index[-1]
-                for name in flight_points.columns:
-                    value = last_flight_points.loc[last_index, name]
-                    if not value:
-                        last_flight_points.loc[last_index, name] = flight_points.loc[0, name]
-
-                self.part_flight_points.append(flight_points.iloc[1:])
+                masses = trajectory.get_column("mass")
+                mass_offset = masses[first_row] - part_start.mass
+                if self._part_ranges:
+                    sequence_start_row = self._part_ranges[0][0]
+                    masses[sequence_start_row:first_row] += mass_offset
+                self.consumed_mass_before_input_weight = trajectory.get_column("consumed_fuel")[
+                    end_row - 1
+                ]
+
+            if len(self._part_ranges) > 0 and end_row - first_row > 1:
+                self._drop_part_first_row(trajectory, first_row)
+                self._part_ranges.append((first_row + 1, end_row))
 
             else:
                 # But it is kept if the computed segment is the first one.
-                self.part_flight_points.append(flight_points)
+                self._part_ranges.append((first_row, end_row))
 
-            part_start = FlightPoint.create(flight_points.iloc[-1])
+            part_start = trajectory[-1]
             part_start.scalarize()
 
-        if self.part_flight_points:
-            return pd.concat(self.part_flight_points).reset_index(drop=True)
+        return part_start
+
+    def compute_ensemble_from(self, starts: Sequence[FlightPoint]) -> pd.DataFrame:
+        """
+        Parts of the sequence are computed one after the other, each one for all members at
+        once (see :meth:`IFlightPart.compute_ensemble_from`).
+
+        Unlike :meth:`compute_from`, it does not set :attr:`part_flight_points`.
+        """
+        if type(self).compute_from is not FlightSequence.compute_from:
+            # The sequence has its own way of being computed.
+            return super().compute_ensemble_from(starts)
+
+        trajectories = [SequenceTrajectory() for _ in starts]
+        self._compute_ensemble_into(starts, trajectories)
+        return concat_member_flight_points(
+            [
+                trajectory.to_dataframe() if len(trajectory) > 0 else None
+                for trajectory in trajectories
+            ]
+        )
+
+    def _compute_ensemble_into(
+        self, starts: Sequence[FlightPoint], trajectories: Sequence[SequenceTrajectory]
+    ):
+        if type(self)._compute_into is not FlightSequence._compute_into or any(
+            not (part.target.mass is None or part.target.is_relative("mass"))
+            for part in self._sequence
+        ):
+            # The sequence has its own way of being computed, or a target mass has to be
+            # reached, which needs an adjustment of masses that is specific to each member.
+            for start, trajectory in zip(starts, trajectories):
+                self._compute_into(start, trajectory)
+            return
+
+        if self._target is not None:
+            self._sequence[-1].target = self._target
+
+        part_starts = [copy(start) for start in starts]
+        for part_start in part_starts:
+            part_start.scalarize()
+
+        for part_index, part in enumerate(self._sequence):
+            first_rows = [len(trajectory) for trajectory in trajectories]
+            part._compute_ensemble_into(part_starts, trajectories)
+
+            for member, (trajectory, first_row) in enumerate(zip(trajectories, first_rows)):
+                if part_index > 0 and len(trajectory) - first_row > 1:
+                    self._drop_part_first_row(trajectory, first_row)
+                if len(trajectory) > 0:
+                    part_starts[member] = trajectory[-1]
+                    part_starts[member].scalarize()
+
+    @staticmethod
+    def _drop_part_first_row(trajectory: SequenceTrajectory, first_row: int):
+        """
+        Marks the first point of a part as dropped, as it is the last point of previous part.
+
+        :param trajectory: the trajectory where the part has been computed
+        :param first_row: the index of the first point of the part
+        """
+        # Sometimes (especially in the case of simplistic segments), the first point of the
+        # part may contain more information than the previous last one. In such case,
+        # it is interesting to complete the previous last one.
+        for name in trajectory.field_names:
+            column = trajectory.get_column(name)
+            if not column[first_row - 1] or pd.isna(column[first_row - 1]):
+                column[first_row - 1] = column[first_row]
+
+        trajectory.drop_row(first_row)
+
+    def _set_part_flight_points(self, flight_points: pd.DataFrame, trajectory: SequenceTrajectory):
+        """
+        Sets :attr:`part_flight_points` of this sequence and of nested sequences
+        as slices of provided DataFrame.
+
+        :param flight_points: the DataFrame obtained from `trajectory`
+        :param trajectory: the trajectory where parts have been computed
+        """
+        self.part_flight_points = [
+            flight_points.iloc[trajectory.get_position(start) : trajectory.get_position(stop)]
+            for start, stop in self._part_ranges
+        ]
+        for part in self._sequence:
+            if isinstance(part, FlightSequence):
+                part._set_part_flight_points(flight_points, trajectory)
 
     @property
     def target(self) -> Optional[FlightPoint]:
@@ -142,6 +322,9 @@ class FlightSequence(IFlightPart):
         """Remove all parts from flight sequence."""
         self._sequence.clear()
         self.part_flight_points.clear()
+        self._part_ranges.clear()
+        self._part_starts.clear()
+        self._trajectory = None
         self.consumed_mass_before_input_weight = 0.0
 
     def extend(self, seq):
@@ -0,0 +1,239 @@
+"""Closed-form computation of missions that rely on Breguet-Leduc formula."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from copy import copy
+from typing import List, Tuple
+
+import numpy as np
+
+from fastoad.model_base import FlightPoint, FlightPointBatch
+
+from .base import FlightSequence, IFlightPart
+from .mission import Mission
+from .segments.registered.cruise import BreguetCruiseSegment
+from .segments.registered.transition import DummyTransitionSegment
+
+# Cruise distance used for deducing range factors from cruise mass ratios, in m
+_REFERENCE_CRUISE_DISTANCE = 1.0e6
+
+
+class BreguetMissionEvaluator:
+    """
+    Computes range and duration of a mission for arrays of takeoff weights and block fuels,
+    without simulation.
+
+    It applies to missions where all flight parts after the input weight (i.e. the last
+    segment with a target mass, like the "mass_input" segment) are
+    :class:`~.segments.registered.transition.DummyTransitionSegment` instances without target
+    mass, except the cruise of the first route, which is a
+    :class:`~.segments.registered.cruise.BreguetCruiseSegment` instance that uses max lift/drag
+    ratio. This is the case of the "::sizing_breguet" mission.
+
+    In such missions, the mass at end of each flight part is the mass at start multiplied by
+    a constant factor, and only the cruise mass ratio depends on the cruise distance. Therefore,
+    the cruise mass ratio that matches a block fuel is obtained directly, and the cruise
+    distance is deduced using the Breguet-Leduc formula of
+    :meth:`BreguetCruiseSegment._compute_cruise_mass_ratio`.
+
+    Flight parts before the input weight, and flight conditions at cruise start, do not depend
+    on takeoff weight. They are obtained from one computation of the mission with a null
+    cruise distance.
+    """
+
+    def __init__(self, mission: Mission):
+        """
+        :param mission: the mission to evaluate, that will be modified by :meth:`compute`
+        :raise ValueError: if the mission is not applicable (see :meth:`is_applicable`)
+        """
+        if not self.is_applicable(mission):
+            raise ValueError(f'Mission "{mission.name}" cannot be computed in closed form.')
+        self.mission = mission
+
+    @classmethod
+    def is_applicable(cls, mission: Mission) -> bool:
+        """
+        :param mission:
+        :return: True if range of provided mission can be computed in closed form
+        """
+        route = mission.first_route
+        if (
+            route is None
+            or not isinstance(route.cruise_segment, BreguetCruiseSegment)
+            or not route.cruise_segment.use_max_lift_drag_ratio
+        ):
+            return False
+
+        if mission.reserve_ratio and mission.reserve_base_route_name not in [None, route.name]:
+            return False
+
+        segments = _get_segments(mission)
+        input_weight_index = cls._get_input_weight_index(segments)
+
+        # The first route must be after input weight.
+        route_segment_ids = {id(segment) for segment in _get_segments(route)}
+        if any(id(segment) in route_segment_ids for segment in segments[: input_weight_index + 1]):
+            return False
+
+        for segment in segments[input_weight_index + 1 :]:
+            if segment is route.cruise_segment:
+                continue
+            if not isinstance(segment, DummyTransitionSegment) or segment.target.mass is not None:
+                return False
+            # Covered distance and duration must not depend on the cruise distance.
+            for name in ["ground_distance", "time"]:
+                if getattr(segment.target, name) is not None and not segment.target.is_relative(
+                    name
+                ):
+                    return False
+
+        return True
+
+    def compute(
+        self, start: FlightPoint, takeoff_weights, block_fuels
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the first route of the mission for provided takeoff weights and block fuels.
+
+        :param start: the start point of the mission (mass is not used)
+        :param takeoff_weights: values for the input weight of the mission, in kg
+        :param block_fuels: values for the fuel consumed during the mission, including
+                            reserve, in kg
+        :return: ground distance (in m) and duration (in s) of the first route, as arrays
+                 with the shape of provided inputs
+        """
+        takeoff_weights, block_fuels = np.broadcast_arrays(
+            np.asarray(takeoff_weights, dtype=float), np.asarray(block_fuels, dtype=float)
+        )
+        mission = self.mission
+        route = mission.first_route
+        cruise_segment = route.cruise_segment
+
+        # Reference computation
+        mission.target_fuel_consumption = None
+        route.solve_distance = False
+        route.cruise_distance = 0.0
+        reference_start = copy(start)
+        reference_start.mass = takeoff_weights.flat[0] if takeoff_weights.size else 0.0
+        mission.compute_from(reference_start)
+
+        route_start = route._part_starts[0][0]
+        route_end = FlightPoint.create(route.part_flight_points[-1].iloc[-1])
+        climb_descent_distance = route_end.ground_distance - route_start.ground_distance
+        climb_descent_duration = route_end.time - route_start.time
+        cruise_start = FlightPoint.create(
+            route.part_flight_points[len(route.climb_phases)].iloc[-1]
+        )
+
+        # Mass factors, as (mass at some point) / (input weight)
+        route_start_factor, cruise_start_factor, after_cruise_factors = self._get_mass_factors()
+        end_factor_in_route, end_factor = after_cruise_factors
+
+        # Cruise mass ratio is obtained from:
+        #     block_fuel = consumed_fuel_before_input_weight + TOW - mass_at_end + reserve
+        # where mass at end and mission reserve depend linearly on cruise mass ratio.
+        reserve_ratio = mission.reserve_ratio or 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cruise_mass_ratio = (
+                mission.consumed_mass_before_input_weight
+                + takeoff_weights * (1.0 + reserve_ratio * route_start_factor)
+                - block_fuels
+            ) / (
+                takeoff_weights
+                * cruise_start_factor
+                * (end_factor + reserve_ratio * end_factor_in_route)
+            )
+
+            # As the cruise mass ratio is exp(-cruise_distance / range_factor), the cruise
+            # distance that matches a mass ratio is deduced from the mass ratio of a reference
+            # distance, computed at once for all cruise start masses.
+            flight_points = FlightPointBatch(
+                **{
+                    name: getattr(cruise_start, name)
+                    for name in FlightPoint.get_field_names()
+                    if name not in ["name", "sfc"]
+                }
+            )
+            flight_points.mass = takeoff_weights * cruise_start_factor
+            reference_mass_ratios = cruise_segment._compute_cruise_mass_ratio(
+                flight_points, _REFERENCE_CRUISE_DISTANCE
+            )
+            cruise_distances = (
+                _REFERENCE_CRUISE_DISTANCE
+                * np.log(cruise_mass_ratio)
+                / np.log(reference_mass_ratios)
+            )
+
+        # As in simulation, a null block fuel means no flight at all.
+        is_flown = block_fuels != 0.0
+        ranges = np.where(is_flown, climb_descent_distance + cruise_distances, 0.0)
+        durations = np.where(
+            is_flown,
+            climb_descent_duration + cruise_distances / cruise_start.true_airspeed,
+            0.0,
+        )
+        return ranges, durations
+
+    def _get_mass_factors(self) -> Tuple[float, float, Tuple[float, float]]:
+        """
+        :return: the ratios (mass at start of first route)/(input weight) and
+                 (mass at start of cruise)/(input weight), and, as a tuple, the ratios
+                 (mass at end of first route)/(mass at end of cruise) and
+                 (mass at end of mission)/(mass at end of cruise)
+        """
+        route = self.mission.first_route
+        segments = _get_segments(self.mission)
+        route_segment_ids = {id(segment) for segment in _get_segments(route)}
+
+        route_start_factor = None
+        cruise_start_factor = None
+        end_factor_in_route = None
+        factor = 1.0
+        for segment in segments[self._get_input_weight_index(segments) + 1 :]:
+            is_in_route = id(segment) in route_segment_ids
+            if route_start_factor is None and is_in_route:
+                route_start_factor = factor
+            if end_factor_in_route is None and cruise_start_factor is not None and not is_in_route:
+                end_factor_in_route = factor
+
+            if segment is route.cruise_segment:
+                cruise_start_factor = factor
+                factor = 1.0
+            else:
+                factor *= segment.mass_ratio / (1.0 + segment.reserve_mass_ratio)
+
+        if end_factor_in_route is None:
+            end_factor_in_route = factor
+
+        return route_start_factor, cruise_start_factor, (end_factor_in_route, factor)
+
+    @staticmethod
+    def _get_input_weight_index(segments: List[IFlightPart]) -> int:
+        """
+        :return: index of the last segment with an absolute target mass, or -1 if none
+        """
+        for i in range(len(segments) - 1, -1, -1):
+            target = segments[i].target
+            if target is not None and target.mass is not None and not target.is_relative("mass"):
+                return i
+        return -1
+
+
+def _get_segments(flight_part: IFlightPart) -> List[IFlightPart]:
+    """
+    :param flight_part:
+    :return: the flight segments that make provided flight part, in order
+    """
+    if isinstance(flight_part, FlightSequence):
+        return [segment for part in flight_part for segment in _get_segments(part)]
+    return [flight_part]
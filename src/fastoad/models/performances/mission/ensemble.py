@@ -0,0 +1,117 @@
+"""Utilities for computing flight parts for several start points at once."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from fastoad.model_base import FlightPoint, FlightPointBatch
+
+#: Name of the column that contains member indices in DataFrames of ensemble computations.
+MEMBER_COLUMN = "member"
+
+
+def concat_member_flight_points(
+    member_flight_points: Sequence[Optional[pd.DataFrame]],
+) -> pd.DataFrame:
+    """
+    Assembles the flight points of ensemble members in a long-format DataFrame.
+
+    :param member_flight_points: flight points of each member (None if no flight point has
+                                 been computed)
+    :return: a DataFrame where flight points are grouped by member, and where the first
+             column, named after :data:`MEMBER_COLUMN`, contains the member index
+    """
+    frames = [
+        flight_points.assign(**{MEMBER_COLUMN: member})
+        for member, flight_points in enumerate(member_flight_points)
+        if flight_points is not None
+    ]
+    if not frames:
+        return pd.DataFrame(columns=[MEMBER_COLUMN])
+
+    flight_points = pd.concat(frames, ignore_index=True)
+    return flight_points[[MEMBER_COLUMN] + flight_points.columns[:-1].tolist()]
+
+
+def split_member_flight_points(
+    flight_points: pd.DataFrame, member_count: int
+) -> List[Optional[pd.DataFrame]]:
+    """
+    Does the reverse operation of :func:`concat_member_flight_points`.
+
+    :param flight_points: a long-format DataFrame
+    :param member_count: number of ensemble members
+    :return: flight points of each member, without member column (None if member has no
+             flight point)
+    """
+    member_flight_points = [None] * member_count
+    for member, group in flight_points.groupby(MEMBER_COLUMN, sort=False):
+        member_flight_points[member] = group.drop(columns=MEMBER_COLUMN).reset_index(drop=True)
+    return member_flight_points
+
+
+def make_shared_batch(flight_points: Sequence[FlightPoint]) -> FlightPointBatch:
+    """
+    Creates a batch from provided flight points, where a field that has the same value for
+    all flight points keeps this value as is, instead of an array.
+
+    It is meant for segment targets, whose definition is generally common to all members,
+    except for values that have been made absolute from member start points.
+
+    :param flight_points:
+    :return: the created FlightPointBatch instance
+    """
+    batch = FlightPointBatch.from_flight_points(flight_points)
+    for name in FlightPoint.get_field_names():
+        values = [getattr(flight_point, name) for flight_point in flight_points]
+        if all(value == values[0] for value in values[1:]):
+            setattr(batch, name, values[0])
+    return batch
+
+
+def select_members(flight_points: FlightPointBatch, indices: np.ndarray) -> FlightPointBatch:
+    """
+    :param flight_points: a batch with one flight point per member
+    :param indices: indices of selected members
+    :return: a batch with the flight points of selected members (shared values are kept)
+    """
+    selection = FlightPointBatch()
+    for name in FlightPoint.get_field_names():
+        value = getattr(flight_points, name)
+        if np.ndim(value) > 0:
+            value = value[indices]
+        setattr(selection, name, value)
+    return selection
+
+
+def get_member_rows(flight_points: FlightPointBatch, member_count: int) -> Dict[str, np.ndarray]:
+    """
+    :param flight_points: a batch with one flight point per member
+    :param member_count: number of flight points in the batch
+    :return: values of defined fields, with one element per member, as expected by
+             :meth:`~fastoad.models.performances.mission.trajectory.TrajectoryBuffer.extend_from_rows`
+    """
+    rows = {}
+    for name in FlightPoint.get_field_names():
+        value = getattr(flight_points, name)
+        if isinstance(value, np.ndarray):
+            rows[name] = value if value.shape == (member_count,) else np.resize(value, member_count)
+        elif isinstance(value, float):
+            rows[name] = np.full(member_count, value)
+        elif value is not None:
+            # Kept as object, so that value type is not modified (e.g. for enums).
+            rows[name] = np.full(member_count, value, dtype=object)
+    return rows
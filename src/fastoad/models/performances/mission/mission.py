@@ -13,18 +13,19 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
-from scipy.optimize import root_scalar
 
 from fastoad.model_base import FlightPoint
 
 from .base import FlightSequence
 from .routes import RangedRoute
 from .segments.registered.cruise import CruiseSegment
+from .solver import SolverState, solve_with_secant
 
 
 @dataclass
@@ -44,7 +45,17 @@ class Mission(FlightSequence):
     #: Accuracy on actual consumed fuel for the solver. In kg
     fuel_accuracy: float = 10.0
 
+    #: If provided, the solving of cruise distance for :attr:`target_fuel_consumption` will
+    #: start from the solution it contains, and the obtained solution will be stored in it.
+    solver_state: Optional[SolverState] = None
+
+    #: If True, when :attr:`target_fuel_consumption` is set, cruise distances of the other routes
+    #: are solved along with the cruise distance of the first route, instead of being solved
+    #: inside each computation of the mission.
+    solve_routes_jointly: bool = False
+
     _flight_points: Optional[pd.DataFrame] = field(init=False, default=None)
+    _jointly_solved_routes: List[RangedRoute] = field(init=False, default_factory=list)
     _first_cruise_segment: Optional[CruiseSegment] = field(init=False, default=None)
 
     @property
@@ -60,6 +71,11 @@ class Mission(FlightSequence):
         """First route in the mission."""
         return self._get_first_route_in_sequence(self)
 
+    @property
+    def routes(self) -> List[RangedRoute]:
+        """All routes in the mission, in order."""
+        return self._get_routes_in_sequence(self)
+
     def _get_first_route_in_sequence(
         self, flight_sequence: FlightSequence
     ) -> Optional[RangedRoute]:
@@ -73,6 +89,16 @@ class Mission(FlightSequence):
 
         return None
 
+    def _get_routes_in_sequence(self, flight_sequence: FlightSequence) -> List[RangedRoute]:
+        routes = []
+        for part in flight_sequence:
+            if isinstance(part, RangedRoute):
+                routes.append(part)
+            elif isinstance(part, FlightSequence):
+                routes += self._get_routes_in_sequence(part)
+
+        return routes
+
     def compute_from(self, start: FlightPoint) -> pd.DataFrame:
         if self.target_fuel_consumption is None:
             self._flight_points = super().compute_from(start)
@@ -83,6 +109,63 @@ class Mission(FlightSequence):
 
         return self._flight_points
 
+    def is_resumable_from(self, part_index: int) -> bool:
+        """
+        Tells if :meth:`resume_from` can be used for provided part index.
+
+        It is not the case if mission has a target fuel consumption, or if a part from
+        `part_index` has a target mass, because flight points of all previous parts
+        would be modified.
+
+        :param part_index: index of the first part to be computed
+        :return: True if the computation can be resumed from the part at `part_index`
+        """
+        if self.target_fuel_consumption is not None or not 0 < part_index < len(self):
+            return False
+
+        for part in self[part_index:]:
+            if part.target is not None and not (
+                part.target.mass is None or part.target.is_relative("mass")
+            ):
+                return False
+
+        return True
+
+    def resume_from(self, baseline: "Mission", part_index: int) -> pd.DataFrame:
+        """
+        Computes the mission by reusing the computation of `baseline` for the parts before
+        `part_index`.
+
+        `baseline` must have the same structure as current mission and must have been computed
+        with :meth:`compute_from`. Its parts before `part_index` are assumed identical to the
+        ones of current mission, so they are used as they are, and only next parts are computed.
+
+        :param baseline: the mission whose computation is reused
+        :param part_index: index of the first part to be computed (:meth:`is_resumable_from`
+                           must be True for this index)
+        :return: same as :meth:`compute_from`
+        """
+        part_start, consumed_mass = baseline._part_starts[part_index]
+
+        # Trajectory is set back to the end of previous part. Last point is replaced by the
+        # start point of the part, because it may have been completed with data of the part.
+        trajectory = baseline._trajectory.copy()
+        trajectory.truncate(baseline._part_ranges[part_index - 1][1])
+        trajectory.pop()
+        trajectory.append(copy(part_start))
+
+        self._sequence[:part_index] = baseline[:part_index]
+        self._part_ranges = baseline._part_ranges[:part_index]
+        self._part_starts = baseline._part_starts[:part_index]
+        self.consumed_mass_before_input_weight = consumed_mass
+        self._compute_parts(self._sequence[part_index:], copy(part_start), trajectory)
+
+        self._flight_points = self._get_flight_points(trajectory)
+        self._flight_points.loc[self._flight_points.name.isnull(), "name"] = ""
+        self._compute_reserve(self._flight_points)
+
+        return self._flight_points
+
     def get_reserve_fuel(self):
         """:returns: the fuel quantity for reserve, obtained after mission computation."""
         if not self.reserve_ratio or not self.part_flight_points:
@@ -121,6 +204,9 @@ class Mission(FlightSequence):
         """
         Adjusts cruise distance through a solver to have whole route that
         matches provided consumed fuel.
+
+        If :attr:`solve_routes_jointly` is True, cruise distances of other routes are
+        solved at the same time to match their flight distance.
         """
 
         if self.target_fuel_consumption == 0.0:
@@ -130,28 +216,49 @@ class Mission(FlightSequence):
             self.first_route.solve_distance = False
             input_cruise_distance = self.first_route.flight_distance
 
-            root_scalar(
-                self._compute_flight,
-                args=(start,),
-                x0=input_cruise_distance * 0.5,
-                x1=input_cruise_distance * 1.0,
-                xtol=self.fuel_accuracy,
-                method="secant",
+            x0 = [input_cruise_distance * 0.5]
+            x1 = [input_cruise_distance * 1.0]
+            xtol = [self.fuel_accuracy]
+
+            self._jointly_solved_routes = []
+            if self.solve_routes_jointly:
+                for route in self.routes[1:]:
+                    if route.needs_distance_solving:
+                        route.solve_distance = False
+                        self._jointly_solved_routes.append(route)
+                        x0.append(route.flight_distance * 0.5)
+                        x1.append(route.flight_distance * 0.25)
+                        xtol.append(route.distance_accuracy)
+
+            solve_with_secant(
+                lambda cruise_distances: self._compute_flight(cruise_distances, start),
+                x0=x0,
+                x1=x1,
+                xtol=xtol,
+                state=self.solver_state,
             )
 
         return self._flight_points
 
-    def _compute_flight(self, cruise_distance, start: FlightPoint):
+    def _compute_flight(self, cruise_distances, start: FlightPoint):
         """
-        Computes flight for provided cruise distance
+        Computes flight for provided cruise distances
 
-        :param cruise_distance:
+        :param cruise_distances: cruise distance of first route, followed by cruise distances
+                                 of jointly solved routes, if any
         :param start:
-        :return: difference between computed fuel and self.target_fuel_consumption
+        :return: difference between computed fuel and self.target_fuel_consumption, followed
+                 by the distance errors of jointly solved routes, if any
         """
-        self.first_route.cruise_distance = cruise_distance
+        cruise_distances = np.atleast_1d(cruise_distances)
+        self.first_route.cruise_distance = cruise_distances[0]
+        for route, cruise_distance in zip(self._jointly_solved_routes, cruise_distances[1:]):
+            route.cruise_distance = cruise_distance
+
         flight_points = super().compute_from(start)
         flight_points.loc[flight_points.name.isnull(), "name"] = ""
         self._compute_reserve(flight_points)
         self._flight_points = flight_points
-        return self.target_fuel_consumption - self.consumed_fuel
+        return [self.target_fuel_consumption - self.consumed_fuel] + [
+            route.distance_error for route in self._jointly_solved_routes
+        ]
@@ -23,4 +23,6 @@ BASE_UNITS = {
     "range": "m",
     "distance_accuracy": "m",
     "alpha": "rad",
+    "minimum_time_step": "s",
+    "maximum_time_step": "s",
 }
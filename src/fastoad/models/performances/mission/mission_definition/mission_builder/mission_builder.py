@@ -16,8 +16,9 @@ from collections import ChainMap
 from copy import deepcopy
 from dataclasses import fields
 from os import PathLike
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from deprecated import deprecated
 
@@ -48,6 +49,7 @@ from ..schema import (
     SEGMENT_TAG,
     MissionDefinition,
 )
+from ...atmosphere import AtmosphereProvider
 from ...base import FlightSequence
 from ...mission import Mission
 from ...polar import Polar
@@ -105,7 +107,21 @@ class MissionBuilder:
 
         self._mission_name = mission_name
 
-        self._base_kwargs = {"reference_area": reference_area, "propulsion": propulsion}
+        self._base_kwargs = {
+            "reference_area": reference_area,
+            "propulsion": propulsion,
+            "atmosphere": AtmosphereProvider(),
+        }
+
+        # Segment classes and the names of their init fields, with segment keyword as key
+        self._segment_classes: Dict[str, Tuple[type, List[str]]] = {}
+
+        # Polars are kept from one build to the next one, so they can be reused if their
+        # definition did not change. Keys are built from definition values.
+        # Polar modifiers are not kept, because they hold a state that is specific to their
+        # segment (e.g. ground altitude or memo of modified polars).
+        self._polars: Dict[Hashable, Polar] = {}
+        self._previous_polars: Dict[Hashable, Polar] = {}
 
     @property
     def definition(self) -> MissionDefinition:
@@ -143,6 +159,15 @@ class MissionBuilder:
     def reference_area(self, reference_area: float):
         self._base_kwargs["reference_area"] = scalarize(reference_area)
 
+    @property
+    def atmosphere(self) -> AtmosphereProvider:
+        """Atmosphere provider, shared by all built segments."""
+        return self._base_kwargs["atmosphere"]
+
+    @atmosphere.setter
+    def atmosphere(self, atmosphere: AtmosphereProvider):
+        self._base_kwargs["atmosphere"] = atmosphere
+
     @property
     def mission_name(self):
         """The mission name, in case it has been specified, or if it is unique in the file."""
@@ -191,6 +216,9 @@ class MissionBuilder:
         for input_def in self._structure_builders[mission_name].get_input_definitions():
             input_def.set_variable_value(inputs)
 
+        # Only polars used in the last build are kept.
+        self._previous_polars, self._polars = self._polars, {}
+
         mission = self._build_mission(self._structure_builders[mission_name].structure)
         return mission
 
@@ -428,7 +456,9 @@ class MissionBuilder:
         :param kwargs: a preset of keyword arguments for AbstractFlightSegment instantiation
         :return: the FlightSegment instance
         """
-        segment_class = RegisterSegment.get_class(segment_definition[SEGMENT_TYPE_TAG])
+        segment_class, input_field_names = self._get_segment_class(
+            segment_definition[SEGMENT_TYPE_TAG]
+        )
         part_kwargs = kwargs.copy()
         part_kwargs.update(segment_definition)
         part_kwargs.update(self._base_kwargs)
@@ -436,10 +466,10 @@ class MissionBuilder:
         for key, value in part_kwargs.items():
             if key == POLAR_TAG:
                 modifier_kwargs = deepcopy(value.get("modifier"))
-                value = Polar(
-                    cl=value["CL"].value,
-                    cd=value["CD"].value,
-                    alpha=value["alpha"].value if "alpha" in value else None,
+                value = self._get_polar(
+                    value["CL"].value,
+                    value["CD"].value,
+                    value["alpha"].value if "alpha" in value else None,
                 )
                 if modifier_kwargs:
                     if isinstance(modifier_kwargs, InputDefinition):
@@ -466,13 +496,38 @@ class MissionBuilder:
         if "engine_setting" in part_kwargs:
             part_kwargs["engine_setting"] = EngineSetting.convert(part_kwargs["engine_setting"])
 
-        input_field_names = [
-            class_field.name for class_field in fields(segment_class) if class_field.init
-        ]
         part_kwargs = {key: value for key, value in part_kwargs.items() if key in input_field_names}
         segment = segment_class(**part_kwargs)
         return segment
 
+    def _get_segment_class(self, segment_name: str) -> Tuple[type, List[str]]:
+        """
+        :param segment_name: the segment keyword in mission definition
+        :return: the segment class and the names of its init fields
+        """
+        if segment_name not in self._segment_classes:
+            segment_class = RegisterSegment.get_class(segment_name)
+            input_field_names = [
+                class_field.name for class_field in fields(segment_class) if class_field.init
+            ]
+            self._segment_classes[segment_name] = (segment_class, input_field_names)
+
+        return self._segment_classes[segment_name]
+
+    def _get_polar(self, cl, cd, alpha=None) -> Polar:
+        """
+        Provides a Polar instance for provided definition.
+
+        The instance of the previous build is reused if definition did not change.
+        """
+        key = tuple(_get_hashable_value(value) for value in [cl, cd, alpha])
+        polar = self._polars.get(key, self._previous_polars.get(key))
+        if polar is None:
+            polar = Polar(cl=cl, cd=cd, alpha=alpha)
+        self._polars[key] = polar
+
+        return polar
+
     @staticmethod
     def _replace_input_definitions_by_values(part_kwargs):
         for key, input_def in part_kwargs.items():
@@ -583,3 +638,16 @@ class MissionBuilder:
         takeoff = PhaseStructureBuilder(definition, "takeoff", mission_name, self._variable_prefix)
         takeoff_structure = self._structure_builders[mission_name].process_builder(takeoff)
         self._structure_builders[mission_name].structure[PARTS_TAG].insert(1, takeoff_structure)
+
+
+def _get_hashable_value(value) -> Hashable:
+    """
+    :param value: None, a scalar or an array-like
+    :return: a hashable value that identifies provided value
+    """
+    if value is None:
+        return None
+    value = np.asarray(value)
+    if value.dtype == object:
+        return repr(value.tolist())
+    return value.dtype.str, value.shape, value.tobytes()
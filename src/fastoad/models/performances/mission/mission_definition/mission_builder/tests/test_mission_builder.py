@@ -321,6 +321,60 @@ def test_build(custom_segment_class):
     assert_allclose(segment.vector_parameter_3, [10.0, 20.0, 30.0])
 
 
+@pytest.mark.filterwarnings("ignore:Call to deprecated class RegisteredSegment")
+def test_build_reuses_polars(custom_segment_class):
+    mission_definition = MissionDefinition(DATA_FOLDER_PATH / "mission.yml")
+    mission_builder = MissionBuilder(
+        mission_definition, propulsion=Mock(IPropulsion), reference_area=100.0
+    )
+
+    cl = np.linspace(0.0, 1.0, 11)
+    cd = 0.5 * cl**2
+
+    inputs = {
+        "data:TLAR:cruise_mach": 0.78,
+        "data:mission:sizing:main:range": 8000.0e3,
+        "data:mission:sizing:diversion:range": 926.0e3,
+        "initial_climb:final_altitude": 500,
+        "initial_climb:final_equivalent_airspeed": 130.0,
+        "data:aerodynamics:aircraft:cruise:CD": cd,
+        "data:aerodynamics:aircraft:cruise:CL": cl,
+        "data:aerodynamics:aircraft:low_speed:CD": cd,
+        "data:aerodynamics:aircraft:low_speed:CL": cl,
+        "data:aerodynamics:aircraft:takeoff:CD": cd,
+        "data:aerodynamics:aircraft:takeoff:CL": cl,
+        "data:mission:sizing:climb:thrust_rate": 0.9,
+        "data:mission:sizing:descent:thrust_rate": 0.5,
+        "data:mission:sizing:holding:duration": 2000.0,
+        "data:mission:sizing:taxi_in:duration": 300.0,
+        "data:mission:sizing:taxi_in:thrust_rate": 0.5,
+    }
+
+    mission = mission_builder.build(inputs, mission_name="sizing")
+    initial_climb = mission[2][0]
+
+    # Same inputs: segments are new instances, but polars are reused
+    new_mission = mission_builder.build(inputs, mission_name="sizing")
+    new_initial_climb = new_mission[2][0]
+    for segment, new_segment in zip(initial_climb, new_initial_climb):
+        assert new_segment is not segment
+        assert new_segment.polar is segment.polar
+        # Polar modifiers hold a segment-specific state, so they are not shared.
+        assert new_segment.polar_modifier is not segment.polar_modifier
+
+    # ... even between segments with the same modifier definition.
+    modifiers = [segment.polar_modifier for segment in new_initial_climb]
+    assert len({id(modifier) for modifier in modifiers}) == len(modifiers)
+
+    # Modified polar inputs: polars are rebuilt where needed
+    inputs["data:aerodynamics:aircraft:takeoff:CD"] = 0.6 * cl**2
+    new_mission = mission_builder.build(inputs, mission_name="sizing")
+    new_initial_climb = new_mission[2][0]
+    assert new_initial_climb[0].polar is initial_climb[0].polar  # Polar defined in mission file
+    assert new_initial_climb[1].polar is not initial_climb[1].polar
+    assert_allclose(new_initial_climb[1].polar.cd(), 0.6 * cl**2)
+
+
 def test_get_route_ranges(custom_segment_class):
     mission_definition = MissionDefinition(DATA_FOLDER_PATH / "mission.yml")
     mission_builder = MissionBuilder(
@@ -124,6 +124,51 @@ class BaseMissionComp(System, metaclass=ABCMeta):
             check_valid=self._update_mission_wrapper,
             desc="How auto-generated names of variables should begin.",
         )
+        self.options.declare(
+            "use_tabulated_atmosphere",
+            default=False,
+            types=bool,
+            desc="If True, atmosphere properties are interpolated in precomputed tables instead "
+            "of being computed exactly. It is faster, with a relative error below 1e-6.",
+        )
+        self.options.declare(
+            "warm_start_solvers",
+            default=False,
+            types=bool,
+            desc="If True, cruise distance solvers start from the solution of previous "
+            "computation, which saves mission computations when inputs change only slightly. "
+            "It is not done for finite difference computations, nor between the missions of "
+            "a multi-mission component.",
+        )
+        self.options.declare(
+            "solve_routes_jointly",
+            default=False,
+            types=bool,
+            desc="If True, and if mission has a target fuel consumption, cruise distances of all "
+            "routes are solved at once instead of being solved one inside the other.",
+        )
+        self.options.declare(
+            "reuse_descent_phases",
+            default=False,
+            types=bool,
+            desc="If True, the second iteration of the solving of route cruise distances "
+            "reuses descent phases from first iteration, with masses offset, instead of "
+            "computing them. Obtained routes differ within solver accuracy.",
+        )
+        self.options.declare(
+            "use_sparse_partials",
+            default=False,
+            types=bool,
+            desc="If True, partial derivatives are declared only for outputs that may depend on "
+            "each input, according to mission structure, and finite differences recompute only "
+            "the flight parts that are impacted by the perturbed input.",
+        )
+        self.options.declare(
+            "use_partial_coloring",
+            default=False,
+            types=bool,
+            desc="If True, partial coloring is used for computing finite differences.",
+        )
 
     @property
     def name_provider(self) -> Enum:
@@ -148,6 +193,14 @@ class BaseMissionComp(System, metaclass=ABCMeta):
         except IndexError:
             return None
 
+    def reset_mission_state(self):
+        """
+        Forgets results of previous computations that are kept by the mission (solver states
+        and baseline computation), so next computation is done as in a newly set up component.
+        """
+        if isinstance(self._mission_wrapper, MissionWrapper):
+            self._mission_wrapper.reset()
+
     @staticmethod
     def get_mission_definition(
         mission_file_path: Optional[Union[str, PathLike, MissionDefinition]],
@@ -13,9 +13,10 @@
 
 import logging
 from os import PathLike
-from typing import Optional
+from typing import Dict, List, Optional
 
 import numpy as np
+import pandas as pd
 from openmdao import api as om
 
 from fastoad._utils.files import make_parent_dir
@@ -24,6 +25,7 @@ from fastoad.model_base.propulsion import IOMPropulsionWrapper
 from fastoad.module_management.service_registry import RegisterPropulsion
 
 from .base import BaseMissionComp
+from ..atmosphere import AtmosphereProvider
 from ..polar import Polar
 from ..segments.registered.cruise import BreguetCruiseSegment
 
@@ -58,6 +60,13 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
         self._engine_wrapper.setup(self)
 
         self._mission_wrapper.setup(self)
+        self._mission_wrapper.atmosphere = AtmosphereProvider(
+            tabulated=self.options["use_tabulated_atmosphere"]
+        )
+        self._mission_wrapper.warm_start_solvers = self.options["warm_start_solvers"]
+        self._mission_wrapper.solve_routes_jointly = self.options["solve_routes_jointly"]
+        self._mission_wrapper.reuse_descent_phases = self.options["reuse_descent_phases"]
+        self._mission_wrapper.reset_solver_states()
 
         self._input_weight_variable_name = self._mission_wrapper.get_input_weight_variable_name(
             self.mission_name
@@ -82,9 +91,62 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
         )
 
     def setup_partials(self):
-        self.declare_partials(["*"], ["*"], method="fd")
+        if self.options["use_sparse_partials"]:
+            for output_name, input_names in self._get_partial_dependencies().items():
+                if input_names:
+                    self.declare_partials(output_name, input_names, method="fd")
+        else:
+            self.declare_partials(["*"], ["*"], method="fd")
+
+        if self.options["use_partial_coloring"]:
+            self.declare_coloring(wrt="*", method="fd", show_summary=False)
+
+    def _get_partial_dependencies(self) -> Dict[str, List[str]]:
+        """
+        Identifies, for each output, the inputs it may depend on.
+
+        All outputs may depend on inputs that are not defined by the mission (e.g. propulsion
+        inputs). Outputs that are not specific to a part of the mission (e.g. needed block
+        fuel) depend on all inputs.
+
+        :return: a dict with output names as keys and lists of input names as values
+        """
+        output_dependencies = self._mission_wrapper.get_output_dependencies()
+        mission_input_names = set(self._mission_wrapper.get_input_variables().names())
+        input_names = list(self.get_io_metadata(iotypes="input", metadata_keys=[]))
+        other_input_names = [name for name in input_names if name not in mission_input_names]
+
+        return {
+            output_name: (
+                output_dependencies[output_name] + other_input_names
+                if output_name in output_dependencies
+                else input_names
+            )
+            for output_name in self.get_io_metadata(iotypes="output", metadata_keys=[])
+        }
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        self.flight_points = self._compute_mission(
+            inputs,
+            outputs,
+            reuse_baseline=self.options["use_sparse_partials"] and self.under_finite_difference,
+            warm_start=not self.under_finite_difference,
+        )
+
+        self._postprocess_flight_points(self.flight_points)
+
+    def _compute_mission(
+        self, inputs, outputs, reuse_baseline: bool = False, warm_start: bool = True
+    ) -> pd.DataFrame:
+        """
+        Computes the mission and fills `outputs`.
+
+        :param inputs: OpenMDAO input vector, or any mapping with same keys
+        :param outputs: OpenMDAO output vector, or any mapping with same keys
+        :param reuse_baseline: see :meth:`MissionWrapper.compute`
+        :param warm_start: see :meth:`MissionWrapper.compute`
+        :return: the computed flight points
+        """
         propulsion_model = self._engine_wrapper.get_model(inputs)
         reference_area = inputs[self.options["reference_area_variable"]]
 
@@ -97,11 +159,17 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
             altitude=0.0, mass=inputs[self._input_weight_variable_name], true_airspeed=0.0
         )
 
-        self.flight_points = self._mission_wrapper.compute(start_flight_point, inputs, outputs)
+        flight_points = self._mission_wrapper.compute(
+            start_flight_point,
+            inputs,
+            outputs,
+            reuse_baseline=reuse_baseline,
+            warm_start=warm_start,
+        )
 
-        self._compute_outputs(outputs, self.flight_points)
+        self._compute_outputs(outputs, flight_points)
 
-        self._postprocess_flight_points(self.flight_points)
+        return flight_points
 
     def _postprocess_flight_points(self, flight_points):
         flight_points = flight_points.copy()  # local copy for renaming columns before CSV export
@@ -144,6 +212,109 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
         return None
 
 
+class MultiMissionComp(MissionComp):
+    """
+    Computes several missions that differ only by the values of some mission inputs.
+
+    Inputs listed in option "varying_inputs" get one value per mission, and all outputs get
+    one value per mission. Other inputs are common to all missions, so they are declared only
+    once, and the mission definition is processed only once.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._varying_input_names = []
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare("nb_missions", default=1, types=int, lower=1)
+        self.options.declare(
+            "varying_inputs",
+            default=("block_fuel", "TOW"),
+            types=(list, tuple),
+            desc="Mission inputs that get one value per mission, as suffixes of "
+            '"<variable_prefix>:<mission_name>:"',
+        )
+
+    def setup(self):
+        self._varying_input_names = [
+            f"{self.variable_prefix}:{self.mission_name}:{suffix}"
+            for suffix in self.options["varying_inputs"]
+        ]
+        super().setup()
+
+    def add_input(self, name, val=1.0, shape=None, **kwargs):
+        if name in self._varying_input_names:
+            return super().add_input(name, np.nan, shape=(self.options["nb_missions"],), **kwargs)
+        return super().add_input(name, val, shape=shape, **kwargs)
+
+    def add_output(self, name, val=1.0, shape=None, **kwargs):
+        return super().add_output(name, val, shape=(self.options["nb_missions"],), **kwargs)
+
+    def setup_partials(self):
+        if not self.options["use_sparse_partials"]:
+            input_names = list(self.get_io_metadata(iotypes="input", metadata_keys=[]))
+            output_names = self.get_io_metadata(iotypes="output", metadata_keys=[])
+            partial_dependencies = {name: input_names for name in output_names}
+        else:
+            partial_dependencies = self._get_partial_dependencies()
+
+        # As each mission depends only on its own values of varying inputs, partials
+        # w.r.t. these inputs are diagonal.
+        diagonal = np.arange(self.options["nb_missions"])
+        for output_name, input_names in partial_dependencies.items():
+            common_input_names = []
+            for input_name in input_names:
+                if input_name in self._varying_input_names:
+                    self.declare_partials(
+                        output_name, input_name, rows=diagonal, cols=diagonal, method="fd"
+                    )
+                else:
+                    common_input_names.append(input_name)
+            if common_input_names:
+                self.declare_partials(output_name, common_input_names, method="fd")
+
+        if self.options["use_partial_coloring"]:
+            self.declare_coloring(wrt="*", method="fd", show_summary=False)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        mission_flight_points = []
+        for i in range(self.options["nb_missions"]):
+            mission_outputs = {name: 0.0 for name in outputs.keys()}
+            # Missions are different, so a mission solution is not a relevant starting
+            # point for the next one.
+            mission_flight_points.append(
+                self._compute_mission(
+                    self._get_mission_inputs(inputs, i), mission_outputs, warm_start=False
+                )
+            )
+            for name, value in mission_outputs.items():
+                outputs[name][i] = np.asarray(value).item()
+
+        # Columns with no value (e.g. for a mission with no flight) are left out of the
+        # concatenation, so they do not alter column types, and are restored afterwards.
+        self.flight_points = pd.concat(
+            [
+                flight_points.dropna(axis="columns", how="all")
+                for flight_points in mission_flight_points
+            ],
+            keys=range(len(mission_flight_points)),
+            names=["mission"],
+        ).reindex(columns=mission_flight_points[0].columns)
+        self._postprocess_flight_points(self.flight_points)
+
+    def _get_mission_inputs(self, inputs, mission_index: int) -> dict:
+        """
+        :return: the input values of the mission at provided index
+        """
+        return {
+            name: value[mission_index : mission_index + 1]
+            if name in self._varying_input_names
+            else value
+            for name, value in inputs.items()
+        }
+
+
 class AdvancedMissionComp(MissionComp):
     """
     Computes a mission as specified in mission input file.
@@ -15,8 +15,9 @@ Mission wrapper.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from copy import copy
 from os import PathLike
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import openmdao.api as om
@@ -26,10 +27,12 @@ from openmdao.vectors.vector import Vector
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.propulsion import IPropulsion
 
+from ..mission import Mission
 from ..mission_definition.mission_builder import MissionBuilder
 from ..mission_definition.mission_builder.constants import NAME_TAG, TYPE_TAG
 from ..mission_definition.schema import (
     CLIMB_PARTS_TAG,
+    CRUISE_PART_TAG,
     DESCENT_PARTS_TAG,
     PARTS_TAG,
     PHASE_TAG,
@@ -37,6 +40,7 @@ from ..mission_definition.schema import (
     ROUTE_TAG,
     MissionDefinition,
 )
+from ..solver import SolverState
 
 
 class MissionWrapper(MissionBuilder):
@@ -58,6 +62,9 @@ class MissionWrapper(MissionBuilder):
         mission_name: Optional[str] = None,
         variable_prefix: str = "data:mission",
         force_all_block_fuel_usage: bool = False,
+        warm_start_solvers: bool = False,
+        solve_routes_jointly: bool = False,
+        reuse_descent_phases: bool = False,
     ):
         """
         :param mission_definition: a file path or MissionDefinition instance
@@ -71,6 +78,14 @@ class MissionWrapper(MissionBuilder):
         :param force_all_block_fuel_usage: if True and if `mission_name` is provided, the mission
                                            definition will be modified to set the target fuel
                                            consumption to variable  "~:block_fuel"
+        :param warm_start_solvers: if True, solving of cruise distances in a computation will
+                                   start from the solution of previous computation
+        :param solve_routes_jointly: if True, and if the mission has a target fuel consumption,
+                                     cruise distances of all routes are solved at once
+                                     (see :attr:`Mission.solve_routes_jointly`)
+        :param reuse_descent_phases: if True, solving of cruise distance of routes reuses
+                                     descent phases of first iteration in second one
+                                     (see :attr:`RangedRoute.reuse_descent_phases`)
         """
         super().__init__(
             mission_definition,
@@ -80,6 +95,19 @@ class MissionWrapper(MissionBuilder):
             variable_prefix=variable_prefix,
         )
         self.consumed_fuel_before_input_weight = 0.0
+        self.warm_start_solvers = warm_start_solvers
+        self.solve_routes_jointly = solve_routes_jointly
+        self.reuse_descent_phases = reuse_descent_phases
+
+        # Solver states are kept from one computation to the next one, with
+        # mission or route names as keys.
+        self._solver_states: Dict[str, SolverState] = {}
+
+        # Last computation done with reuse_baseline=False (see compute())
+        self._baseline_mission: Optional[Mission] = None
+        self._baseline_start: Optional[FlightPoint] = None
+        self._baseline_inputs: Dict[str, np.ndarray] = {}
+
         if force_all_block_fuel_usage:
             self.force_all_block_fuel_usage()
 
@@ -112,7 +140,12 @@ class MissionWrapper(MissionBuilder):
             component.add_output(name, 0.0, units=units, desc=desc)
 
     def compute(
-        self, start_flight_point: FlightPoint, inputs: Vector, outputs: Vector
+        self,
+        start_flight_point: FlightPoint,
+        inputs: Vector,
+        outputs: Vector,
+        reuse_baseline: bool = False,
+        warm_start: bool = True,
     ) -> pd.DataFrame:
         """
         To be used during compute() of an OpenMDAO component.
@@ -121,45 +154,40 @@ class MissionWrapper(MissionBuilder):
         filled with duration, burned fuel and covered ground distance for each
         part of the flight.
 
+        The last computation done with `reuse_baseline=False` is kept as baseline. When
+        `reuse_baseline` is True, as for finite differences, flight parts that come before
+        the first part impacted by modified inputs are taken from the baseline, and only
+        next parts are computed (see :meth:`Mission.resume_from`). If modified inputs
+        impact the whole mission, it is fully computed.
+
         :param start_flight_point: starting point of mission
         :param inputs: the input vector of the OpenMDAO component
         :param outputs: the output vector of the OpenMDAO component
+        :param reuse_baseline: if True, the baseline computation is reused when possible
+        :param warm_start: if False, cruise distance solvers are cold-started, and their solution
+                           is not kept, even if :attr:`warm_start_solvers` is True
         :return: a pandas DataFrame where column names match fields of
                  :class:`~fastoad.model_base.flight_point.FlightPoint`
         """
         mission = self.build(inputs, self.mission_name)
+        self._set_solver_settings(mission, warm_start)
+
+        part_index = None
+        if reuse_baseline:
+            part_index = self._get_first_modified_part_index(mission, start_flight_point, inputs)
+
+        if part_index is None:
+            if not reuse_baseline:
+                self._baseline_start = copy(start_flight_point)
+                self._baseline_inputs = {name: np.array(value) for name, value in inputs.items()}
+            flight_points = mission.compute_from(start_flight_point)
+            if not reuse_baseline:
+                self._baseline_mission = mission
+        else:
+            flight_points = mission.resume_from(self._baseline_mission, part_index)
 
-        def _compute_vars(name_root, start: FlightPoint, end: FlightPoint):
-            """Computes duration, burned fuel and covered distance."""
-            if name_root + ":duration" in outputs:
-                outputs[name_root + ":duration"] = end.time - start.time
-            if name_root + ":fuel" in outputs:
-                outputs[name_root + ":fuel"] = start.mass - end.mass
-            if name_root + ":distance" in outputs:
-                outputs[name_root + ":distance"] = end.ground_distance - start.ground_distance
-
-        flight_points = mission.compute_from(start_flight_point)
         flight_points.loc[0, "name"] = flight_points.loc[1, "name"]
-
-        nb_levels = np.max([len(n.split(":")) for n in flight_points["name"]])
-        for i in range(nb_levels):
-            flight_points["name2"] = [":".join(n.split(":")[: i + 1]) for n in flight_points.name]
-            grouped_points = flight_points.groupby("name2")
-
-            part_names = pd.unique(flight_points.name2)
-            for part_name1, part_name2 in zip(part_names[:-1], part_names[1:]):
-                part1 = grouped_points.get_group(part_name1)
-                part2 = grouped_points.get_group(part_name2)
-                _compute_vars(
-                    f"{self.variable_prefix}:{part_name2}", part1.iloc[-1], part2.iloc[-1]
-                )
-
-            start_part_name = part_names[0]
-            start_part = grouped_points.get_group(start_part_name)
-            _compute_vars(
-                f"{self.variable_prefix}:{start_part_name}", start_part.iloc[0], start_part.iloc[-1]
-            )
-        del flight_points["name2"]
+        self._compute_part_outputs(flight_points, outputs)
 
         self.consumed_fuel_before_input_weight = mission.consumed_mass_before_input_weight
         if mission.reserve_ratio:
@@ -167,6 +195,251 @@ class MissionWrapper(MissionBuilder):
 
         return flight_points
 
+    def _compute_part_outputs(self, flight_points: pd.DataFrame, outputs: Vector):
+        """
+        Fills `outputs` with duration, burned fuel and covered ground distance for each
+        part of the flight.
+
+        Parts are identified at each nesting level from the "name" column of flight points.
+        A part starts at the last point of previous part (or at first point for the first
+        part) and ends at its own last point.
+
+        :param flight_points: the computed flight points
+        :param outputs: the output vector of the OpenMDAO component
+        """
+        name_codes, names = pd.factorize(flight_points["name"])
+        split_names = [name.split(":") for name in names]
+
+        output_values = {
+            "duration": flight_points["time"].to_numpy(dtype=float),
+            "fuel": -flight_points["mass"].to_numpy(dtype=float),
+            "distance": flight_points["ground_distance"].to_numpy(dtype=float),
+        }
+
+        nb_levels = max(len(split_name) for split_name in split_names)
+        for i in range(nb_levels):
+            # Codes of level names are obtained from the codes of full names, so
+            # string processing is done only once per distinct name.
+            part_codes, part_names = pd.factorize(
+                np.array([":".join(split_name[: i + 1]) for split_name in split_names])
+            )
+            point_part_codes = part_codes[name_codes]
+
+            _, reversed_end_rows = np.unique(point_part_codes[::-1], return_index=True)
+            end_rows = len(point_part_codes) - 1 - reversed_end_rows
+            start_rows = np.concatenate(([0], end_rows[:-1]))
+
+            for part_name, start_row, end_row in zip(part_names, start_rows, end_rows):
+                name_root = f"{self.variable_prefix}:{part_name}"
+                for suffix, values in output_values.items():
+                    variable_name = f"{name_root}:{suffix}"
+                    if variable_name in outputs:
+                        outputs[variable_name] = values[end_row] - values[start_row]
+
+    def get_output_dependencies(self) -> Dict[str, List[str]]:
+        """
+        Identifies, for each output of the mission, the input variables of the mission
+        it may depend on.
+
+        Outputs of a flight part depend on inputs of this part and of previous parts. In a
+        route where cruise distance is solved, cruise also depends on inputs of the
+        descent phases. If the mission has a target fuel consumption, all outputs depend on
+        all inputs.
+
+        Other inputs of the OpenMDAO component (e.g. propulsion inputs) are not considered
+        here, as all outputs may depend on them.
+
+        :return: a dict with names of outputs declared in :meth:`setup` as keys, and lists of
+                 names of input variables as values
+        """
+        mission_structure = self._structure_builders[self.mission_name].structure
+        _, part_spans = self._get_part_spans()
+        input_positions = self._get_input_positions(part_spans)
+        last_index = part_spans[self.mission_name][1]
+
+        output_dependencies = {}
+        for output_name in self._identify_outputs():
+            if output_name in input_positions:
+                continue
+            part_name = output_name.rsplit(":", 1)[0]
+            if self.variable_prefix:
+                part_name = part_name[len(self.variable_prefix) + 1 :]
+
+            if "target_fuel_consumption" in mission_structure:
+                part_last_index = last_index
+            else:
+                part_last_index = part_spans.get(part_name, (0, last_index))[1]
+
+            output_dependencies[output_name] = [
+                input_name
+                for input_name, position in input_positions.items()
+                if position <= part_last_index
+            ]
+
+        return output_dependencies
+
+    def reset_solver_states(self):
+        """Forgets solutions of previous computations, so next computation will be cold-started."""
+        self._solver_states.clear()
+
+    def reset(self):
+        """
+        Forgets all results of previous computations (solver states and baseline computation),
+        so next computation is done as for a new instance.
+        """
+        self.reset_solver_states()
+        self._baseline_mission = None
+        self._baseline_start = None
+        self._baseline_inputs = {}
+
+    def _set_solver_settings(self, mission: Mission, warm_start: bool = True):
+        """
+        Provides solver settings to the mission and its routes.
+
+        :param mission: the mission to be computed
+        :param warm_start: if False, solver states are not provided, even if
+                           :attr:`warm_start_solvers` is True
+        """
+        mission.solve_routes_jointly = self.solve_routes_jointly
+        for route in mission.routes:
+            route.reuse_descent_phases = self.reuse_descent_phases
+        if not (self.warm_start_solvers and warm_start):
+            return
+
+        mission.solver_state = self._solver_states.setdefault(mission.name, SolverState())
+        for route in mission.routes:
+            route.solver_state = self._solver_states.setdefault(route.name, SolverState())
+
+    def _get_first_modified_part_index(
+        self, mission: Mission, start_flight_point: FlightPoint, inputs: Vector
+    ) -> Optional[int]:
+        """
+        Compares provided inputs to the ones of baseline computation.
+
+        :param mission: the mission to be computed
+        :param start_flight_point: starting point of mission
+        :param inputs: the input vector of the OpenMDAO component
+        :return: index of the first part of `mission` that is impacted by modified inputs,
+                 or None if `mission` has to be fully computed
+        """
+        if self._baseline_mission is None or start_flight_point != self._baseline_start:
+            return None
+
+        modified_input_names = [
+            name
+            for name, value in inputs.items()
+            if name not in self._baseline_inputs
+            or not np.array_equal(value, self._baseline_inputs[name])
+        ]
+        first_level_spans, part_spans = self._get_part_spans()
+        input_positions = self._get_input_positions(part_spans)
+        if not modified_input_names or any(
+            name not in input_positions for name in modified_input_names
+        ):
+            return None
+
+        first_position = min(input_positions[name] for name in modified_input_names)
+        part_index = max(i for i, span in enumerate(first_level_spans) if span[0] <= first_position)
+
+        if len(mission) == len(self._baseline_mission) and mission.is_resumable_from(part_index):
+            return part_index
+
+        return None
+
+    def _get_part_spans(self) -> Tuple[List[Tuple[int, int]], Dict[str, Tuple[int, int]]]:
+        """
+        Locates flight parts of the mission in computation order.
+
+        Segments of the mission are numbered in computation order, and the span of a flight
+        part is the pair of indices of its first and last segments.
+
+        :return: the list of spans of first-level parts of the mission, and a dict with the
+                 span of each flight part (including the mission), with qualified part names
+                 as keys
+        """
+        mission_structure = self._structure_builders[self.mission_name].structure
+        part_spans = {}
+        first_level_spans = []
+        first_index = 0
+        for part_structure in self._get_subpart_structures(mission_structure):
+            span = self._add_part_spans(part_structure, part_spans, first_index)
+            first_level_spans.append(span)
+            first_index = span[1] + 1
+
+        part_spans[mission_structure[NAME_TAG]] = (0, first_index - 1)
+        return first_level_spans, part_spans
+
+    def _add_part_spans(
+        self, part_structure: dict, part_spans: Dict[str, Tuple[int, int]], first_index: int
+    ) -> Tuple[int, int]:
+        """
+        Adds in `part_spans` the span of provided part and of its subparts.
+
+        :param part_structure: structure of the flight part
+        :param part_spans: the dict to complete
+        :param first_index: index of the first segment of the part
+        :return: the span of the part
+        """
+        last_index = first_index
+        next_index = first_index
+        for subpart_structure in self._get_subpart_structures(part_structure):
+            last_index = self._add_part_spans(subpart_structure, part_spans, next_index)[1]
+            next_index = last_index + 1
+
+        # Unnamed segments get the name of their parent, which is processed afterward
+        # and gets the right span.
+        part_spans[part_structure[NAME_TAG]] = (first_index, last_index)
+        return first_index, last_index
+
+    @staticmethod
+    def _get_subpart_structures(part_structure: dict) -> List[dict]:
+        """
+        :param part_structure: structure of a mission, a route, a phase or a segment
+        :return: structures of subparts, in computation order
+        """
+        if part_structure.get(TYPE_TAG) == ROUTE_TAG:
+            return (
+                part_structure[CLIMB_PARTS_TAG]
+                + [part_structure[CRUISE_PART_TAG]]
+                + part_structure[DESCENT_PARTS_TAG]
+            )
+
+        return [part for part in part_structure.get(PARTS_TAG, []) if TYPE_TAG in part]
+
+    def _get_input_positions(self, part_spans: Dict[str, Tuple[int, int]]) -> Dict[str, int]:
+        """
+        :param part_spans: spans of flight parts, as provided by :meth:`_get_part_spans`
+        :return: for each input variable of the mission, the index of the first segment whose
+                 computation depends on it
+        """
+        mission_structure = self._structure_builders[self.mission_name].structure
+
+        # In a route where cruise distance is solved, cruise depends on all route inputs.
+        cruise_starts = {
+            part[NAME_TAG]: part_spans[part[CRUISE_PART_TAG][NAME_TAG]][0]
+            for part in mission_structure[PARTS_TAG]
+            if part.get(TYPE_TAG) == ROUTE_TAG and "range" in part
+        }
+
+        input_positions = {}
+        for input_def in self._structure_builders[self.mission_name].get_input_definitions():
+            if not input_def.variable_name:
+                continue
+            position = part_spans.get(input_def.part_identifier, (0, 0))[0]
+            for route_name, cruise_start in cruise_starts.items():
+                if input_def.part_identifier.startswith(f"{route_name}:"):
+                    position = min(position, cruise_start)
+            input_positions[input_def.variable_name] = min(
+                position, input_positions.get(input_def.variable_name, position)
+            )
+
+        # Input weight also defines the mass of the default start point.
+        input_weight_variable_name = self.get_input_weight_variable_name(self.mission_name)
+        if input_weight_variable_name in input_positions:
+            input_positions[input_weight_variable_name] = 0
+
+        return input_positions
+
     def get_reserve_variable_name(self) -> str:
         """
         :return: the name of OpenMDAO variable for fuel reserve. This name is among the declared
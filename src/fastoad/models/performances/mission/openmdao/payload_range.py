@@ -12,20 +12,33 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import logging
+import multiprocessing as mp
+import weakref
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import openmdao.api as om
 from pyDOE3 import lhs
-from scipy.interpolate import interp1d
-
+from scipy.interpolate import (
+    LinearNDInterpolator,
+    NearestNDInterpolator,
+    RBFInterpolator,
+    interp1d,
+)
+
+from fastoad.model_base import FlightPoint
 from fastoad.module_management.constants import ModelDomain
 from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
-from fastoad.openmdao.problem import get_variable_list_from_system
+from fastoad.openmdao.problem import FASTOADProblem, get_variable_list_from_system
+from fastoad.openmdao.variables import VariableList
 
 from .base import BaseMissionComp, NeedsMFW, NeedsMTOW, NeedsOWE
-from .mission_run import MissionComp
+from .mission_run import MissionComp, MultiMissionComp
+from ..breguet_mission import BreguetMissionEvaluator
+
+_LOGGER = logging.getLogger(__name__)  # Logger for this module
 
 
 @RegisterOpenMDAOSystem("fastoad.performances.payload_range", domain=ModelDomain.PERFORMANCE)
@@ -85,6 +98,44 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
             desc="Sets the minimum block fuel for inner grid points, as a ratio w.r.t. max "
             "possible fuel weight for the current payload.",
         )
+        self.options.declare(
+            "grid_sampling",
+            default="lhs",
+            values=["lhs", "adaptive"],
+            desc='With "lhs", inner grid points are a Latin Hypercube Sample. With "adaptive", '
+            "a coarse Latin Hypercube Sample is computed first, then points are added one by "
+            "one where interpolation of range and specific burned fuel is estimated to be the "
+            "least accurate.",
+        )
+        self.options.declare(
+            "grid_tolerance",
+            default=0.0,
+            lower=0.0,
+            desc='Used if grid_sampling=="adaptive". When the estimated relative interpolation '
+            "error gets below this value, no more point is computed, and the remaining grid "
+            "points are set to NaN.",
+        )
+        self.options.declare(
+            "max_workers",
+            default=1,
+            types=int,
+            allow_none=True,
+            desc="If not 1, the missions of the payload-range diagram are run concurrently on "
+            "a local process pool (no MPI needed) with this number of worker processes. "
+            "None means all available processors, -1 means all available processors except 1.",
+        )
+
+        self.options.declare(
+            "closed_form_missions",
+            default=False,
+            types=bool,
+            desc="If True, and if missions are analytic (only transition segments and a "
+            "Breguet cruise after input weight, like in the sizing_breguet mission), missions "
+            "of the payload-range diagram are computed with closed-form formulas for all "
+            "points at once, instead of being simulated. Cannot be combined with max_workers: "
+            "if max_workers is not 1, missions are simulated concurrently and a warning is "
+            "issued.",
+        )
 
         # This one is declared again to change default value
         self.options.declare(
@@ -130,18 +181,14 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
         )
 
         var_connections = {"block_fuel": "block_fuel", "TOW": "TOW"}
-        self._add_mission_runs(group, nb_contour_points, var_connections, "mux_contour")
-
-        mux_comp = group.add_subsystem(
-            name="mux_contour", subsys=om.MuxComp(vec_size=nb_contour_points)
+        range_name, duration_name = self._add_mission_runs(
+            group, nb_contour_points, var_connections
         )
-        mux_comp.add_var("range", shape=(1,), axis=0, units="m")
-        mux_comp.add_var("duration", shape=(1,), axis=0, units="s")
         group.promotes(
-            "mux_contour",
+            "missions",
             outputs=[
-                ("range", self._contour_names.range),
-                ("duration", self._contour_names.duration),
+                (range_name, self._contour_names.range),
+                (duration_name, self._contour_names.duration),
             ],
         )
 
@@ -166,53 +213,23 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
 
         group = om.Group()
 
-        # Build grid inputs
-        group.add_subsystem(
-            "input_values",
-            PayloadRangeGridInputValues(
-                mission_name=self.mission_name,
-                nb_points=nb_grid_points,
-                PR_variable_prefix=self.variable_prefix,
-                random_seed=self.options["grid_random_seed"],
-                lhs_criterion=self.options["grid_lhs_criterion"],
-                min_payload_ratio=self.options["min_payload_ratio"],
-                min_block_fuel_ratio=self.options["min_block_fuel_ratio"],
-            ),
-            promotes=["*"],
-        )
-
-        # Run computations
-        var_connections = {"grid:block_fuel": "block_fuel", "grid:TOW": "TOW"}
-        self._add_mission_runs(group, nb_grid_points, var_connections, "mux_grid")
-
-        # Assemble mission results in variables
-        # 2 points are added to include the 2 MTOW points of the contour in the grid points.
-        # (These 2 points are already added in grid inputs by PayloadRangeGridInputValues)
-        mux_comp = group.add_subsystem(
-            name="mux_grid", subsys=om.MuxComp(vec_size=nb_grid_points + 2)
-        )
-        mux_comp.add_var("range", shape=(1,), axis=0, units="m")
-        mux_comp.add_var("duration", shape=(1,), axis=0, units="s")
-        group.promotes(
-            "mux_grid",
-            outputs=[
-                ("range", self._grid_names.range),
-                ("duration", self._grid_names.duration),
-            ],
-        )
-
-        # Adding the results of the 2 MTOW points of the contour.
-        for i in range(2):
-            self.connect(
-                self._contour_names.range,
-                f"mux_grid.range_{nb_grid_points+i}",
-                src_indices=[i + 1],
-            )
-            self.connect(
-                self._contour_names.duration,
-                f"mux_grid.duration_{nb_grid_points+i}",
-                src_indices=om.slicer[i + 1],
+        if self.options["grid_sampling"] == "adaptive":
+            group.add_subsystem(
+                "adaptive_grid",
+                PayloadRangeAdaptiveGrid(
+                    **self._get_mission_options(),
+                    nb_points=nb_grid_points,
+                    PR_variable_prefix=self.variable_prefix,
+                    random_seed=self.options["grid_random_seed"],
+                    lhs_criterion=self.options["grid_lhs_criterion"],
+                    min_payload_ratio=self.options["min_payload_ratio"],
+                    min_block_fuel_ratio=self.options["min_block_fuel_ratio"],
+                    tolerance=self.options["grid_tolerance"],
+                ),
+                promotes=["*"],
             )
+        else:
+            self._add_payload_range_lhs_grid(group)
 
         # Computation of specific burned fuel
         group.add_subsystem(
@@ -249,18 +266,51 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
 
         return group
 
-    def _add_mission_runs(
-        self, group: om.Group, nb_missions: int, input_var_connections: Dict[str, str], mux_name
-    ):
-        """Adds MissionRun components to the provided group."""
+    def _add_payload_range_lhs_grid(self, group: om.Group):
+        """Adds to provided group the computation of grid points from a Latin Hypercube Sample."""
+        nb_grid_points = self.options["nb_grid_points"]
 
-        input_var_connections = {
-            self._contour_names.get_variable_name(
-                name1
-            ): f"data:mission:{self.mission_name}:{name2}"
-            for name1, name2 in input_var_connections.items()
-        }
+        # Build grid inputs
+        group.add_subsystem(
+            "input_values",
+            PayloadRangeGridInputValues(
+                mission_name=self.mission_name,
+                nb_points=nb_grid_points,
+                PR_variable_prefix=self.variable_prefix,
+                random_seed=self.options["grid_random_seed"],
+                lhs_criterion=self.options["grid_lhs_criterion"],
+                min_payload_ratio=self.options["min_payload_ratio"],
+                min_block_fuel_ratio=self.options["min_block_fuel_ratio"],
+            ),
+            promotes=["*"],
+        )
+
+        # Run computations
+        var_connections = {"grid:block_fuel": "block_fuel", "grid:TOW": "TOW"}
+        range_name, duration_name = self._add_mission_runs(group, nb_grid_points, var_connections)
+
+        # Assemble mission results in variables
+        # 2 points are added to include the 2 MTOW points of the contour in the grid points.
+        # (These 2 points are already added in grid inputs by PayloadRangeGridInputValues)
+        group.add_subsystem(
+            "grid_results",
+            PayloadRangeGridResults(nb_missions=nb_grid_points),
+            promotes_outputs=[
+                ("range", self._grid_names.range),
+                ("duration", self._grid_names.duration),
+            ],
+        )
+        group.connect(f"missions.{range_name}", "grid_results.mission_range")
+        group.connect(f"missions.{duration_name}", "grid_results.mission_duration")
 
+        # Adding the results of the 2 MTOW points of the contour.
+        self.connect(self._contour_names.range, "grid_results.contour_range", src_indices=[1, 2])
+        self.connect(
+            self._contour_names.duration, "grid_results.contour_duration", src_indices=[1, 2]
+        )
+
+    def _get_mission_options(self) -> dict:
+        """Options for the mission components of the payload-range diagram."""
         mission_options = {
             key: val for key, val in self.options.items() if key in MissionComp().options
         }
@@ -268,39 +318,353 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
         # its variable prefix.
         mission_options["mission_file_path"] = self._mission_wrapper.definition
         mission_options["variable_prefix"] = "data:mission"
+        return mission_options
+
+    def _add_mission_runs(
+        self, group: om.Group, nb_missions: int, input_var_connections: Dict[str, str]
+    ) -> Tuple[str, str]:
+        """
+        Adds to the provided group the "missions" component that computes all missions.
+
+        :return: the names of the outputs of the "missions" component that provide range and
+                 duration of all missions
+        """
+
+        input_var_connections = {
+            self._contour_names.get_variable_name(
+                name1
+            ): f"data:mission:{self.mission_name}:{name2}"
+            for name1, name2 in input_var_connections.items()
+        }
+
+        mission_options = self._get_mission_options()
         mission_inputs = get_variable_list_from_system(
             MissionComp(**mission_options), io_status="inputs"
         )
 
-        for i in range(nb_missions):
-            subsys_name = f"mission_{i}"
-            group.add_subsystem(subsys_name, MissionComp(**mission_options))
+        # All inputs but block_fuel and TOW are promoted.
+        promoted_inputs = [
+            variable.name
+            for variable in mission_inputs
+            if variable.name not in input_var_connections.values()
+        ]
 
-            # Connect block_fuel and TOW mission inputs to contour inputs
-            for payload_range_var, mission_var in input_var_connections.items():
-                group.connect(
-                    payload_range_var,
-                    f"{subsys_name}.{mission_var}",
-                    src_indices=[i],
-                )
+        range_name = f"data:mission:{self.mission_name}:{self.first_route_name}:distance"
+        duration_name = f"data:mission:{self.mission_name}:{self.first_route_name}:duration"
 
-            # All other inputs are promoted.
-            promoted_inputs = [
-                variable.name
-                for variable in mission_inputs
-                if variable.name not in input_var_connections.values()
-            ]
+        if self.options["max_workers"] != 1:
+            if self.options["closed_form_missions"]:
+                _LOGGER.warning(
+                    'Option "closed_form_missions" is ignored because "max_workers" is not 1. '
+                    "Missions of the payload-range diagram will be simulated concurrently."
+                )
+            missions = ParallelMissionRuns(
+                mission_options=mission_options,
+                nb_missions=nb_missions,
+                varying_inputs=list(input_var_connections.values()),
+                output_names=[range_name, duration_name],
+                max_workers=self.options["max_workers"],
+            )
+            range_name, duration_name = "range", "duration"
+        elif self.options["closed_form_missions"]:
+            missions = ClosedFormMissionRuns(
+                **mission_options,
+                nb_missions=nb_missions,
+                varying_inputs=["block_fuel", "TOW"],
+            )
+            range_name, duration_name = "range", "duration"
+        else:
+            missions = MultiMissionComp(
+                **mission_options,
+                nb_missions=nb_missions,
+                varying_inputs=["block_fuel", "TOW"],
+            )
 
-            group.promotes(subsys_name, inputs=promoted_inputs)
+        group.add_subsystem("missions", missions, promotes_inputs=promoted_inputs)
 
+        # Connect block_fuel and TOW mission inputs to payload-range inputs
+        for payload_range_var, mission_var in input_var_connections.items():
             group.connect(
-                f"{subsys_name}.data:mission:{self.mission_name}:{self.first_route_name}:distance",
-                f"{mux_name}.range_{i}",
+                payload_range_var,
+                f"missions.{mission_var}",
+                src_indices=np.arange(nb_missions),
             )
-            group.connect(
-                f"{subsys_name}.data:mission:{self.mission_name}:{self.first_route_name}:duration",
-                f"{mux_name}.duration_{i}",
+
+        return range_name, duration_name
+
+
+class ParallelMissionRuns(om.ExplicitComponent):
+    """
+    Runs several missions that differ only by some input values, concurrently on a local
+    process pool.
+
+    Each worker process builds its own mission component once. Then, for each mission, only
+    the mission inputs are sent to workers, and only the range and duration are sent back.
+    Results are gathered in the order of missions, so they do not depend on how missions are
+    scheduled.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._input_units: Dict[str, Optional[str]] = {}
+        self._pool = None
+
+    def initialize(self):
+        self.options.declare(
+            "mission_options", types=dict, desc="Options for the MissionComp instances."
+        )
+        self.options.declare("nb_missions", types=int, lower=1, desc="Number of missions.")
+        self.options.declare(
+            "varying_inputs",
+            types=list,
+            desc="Names of mission inputs that have one value per mission. Each of them is "
+            "an input of shape (nb_missions,).",
+        )
+        self.options.declare(
+            "output_names",
+            types=list,
+            desc="Names of mission outputs for range and duration.",
+        )
+        self.options.declare(
+            "max_workers",
+            default=None,
+            types=int,
+            allow_none=True,
+            desc="Number of worker processes. None means all available processors, -1 means "
+            "all available processors except 1.",
+        )
+
+    def setup(self):
+        self._close_pool()
+
+        nb_missions = self.options["nb_missions"]
+        varying_inputs = self.options["varying_inputs"]
+
+        problem = FASTOADProblem()
+        problem.model.add_subsystem(
+            "mission", MissionComp(**self.options["mission_options"]), promotes=["*"]
+        )
+        dynamic_input_names = problem.analysis.undetermined_dynamic_input_vars.names()
+        mission_inputs = VariableList.from_problem(problem, io_status="inputs")
+
+        self._input_units = {}
+        for variable in mission_inputs:
+            kwargs = variable.get_openmdao_kwargs(["val", "units", "desc"])
+            if variable.name in varying_inputs:
+                kwargs.update(shape=(nb_missions,), val=np.nan)
+            elif variable.name in dynamic_input_names:
+                kwargs.update(shape_by_conn=True, val=np.nan)
+            else:
+                kwargs["shape"] = variable.metadata["shape"]
+            self.add_input(**kwargs)
+            self._input_units[variable.name] = variable.units
+
+        self.add_output("range", shape=(nb_missions,), units="m")
+        self.add_output("duration", shape=(nb_missions,), units="s")
+
+    def setup_partials(self):
+        # As each mission depends only on its own values of varying inputs, partials
+        # w.r.t. these inputs are diagonal.
+        varying_inputs = self.options["varying_inputs"]
+        diagonal = np.arange(self.options["nb_missions"])
+        common_input_names = []
+        for input_name in self.get_io_metadata(iotypes="input", metadata_keys=[]):
+            if input_name in varying_inputs:
+                self.declare_partials(
+                    ["range", "duration"], input_name, rows=diagonal, cols=diagonal, method="fd"
+                )
+            else:
+                common_input_names.append(input_name)
+        if common_input_names:
+            self.declare_partials(["range", "duration"], common_input_names, method="fd")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        varying_inputs = self.options["varying_inputs"]
+        cases = [
+            {name: value[i] if name in varying_inputs else value for name, value in inputs.items()}
+            for i in range(self.options["nb_missions"])
+        ]
+
+        results = np.array(self._get_pool().map(_run_mission, cases, chunksize=1))
+        outputs["range"] = results[:, 0]
+        outputs["duration"] = results[:, 1]
+
+    def _get_pool(self):
+        if self._pool is None:
+            max_workers = self.options["max_workers"]
+            if max_workers is None:
+                max_workers = mp.cpu_count()
+            elif max_workers == -1:
+                max_workers = mp.cpu_count() - 1
+            max_workers = max(1, min(max_workers, self.options["nb_missions"]))
+
+            # Worker processes are forked where possible, so they get the loaded plugins.
+            context = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else None)
+            mission_options = dict(self.options["mission_options"], warm_start_solvers=False)
+            self._pool = context.Pool(
+                max_workers,
+                initializer=_init_mission_worker,
+                initargs=(mission_options, self._input_units, self.options["output_names"]),
             )
+            weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def _close_pool(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+
+# Mission problem of current worker process of ParallelMissionRuns, as a tuple
+# (mission options, input units, output names, problem). Problem is built at first run.
+_WORKER_DATA: Optional[Tuple[dict, Dict[str, Optional[str]], List[str], Optional[om.Problem]]] = (
+    None
+)
+
+
+def _init_mission_worker(
+    mission_options: dict, input_units: Dict[str, Optional[str]], output_names: List[str]
+):
+    global _WORKER_DATA  # pylint: disable=global-statement
+    _WORKER_DATA = (mission_options, input_units, output_names, None)
+
+
+def _run_mission(input_values: Dict[str, np.ndarray]) -> Tuple[float, float]:
+    """
+    Runs a mission in a worker process of ParallelMissionRuns.
+
+    :param input_values: values of mission inputs
+    :return: range in m and duration in s
+    """
+    global _WORKER_DATA  # pylint: disable=global-statement
+    mission_options, input_units, output_names, problem = _WORKER_DATA
+
+    if problem is None:
+        # Input shapes are known only now, so the problem is built at first run.
+        problem = om.Problem(reports=False)
+        ivc = problem.model.add_subsystem("inputs", om.IndepVarComp(), promotes=["*"])
+        for name, value in input_values.items():
+            ivc.add_output(name, value, units=input_units[name])
+        problem.model.add_subsystem("mission", MissionComp(**mission_options), promotes=["*"])
+        problem.setup()
+        _WORKER_DATA = (mission_options, input_units, output_names, problem)
+
+    for name, value in input_values.items():
+        problem[name] = value
+    # Outputs are reset, because some of them are not computed in some cases (e.g. with zero
+    # block fuel), and results must not depend on previous missions of the worker.
+    for name in problem.model.mission.get_io_metadata("output"):
+        problem[f"mission.{name}"] = 0.0
+    problem.run_model()
+
+    range_name, duration_name = output_names
+    return (
+        problem.get_val(range_name, units="m").item(),
+        problem.get_val(duration_name, units="s").item(),
+    )
+
+
+class ClosedFormMissionRuns(MultiMissionComp):
+    """
+    Computes range and duration of several missions that differ only by block fuel and
+    takeoff weight.
+
+    If the mission can be computed in closed form (see
+    :class:`~fastoad.models.performances.mission.breguet_mission.BreguetMissionEvaluator`),
+    all missions are computed at once without simulation. Otherwise, missions are simulated
+    one after the other, as in :class:`MultiMissionComp`.
+
+    Outputs of the mission are not outputs of this component. Outputs are "range" and
+    "duration", with one value per mission.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._mission_output_names = []
+        self._is_mission_setup = False
+
+    def setup(self):
+        self._mission_output_names = []
+        self._is_mission_setup = True
+        super().setup()
+        self._is_mission_setup = False
+
+        self.add_output("range", units="m")
+        self.add_output("duration", units="s")
+
+    def add_output(self, name, val=1.0, shape=None, **kwargs):
+        if self._is_mission_setup:
+            self._mission_output_names.append(name)
+            return None
+        return super().add_output(name, val, shape=shape, **kwargs)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        block_fuel_name = f"{self.variable_prefix}:{self.mission_name}:block_fuel"
+        route_name = f"{self.variable_prefix}:{self.mission_name}:{self.first_route_name}"
+
+        first_mission_inputs = self._get_mission_inputs(inputs, 0)
+        self._mission_wrapper.propulsion = self._engine_wrapper.get_model(first_mission_inputs)
+        self._mission_wrapper.reference_area = inputs[self.options["reference_area_variable"]]
+        mission = self._mission_wrapper.build(first_mission_inputs, self.mission_name)
+
+        if BreguetMissionEvaluator.is_applicable(mission):
+            start_flight_point = FlightPoint(altitude=0.0, true_airspeed=0.0)
+            outputs["range"], outputs["duration"] = BreguetMissionEvaluator(mission).compute(
+                start_flight_point,
+                inputs[self._input_weight_variable_name],
+                inputs[block_fuel_name],
+            )
+            return
+
+        for i in range(self.options["nb_missions"]):
+            mission_outputs = {name: 0.0 for name in self._mission_output_names}
+            self._compute_mission(
+                self._get_mission_inputs(inputs, i), mission_outputs, warm_start=False
+            )
+            outputs["range"][i] = np.asarray(mission_outputs[f"{route_name}:distance"]).item()
+            outputs["duration"][i] = np.asarray(mission_outputs[f"{route_name}:duration"]).item()
+
+
+class PayloadRangeGridResults(om.ExplicitComponent):
+    """
+    Gathers range and duration of grid missions, followed by the ones of the 2 MTOW points
+    of the payload-range contour.
+    """
+
+    def initialize(self):
+        self.options.declare("nb_missions", types=int, lower=1, desc="Number of grid missions.")
+
+    def setup(self):
+        nb_missions = self.options["nb_missions"]
+        self.add_input("mission_range", np.nan, shape=(nb_missions,), units="m")
+        self.add_input("mission_duration", np.nan, shape=(nb_missions,), units="s")
+        self.add_input("contour_range", np.nan, shape=(2,), units="m")
+        self.add_input("contour_duration", np.nan, shape=(2,), units="s")
+
+        self.add_output("range", shape=(nb_missions + 2,), units="m")
+        self.add_output("duration", shape=(nb_missions + 2,), units="s")
+
+    def setup_partials(self):
+        nb_missions = self.options["nb_missions"]
+        for name in ["range", "duration"]:
+            self.declare_partials(
+                name,
+                f"mission_{name}",
+                rows=np.arange(nb_missions),
+                cols=np.arange(nb_missions),
+                val=1.0,
+            )
+            self.declare_partials(
+                name,
+                f"contour_{name}",
+                rows=np.arange(nb_missions, nb_missions + 2),
+                cols=np.arange(2),
+                val=1.0,
+            )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        for name in ["range", "duration"]:
+            outputs[name] = np.concatenate([inputs[f"mission_{name}"], inputs[f"contour_{name}"]])
 
 
 class PayloadRangeContourInputValues(
@@ -534,6 +898,304 @@ class PayloadRangeGridInputValues(om.ExplicitComponent, BaseMissionComp, NeedsOW
         return takeoff_weight_at_max_fuel_weight
 
 
+class PayloadRangeAdaptiveGrid(MissionComp, NeedsOWE):
+    """
+    Computes points inside the contour of the payload-range diagram, with adaptive sampling.
+
+    A coarse Latin Hypercube Sample (one third of the points) is computed first. Then, range
+    and specific burned fuel are interpolated over (payload, block fuel) from the computed
+    points and the contour points, and points are added one by one where the interpolation
+    error is estimated to be the largest. This error is estimated as the difference between
+    a linear interpolation and a thin-plate spline interpolation.
+
+    Missions are computed inside this component, because each new point depends on the
+    results of the previous ones. Outputs are the same as the ones of
+    :class:`PayloadRangeGridInputValues` and of the associated mission computations. If
+    the tolerance is reached before `nb_points` missions are computed, the unused grid
+    points are set to NaN.
+    """
+
+    #: Number of candidate points for adaptive sampling, along each axis.
+    nb_candidates_per_axis = 21
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._contour_names = None
+        self._grid_names = None
+        self._sampled_input_names = []
+        self._mission_output_names = []
+        self._is_mission_setup = False
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare(
+            "nb_points",
+            default=20,
+            types=int,
+            lower=1,
+            desc="Maximum number of computed points inside the contour.",
+        )
+        self.options.declare(
+            "PR_variable_prefix",
+            default="data:payload_range",
+            types=str,
+            desc="How auto-generated names of payload-range variables should begin.",
+        )
+        self.options.declare(
+            "random_seed",
+            default=None,
+            types=int,
+            allow_none=True,
+            desc="Used as random state for initializing the Latin Hypercube Sampling "
+            "algorithm for generating the initial points.",
+        )
+        self.options.declare(
+            "lhs_criterion",
+            default="maximin",
+            types=str,
+            allow_none=True,
+            desc="Criterion for the Latin Hypercube Sampling algorithm, as asked by pyDOE2.lhs.",
+        )
+        self.options.declare(
+            "min_payload_ratio",
+            default=0.3,
+            lower=0.0,
+            upper=0.9,
+            desc="Sets the minimum payload for inner grid points, as a ratio w.r.t. max payload.",
+        )
+        self.options.declare(
+            "min_block_fuel_ratio",
+            default=0.3,
+            lower=0.0,
+            upper=0.9,
+            desc="Sets the minimum block fuel for inner grid points, as a ratio w.r.t. max "
+            "possible fuel weight for the current payload.",
+        )
+        self.options.declare(
+            "tolerance",
+            default=0.0,
+            lower=0.0,
+            desc="When the estimated relative interpolation error gets below this value, no "
+            "more point is computed, and the remaining grid points are set to NaN.",
+        )
+
+    def setup(self):
+        self._contour_names = _VariableNamer(
+            self.options["PR_variable_prefix"], self.mission_name, grid=False
+        )
+        self._grid_names = _VariableNamer(
+            self.options["PR_variable_prefix"], self.mission_name, grid=True
+        )
+        nb_points = self.options["nb_points"]
+
+        # Block fuel and TOW of missions are provided by the sampling, and outputs of the
+        # mission are not outputs of this component (see add_input() and add_output()).
+        self._sampled_input_names = [
+            f"{self.variable_prefix}:{self.mission_name}:block_fuel",
+            self._mission_wrapper.get_input_weight_variable_name(self.mission_name),
+        ]
+        self._mission_output_names = []
+        self._is_mission_setup = True
+        super().setup()
+        self._is_mission_setup = False
+
+        for name, units in [
+            ("payload", "kg"),
+            ("block_fuel", "kg"),
+            ("range", "m"),
+            ("duration", "s"),
+        ]:
+            self.add_input(
+                self._contour_names.get_variable_name(name),
+                val=np.nan,
+                shape_by_conn=True,
+                units=units,
+            )
+        self.add_input(self.options["OWE_variable"], val=np.nan, units="kg")
+        self.add_input(
+            self.name_provider.CONSUMED_FUEL_BEFORE_INPUT_WEIGHT.value, val=np.nan, units="kg"
+        )
+
+        self.add_output(self._grid_names.payload, shape=(nb_points + 2,), units="kg")
+        self.add_output(self._grid_names.block_fuel, shape=(nb_points + 2,), units="kg")
+        self.add_output(self._grid_names.TOW, shape=(nb_points + 2,), units="kg")
+        self.add_output(self._grid_names.range, shape=(nb_points + 2,), units="m")
+        self.add_output(self._grid_names.duration, shape=(nb_points + 2,), units="s")
+
+    def add_input(self, name, val=1.0, **kwargs):
+        if self._is_mission_setup and name in self._sampled_input_names:
+            return None
+        return super().add_input(name, val, **kwargs)
+
+    def add_output(self, name, val=1.0, **kwargs):
+        if self._is_mission_setup:
+            self._mission_output_names.append(name)
+            return None
+        return super().add_output(name, val, **kwargs)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        nb_points = self.options["nb_points"]
+        min_payload_ratio = self.options["min_payload_ratio"]
+        min_block_fuel_ratio = self.options["min_block_fuel_ratio"]
+
+        contour_payload = inputs[self._contour_names.payload]
+        contour_block_fuel = inputs[self._contour_names.block_fuel]
+        contour_range = inputs[self._contour_names.range]
+        contour_duration = inputs[self._contour_names.duration]
+
+        max_payload = contour_payload[0]
+        get_max_block_fuel = interp1d(contour_payload[1:], contour_block_fuel[1:])
+
+        def get_payload_and_block_fuel(unit_points):
+            """Converts points of the unit square in (payload, block fuel) values."""
+            payload = (min_payload_ratio + (1.0 - min_payload_ratio) * unit_points[:, 1]) * (
+                max_payload
+            )
+            block_fuel = (
+                min_block_fuel_ratio + (1.0 - min_block_fuel_ratio) * unit_points[:, 0]
+            ) * get_max_block_fuel(payload)
+            return payload, block_fuel
+
+        # Initial sample
+        nb_initial_points = min(nb_points, max(3, int(np.ceil(nb_points / 3))))
+        lhs_grid = lhs(
+            2,
+            criterion=self.options["lhs_criterion"],
+            samples=nb_initial_points,
+            random_state=self.options["random_seed"],
+        )
+        payload_values, block_fuel_values = get_payload_and_block_fuel(lhs_grid)
+        range_values, duration_values = self._compute_missions(
+            inputs, payload_values, block_fuel_values
+        )
+
+        # Candidate points for adaptive sampling
+        axis = np.linspace(0.0, 1.0, self.nb_candidates_per_axis)
+        candidate_payloads, candidate_block_fuels = get_payload_and_block_fuel(
+            np.array(np.meshgrid(axis, axis)).reshape(2, -1).T
+        )
+
+        # For the same reason as for known points below, candidates with null payload or
+        # null block fuel are discarded.
+        is_valid_candidate = (candidate_payloads > 0.0) & (candidate_block_fuels > 0.0)
+        candidate_payloads = candidate_payloads[is_valid_candidate]
+        candidate_block_fuels = candidate_block_fuels[is_valid_candidate]
+
+        # Data are scaled so that they are of the order of 1.
+        scale_factors = np.array([max_payload, np.max(contour_block_fuel)])
+        candidates = np.column_stack([candidate_payloads, candidate_block_fuels]) / scale_factors
+        min_distance = 0.5 / np.sqrt(nb_points + 1)
+
+        while len(payload_values) < nb_points:
+            points = np.column_stack(
+                [
+                    np.concatenate([payload_values, contour_payload]),
+                    np.concatenate([block_fuel_values, contour_block_fuel]),
+                ]
+            )
+            ranges = np.concatenate([range_values, contour_range])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.column_stack([ranges, points[:, 1] / ranges / points[:, 0]])
+
+            # Points with null payload, block fuel or range (e.g. some contour points, or
+            # inner points if min_payload_ratio or min_block_fuel_ratio is 0) have no
+            # specific burned fuel, and are not used for interpolation.
+            is_valid_point = np.all(np.isfinite(values), axis=1) & np.all(points > 0.0, axis=1)
+            points /= scale_factors
+            values = values[is_valid_point] / np.max(np.abs(values[is_valid_point]), axis=0)
+
+            estimated_errors = self._estimate_interpolation_errors(
+                points[is_valid_point], values, candidates
+            )
+            distances = np.min(
+                np.linalg.norm(candidates[:, np.newaxis, :] - points[np.newaxis, :, :], axis=-1),
+                axis=1,
+            )
+            estimated_errors[distances < min_distance] = 0.0
+
+            i_max = np.argmax(estimated_errors)
+            if estimated_errors[i_max] <= self.options["tolerance"]:
+                break
+
+            new_range, new_duration = self._compute_missions(
+                inputs, candidate_payloads[[i_max]], candidate_block_fuels[[i_max]]
+            )
+            payload_values = np.append(payload_values, candidate_payloads[i_max])
+            block_fuel_values = np.append(block_fuel_values, candidate_block_fuels[i_max])
+            range_values = np.append(range_values, new_range)
+            duration_values = np.append(duration_values, new_duration)
+
+        nb_computed_points = len(payload_values)
+        _LOGGER.info(
+            "Adaptive payload-range grid: %d missions computed (%d allowed).",
+            nb_computed_points,
+            nb_points,
+        )
+
+        # Remaining points, if any, are marked as unused with NaN values, then the 2 MTOW
+        # points of the contour are added.
+        padding = np.full(nb_points - nb_computed_points, np.nan)
+        outputs[self._grid_names.payload] = np.concatenate(
+            [payload_values, padding, contour_payload[1:3]]
+        )
+        outputs[self._grid_names.block_fuel] = np.concatenate(
+            [block_fuel_values, padding, contour_block_fuel[1:3]]
+        )
+        outputs[self._grid_names.range] = np.concatenate(
+            [range_values, padding, contour_range[1:3]]
+        )
+        outputs[self._grid_names.duration] = np.concatenate(
+            [duration_values, padding, contour_duration[1:3]]
+        )
+        outputs[self._grid_names.TOW] = self._calculate_takeoff_weight(
+            inputs,
+            outputs[self._grid_names.payload],
+            outputs[self._grid_names.block_fuel],
+        )
+
+    def _compute_missions(self, inputs, payload_values, block_fuel_values):
+        """
+        :return: range and duration of missions for provided payload and block fuel values
+        """
+        block_fuel_name, tow_name = self._sampled_input_names
+        range_name = f"{self.variable_prefix}:{self.mission_name}:{self.first_route_name}"
+        tow_values = self._calculate_takeoff_weight(inputs, payload_values, block_fuel_values)
+
+        range_values = np.empty_like(payload_values)
+        duration_values = np.empty_like(payload_values)
+        for i, (block_fuel, tow) in enumerate(zip(block_fuel_values, tow_values)):
+            mission_inputs = dict(inputs.items())
+            mission_inputs[block_fuel_name] = np.array([block_fuel])
+            mission_inputs[tow_name] = np.array([tow])
+            mission_outputs = {name: 0.0 for name in self._mission_output_names}
+            self._compute_mission(mission_inputs, mission_outputs, warm_start=False)
+            range_values[i] = np.asarray(mission_outputs[f"{range_name}:distance"]).item()
+            duration_values[i] = np.asarray(mission_outputs[f"{range_name}:duration"]).item()
+
+        return range_values, duration_values
+
+    @staticmethod
+    def _estimate_interpolation_errors(points, values, candidates) -> np.ndarray:
+        """
+        :param points: known points, as an (n, 2) array
+        :param values: known values, as an (n, m) array
+        :param candidates: points where error is estimated, as an (p, 2) array
+        :return: the maximum estimated error among the m values, for each candidate point
+        """
+        linear_values = LinearNDInterpolator(points, values)(candidates)
+        # Outside the convex hull of known points, nearest values are used.
+        is_outside = np.isnan(linear_values[:, 0])
+        linear_values[is_outside] = NearestNDInterpolator(points, values)(candidates[is_outside])
+        spline_values = RBFInterpolator(points, values, kernel="thin_plate_spline")(candidates)
+        return np.max(np.abs(spline_values - linear_values), axis=1)
+
+    def _calculate_takeoff_weight(self, inputs, payload, block_fuel):
+        fuel_at_takeoff = (
+            block_fuel - inputs[self.name_provider.CONSUMED_FUEL_BEFORE_INPUT_WEIGHT.value].item()
+        )
+        return fuel_at_takeoff + payload + inputs[self.options["OWE_variable"]].item()
+
+
 @dataclass
 class _VariableNamer:
     """Provides variable names."""
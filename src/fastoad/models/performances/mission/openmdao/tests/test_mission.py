@@ -13,17 +13,20 @@
 
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from numpy.testing import assert_allclose
 from scipy.constants import foot, knot, nautical_mile
 
 from fastoad.io import DataFile
+from fastoad.openmdao.variables import Variable
 from fastoad.testing import run_system
 
 from ..mission import OMMission
 from ..mission_run import AdvancedMissionComp
 from ..mission_wrapper import MissionWrapper
+from ...mission import Mission
 from ...mission_definition.exceptions import FastMissionFileMissingMissionNameError
 
 DATA_FOLDER_PATH = Path(__file__).parent / "data"
@@ -355,7 +358,8 @@ def test_mission_group_breguet_with_fuel_adjustment(cleanup, with_dummy_plugin_2
     assert_allclose(problem["data:mission:operational:needed_block_fuel"], 5449.0, atol=1.0)
 
 
-def test_mission_group_with_fuel_objective(cleanup, with_dummy_plugin_2):
+@pytest.mark.parametrize("solve_routes_jointly", [False, True])
+def test_mission_group_with_fuel_objective(cleanup, with_dummy_plugin_2, solve_routes_jointly):
     input_file_path = DATA_FOLDER_PATH / "test_mission.xml"
     vars = DataFile(input_file_path)
     ivc = vars.to_ivc()
@@ -371,6 +375,7 @@ def test_mission_group_with_fuel_objective(cleanup, with_dummy_plugin_2):
             adjust_fuel=False,
             compute_input_weight=True,
             reference_area_variable="data:geometry:aircraft:reference_area",
+            solve_routes_jointly=solve_routes_jointly,
         ),
         ivc,
     )
@@ -487,3 +492,61 @@ def test_mission_group_without_route(cleanup, with_dummy_plugin_2):
     assert_allclose(problem["data:mission:without_route:ZFW"], 55000.0, atol=1.0)
     assert_allclose(problem["data:mission:without_route:needed_block_fuel"], 1136.8, atol=1.0)
     assert_allclose(problem["data:mission:without_route:block_fuel"], 1136.8, atol=1.0)
+
+
+def test_mission_component_sparse_partials(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_mission.xml"
+    input_vars = DataFile(input_file_path)
+    input_vars.append(Variable("data:mission:without_route:TOW", val=70000.0, units="kg"))
+
+    def get_problem(use_sparse_partials):
+        return run_system(
+            AdvancedMissionComp(
+                propulsion_id="test.wrapper.propulsion.dummy_engine",
+                use_initializer_iteration=False,
+                mission_file_path=DATA_FOLDER_PATH / "test_mission.yml",
+                mission_name="without_route",
+                reference_area_variable="data:geometry:aircraft:reference_area",
+                use_sparse_partials=use_sparse_partials,
+            ),
+            input_vars,
+        )
+
+    problem = get_problem(True)
+
+    output_dependencies = problem.model.component._mission_wrapper.get_output_dependencies()
+    initial_climb_dependencies = output_dependencies[
+        "data:mission:without_route:initial_climb:fuel"
+    ]
+    climb_dependencies = output_dependencies["data:mission:without_route:climb:fuel"]
+    assert "data:aerodynamics:aircraft:takeoff:CD" in initial_climb_dependencies
+    assert "data:aerodynamics:aircraft:cruise:CD" not in initial_climb_dependencies
+    assert "data:aerodynamics:aircraft:cruise:CD" in climb_dependencies
+    assert (
+        "data:mission:without_route:TOW"
+        in output_dependencies["data:mission:without_route:taxi_out:fuel"]
+    )
+
+    # Under finite differences, a perturbation of the cruise polar leads to recomputing
+    # only the flight parts from the climb phase.
+    cruise_cd = problem["data:aerodynamics:aircraft:cruise:CD"] * 1.01
+    problem["data:aerodynamics:aircraft:cruise:CD"] = cruise_cd
+    problem.model.component._set_finite_difference_mode(True)
+    with patch.object(
+        Mission, "resume_from", autospec=True, side_effect=Mission.resume_from
+    ) as resume_from:
+        problem.run_model()
+    assert resume_from.called
+    assert all(call.args[2] == 4 for call in resume_from.call_args_list)
+
+    reference_problem = get_problem(False)
+    reference_problem["data:aerodynamics:aircraft:cruise:CD"] = cruise_cd
+    reference_problem.run_model()
+
+    for name in output_dependencies:
+        assert_allclose(problem[name], reference_problem[name], rtol=1.0e-12, err_msg=name)
+    assert_allclose(
+        problem["data:mission:without_route:needed_block_fuel"],
+        reference_problem["data:mission:without_route:needed_block_fuel"],
+        rtol=1.0e-12,
+    )
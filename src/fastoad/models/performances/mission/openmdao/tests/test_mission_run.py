@@ -21,7 +21,7 @@ from scipy.constants import nautical_mile
 from fastoad.io import DataFile
 from fastoad.testing import run_system
 
-from ..mission_run import MissionComp
+from ..mission_run import MissionComp, MultiMissionComp
 
 DATA_FOLDER_PATH = Path(__file__).parent / "data"
 RESULTS_FOLDER_PATH = Path(__file__).parent / "results" / Path(__file__).stem
@@ -98,3 +98,108 @@ def test_mission_run(cleanup, with_dummy_plugin_2):
         problem["data:payload_range:operational:distance"], 2000.0 * nautical_mile, atol=500.0
     )
     assert_allclose(problem["data:payload_range:operational:duration"], 16573.0, atol=10.0)
+
+
+def test_mission_run_warm_start(cleanup, with_dummy_plugin_2, monkeypatch):
+    input_file_path = DATA_FOLDER_PATH / "test_mission_run.xml"
+    input_data = DataFile(input_file_path)
+    options = dict(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path=DATA_FOLDER_PATH / "test_mission.yml",
+        mission_name="operational",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        variable_prefix="data:payload_range",
+        warm_start_solvers=True,
+    )
+    distance_name = "data:payload_range:operational:main_route:cruise:distance"
+    tow_name = "data:payload_range:operational:TOW"
+
+    problem = run_system(MissionComp(**options), input_data.to_ivc())
+    solver_states = problem.model.component._mission_wrapper._solver_states
+    assert solver_states
+    solution = solver_states["operational:main_route"].solution.copy()
+    cold_start_distance = problem[distance_name].item()
+    cold_start_evaluation_count = solver_states["operational:main_route"].evaluation_count
+
+    # Solvers are not warm-started for finite differences, and their solution is not kept.
+    with monkeypatch.context() as m:
+        m.setattr(problem.model.component, "under_finite_difference", True)
+        problem[tow_name] += 1.0
+        problem.run_model()
+        problem[tow_name] -= 1.0
+    assert_allclose(solver_states["operational:main_route"].solution, solution, rtol=0.0)
+
+    problem.run_model()
+    assert solver_states["operational:main_route"].evaluation_count < 3
+    assert_allclose(problem[distance_name], cold_start_distance, rtol=1.0e-6)
+
+    # After reset, next computation is cold-started.
+    problem.model.component.reset_mission_state()
+    assert not solver_states
+    problem.run_model()
+    assert solver_states["operational:main_route"].evaluation_count == cold_start_evaluation_count
+    assert_allclose(problem[distance_name], cold_start_distance, rtol=1.0e-12)
+
+    # Missions of a multi-mission component are never warm-started.
+    input_data[tow_name] = dict(val=[70000.0, 75000.0], units="kg")
+    problem = run_system(
+        MultiMissionComp(**options, nb_missions=2, varying_inputs=["TOW"]), input_data.to_ivc()
+    )
+    assert not problem.model.component._mission_wrapper._solver_states
+
+
+def test_mission_run_reuse_descent_phases(cleanup, with_dummy_plugin_2):
+    ivc = DataFile(DATA_FOLDER_PATH / "test_mission_run.xml").to_ivc()
+    options = dict(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path=DATA_FOLDER_PATH / "test_mission.yml",
+        mission_name="operational",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        variable_prefix="data:payload_range",
+    )
+
+    ref_problem = run_system(MissionComp(**options), ivc)
+    problem = run_system(MissionComp(**options, reuse_descent_phases=True), ivc)
+
+    # Routes are solved within the accuracy of route solvers (0.5 km).
+    for name in ["main_route:distance", "main_route:cruise:distance", "distance"]:
+        assert_allclose(
+            problem[f"data:payload_range:operational:{name}"],
+            ref_problem[f"data:payload_range:operational:{name}"],
+            atol=500.0,
+        )
+    assert_allclose(
+        problem["data:payload_range:operational:needed_block_fuel"],
+        ref_problem["data:payload_range:operational:needed_block_fuel"],
+        rtol=1.0e-3,
+    )
+
+
+def test_multi_mission_run(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_mission_run.xml"
+    tow_values = [70000.0, 65000.0, 75000.0]
+    options = dict(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path=DATA_FOLDER_PATH / "test_mission.yml",
+        mission_name="operational",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        variable_prefix="data:payload_range",
+    )
+
+    input_data = DataFile(input_file_path)
+    input_data["data:payload_range:operational:TOW"] = dict(val=tow_values, units="kg")
+    problem = run_system(
+        MultiMissionComp(**options, nb_missions=3, varying_inputs=["TOW"]), input_data
+    )
+    assert len(problem.model.component.flight_points.index.unique("mission")) == 3
+
+    for i, tow in enumerate(tow_values):
+        input_data["data:payload_range:operational:TOW"] = dict(val=tow, units="kg")
+        ref_problem = run_system(MissionComp(**options), input_data)
+        for name in [
+            "data:payload_range:operational:main_route:cruise:fuel",
+            "data:payload_range:operational:needed_block_fuel",
+            "data:payload_range:operational:distance",
+            "data:payload_range:operational:duration",
+        ]:
+            assert_allclose(problem[name][i], ref_problem[name].item(), rtol=1.0e-10)
@@ -21,6 +21,7 @@ from fastoad.io import DataFile
 from fastoad.testing import run_system
 
 from ..payload_range import PayloadRange
+from ...breguet_mission import BreguetMissionEvaluator
 
 DATA_FOLDER_PATH = Path(__file__).parent / "data"
 RESULTS_FOLDER_PATH = Path(__file__).parent / "results" / Path(__file__).stem
@@ -189,3 +190,143 @@ def test_payload_range_sizing_mission(cleanup, with_dummy_plugin_2):
         [1.463138e-4, 1.12571e-4, 1.05282e-4, 1.18153e-4],
         rtol=1.0e-4,
     )
+
+
+def test_payload_range_with_process_pool(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_payload_range.xml"
+    ivc = DataFile(input_file_path).to_ivc()
+
+    options = dict(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path=DATA_FOLDER_PATH / "test_payload_range.yml",
+        mission_name="operational",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        nb_contour_points=5,
+        nb_grid_points=4,
+        grid_random_seed=0,
+        grid_lhs_criterion="center",
+    )
+    ref_problem = run_system(PayloadRange(**options), ivc)
+    problem = run_system(PayloadRange(**options, max_workers=2), ivc)
+    problem_3 = run_system(PayloadRange(**options, max_workers=3), ivc)
+
+    for name in ["range", "duration", "grid:range", "grid:duration", "grid:specific_burned_fuel"]:
+        # Results do not depend on the number of workers
+        assert_allclose(
+            problem[f"data:payload_range:operational:{name}"],
+            problem_3[f"data:payload_range:operational:{name}"],
+            rtol=0.0,
+        )
+        # Results are the same as with serial computation
+        assert_allclose(
+            problem[f"data:payload_range:operational:{name}"],
+            ref_problem[f"data:payload_range:operational:{name}"],
+            rtol=1.0e-10,
+        )
+
+
+def test_payload_range_adaptive_grid(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_payload_range.xml"
+    ivc = DataFile(input_file_path).to_ivc()
+
+    options = dict(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path=DATA_FOLDER_PATH / "test_payload_range.yml",
+        mission_name="operational",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        nb_contour_points=4,
+        nb_grid_points=6,
+        grid_random_seed=0,
+        grid_lhs_criterion="center",
+        grid_sampling="adaptive",
+    )
+    problem = run_system(PayloadRange(**options), ivc)
+
+    payload = problem["data:payload_range:operational:grid:payload"]
+    block_fuel = problem["data:payload_range:operational:grid:block_fuel"]
+    range_ = problem.get_val("data:payload_range:operational:grid:range", "km")
+    assert len(payload) == len(block_fuel) == len(range_) == 8
+
+    # Last 2 points are the MTOW points of the contour.
+    assert_allclose(payload[-2:], [19000.0, 15300.0])
+    assert_allclose(block_fuel[-2:], [11300.0, 15000.0])
+    assert_allclose(range_[-2:], [6745.0, 9594.0], atol=0.5)
+
+    # Other points are inside the contour, and all different.
+    assert np.all(payload[:-2] >= 0.3 * 19000.0)
+    assert np.all(block_fuel[:-2] <= 15000.0)
+    assert np.all(range_[:-2] < problem.get_val("data:payload_range:operational:range", "km")[-1])
+    assert len(np.unique(np.column_stack([payload[:-2], block_fuel[:-2]]), axis=0)) == 6
+
+    # With a high tolerance, only initial points are computed, and other points are unused.
+    problem = run_system(PayloadRange(**options, grid_tolerance=1.0), ivc)
+    payload = problem["data:payload_range:operational:grid:payload"]
+    block_fuel = problem["data:payload_range:operational:grid:block_fuel"]
+    assert len(np.unique(np.column_stack([payload[:3], block_fuel[:3]]), axis=0)) == 3
+    assert np.all(np.isnan(payload[3:-2]))
+    assert np.all(np.isnan(block_fuel[3:-2]))
+    assert np.all(np.isnan(problem["data:payload_range:operational:grid:range"][3:-2]))
+    assert np.all(np.isnan(problem["data:payload_range:operational:grid:TOW"][3:-2]))
+
+    # Points with null payload or null block fuel are not used for interpolation.
+    problem = run_system(
+        PayloadRange(**options, min_payload_ratio=0.0, min_block_fuel_ratio=0.0), ivc
+    )
+    payload = problem["data:payload_range:operational:grid:payload"]
+    block_fuel = problem["data:payload_range:operational:grid:block_fuel"]
+    assert np.all(payload[:-2] > 0.0)
+    assert np.all(block_fuel[:-2] > 0.0)
+    assert len(np.unique(np.column_stack([payload[:-2], block_fuel[:-2]]), axis=0)) == 6
+
+
+def test_payload_range_closed_form(cleanup, with_dummy_plugin_2, monkeypatch):
+    input_file_path = DATA_FOLDER_PATH / "test_payload_range.xml"
+    ivc = DataFile(input_file_path).to_ivc()
+
+    options = dict(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path="::sizing_breguet",
+        mission_name="sizing",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        nb_contour_points=5,
+        nb_grid_points=6,
+        grid_random_seed=0,
+        grid_lhs_criterion="center",
+    )
+
+    evaluated_mission_counts = []
+    original_compute = BreguetMissionEvaluator.compute
+
+    def compute(self, start, takeoff_weights, block_fuels):
+        evaluated_mission_counts.append(len(takeoff_weights))
+        return original_compute(self, start, takeoff_weights, block_fuels)
+
+    monkeypatch.setattr(BreguetMissionEvaluator, "compute", compute)
+
+    ref_problem = run_system(PayloadRange(**options), ivc)
+    assert evaluated_mission_counts == []
+
+    problem = run_system(PayloadRange(**options, closed_form_missions=True), ivc)
+    # All contour missions are evaluated at once, as well as all grid missions.
+    assert set(evaluated_mission_counts) == {5, 6}
+
+    for name in ["range", "duration", "grid:range", "grid:duration", "grid:specific_burned_fuel"]:
+        # Differences are within the accuracy of the mission solver
+        assert_allclose(
+            problem[f"data:payload_range:sizing:{name}"],
+            ref_problem[f"data:payload_range:sizing:{name}"],
+            rtol=3.0e-5,
+        )
+
+    # Missions that are not analytic are simulated.
+    options["mission_file_path"] = DATA_FOLDER_PATH / "test_payload_range.yml"
+    options["mission_name"] = "operational"
+    evaluated_mission_counts.clear()
+    ref_problem = run_system(PayloadRange(**options), ivc)
+    problem = run_system(PayloadRange(**options, closed_form_missions=True), ivc)
+    assert evaluated_mission_counts == []
+    for name in ["range", "duration", "grid:range", "grid:duration"]:
+        assert_allclose(
+            problem[f"data:payload_range:operational:{name}"],
+            ref_problem[f"data:payload_range:operational:{name}"],
+        )
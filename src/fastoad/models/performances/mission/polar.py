@@ -1,7 +1,7 @@
 """Aerodynamic polar data."""
 
 #  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
-#  Copyright (C) 2023 ONERA & ISAE-SUPAERO
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
 #  FAST is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
 #  the Free Software Foundation, either version 3 of the License, or
@@ -12,8 +12,13 @@
 #  GNU General Public License for more details.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_right
+from typing import Callable
+
+import numpy as np
 from numpy import ndarray
-from scipy.interpolate import interp1d
+from scipy.interpolate import PPoly, make_interp_spline
 from scipy.optimize import fmin
 
 
@@ -39,18 +44,15 @@ class Polar:
         self._definition_CD = cd
 
         # Interpolate cd
-        self._cd_vs_cl = interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")
+        self._cd_vs_cl = _PiecewisePolynomial.quadratic_spline(cl, cd)
 
         # CL as a function of AoA
         self._definition_alpha = alpha
         if alpha is not None:
-            self._cl_vs_alpha = interp1d(alpha, cl, kind="linear", fill_value="extrapolate")
-
-        def _negated_lift_drag_ratio(lift_coeff):
-            """Returns -CL/CD."""
-            return -lift_coeff / self.cd(lift_coeff)
+            self._cl_vs_alpha = _PiecewisePolynomial.linear(alpha, cl)
 
-        self._optimal_CL = fmin(_negated_lift_drag_ratio, cl[0], disp=0)
+        # Computed on first access
+        self._optimal_CL = None
 
     @property
     def definition_cl(self):
@@ -69,7 +71,9 @@ class Polar:
 
     @property
     def optimal_cl(self):
-        """The CL value that provides larger lift/drag ratio."""
+        """The CL value that provides larger lift/drag ratio, as a 1-element array."""
+        if self._optimal_CL is None:
+            self._optimal_CL = self._compute_optimal_cl()
         return self._optimal_CL
 
     def cd(self, cl=None):
@@ -95,3 +99,154 @@ class Polar:
             raise ValueError("Polar was instantiated without alpha vector.")
 
         return self._cl_vs_alpha(alpha)
+
+    def _compute_optimal_cl(self) -> ndarray:
+        def _negated_lift_drag_ratio(lift_coeff):
+            """Returns -CL/CD."""
+            return -lift_coeff / self.cd(lift_coeff)
+
+        return fmin(_negated_lift_drag_ratio, self._definition_CL[0], disp=0)
+
+
+class DeltaPolar:
+    """
+    Polar defined as a base polar plus an additive drag term.
+
+    For any CL value, CD = base_polar.cd(CL) + factor * delta_cd(CL).
+
+    This class provides the same interface as :class:`Polar`, but building an instance
+    costs nothing, as no interpolation is computed. It is intended for polar modifiers
+    that are called at each time step (see
+    :class:`~fastoad.models.performances.mission.polar_modifier.AbstractIncrementalPolarModifier`).
+
+    If delta_cd is a polynomial of degree 2 or less, results are identical to the ones of a
+    :class:`Polar` instance defined with modified CD values.
+    """
+
+    def __init__(self, base_polar: Polar, delta_cd: Callable, factor: float = 1.0):
+        """
+        :param base_polar: the polar that is modified
+        :param delta_cd: function that provides the additive drag term for CL value(s)
+        :param factor: the multiplier of delta_cd
+        """
+        self.base_polar = base_polar
+        self.delta_cd = delta_cd
+        self.factor = factor
+
+        # Computed on first access
+        self._optimal_CL = None
+
+    @property
+    def definition_cl(self):
+        """The vector that has been used for defining lift coefficient of base polar."""
+        return self.base_polar.definition_cl
+
+    @property
+    def definition_cd(self):
+        """The CD values of this polar for :attr:`definition_cl`."""
+        return self.cd()
+
+    @property
+    def definition_alpha(self):
+        """The vector that has been used for defining AoA of base polar."""
+        return self.base_polar.definition_alpha
+
+    @property
+    def optimal_cl(self):
+        """The CL value that provides larger lift/drag ratio, as a 1-element array."""
+        if self._optimal_CL is None:
+            self._optimal_CL = Polar(self.definition_cl, self.definition_cd).optimal_cl
+        return self._optimal_CL
+
+    def cd(self, cl=None):
+        """
+        Computes drag coefficient (CD) as the CD of base polar plus the additive term.
+
+        :param cl: lift coefficient (CL) values. If not provided, the CL definition vector will be
+                   used
+        :return: CD values for each provide CL values
+        """
+        if cl is None:
+            cl = self.definition_cl
+        return self.base_polar.cd(cl) + self.factor * self.delta_cd(cl)
+
+    def cl(self, alpha):
+        """
+        The lift coefficient corresponding to alpha (rad), as provided by base polar.
+
+        :param alpha: the angle of attack at which CL is evaluated
+        :return: CL value for each alpha.
+        """
+        return self.base_polar.cl(alpha)
+
+
+class _PiecewisePolynomial:
+    """
+    Piecewise polynomial function, extrapolated using the first and last polynomials.
+
+    Polynomial coefficients are stored in decreasing order of power. On interval i,
+    y = sum(coefficients[k, i] * (x - breakpoints[i]) ** (degree - k)).
+
+    Scalar evaluation uses only Python floats, which is much faster than NumPy for a single
+    value. Result is then returned as a 0-d array.
+    """
+
+    def __init__(self, breakpoints: ndarray, coefficients: ndarray):
+        self.breakpoints = breakpoints
+        self.coefficients = coefficients
+
+        # For scalar evaluation
+        self._breakpoint_list = breakpoints.tolist()
+        self._coefficient_lists = coefficients.T.tolist()
+
+    @classmethod
+    def quadratic_spline(cls, x, y) -> "_PiecewisePolynomial":
+        """
+        Provides the same interpolation as scipy.interpolate.interp1d with kind="quadratic".
+        """
+        x, y = cls._get_sorted(x, y)
+        ppoly = PPoly.from_spline(make_interp_spline(x, y, k=2, check_finite=False))
+
+        # Knots at bounds are repeated in spline definition. Matching intervals are removed.
+        idx = np.flatnonzero(np.diff(ppoly.x) > 0.0)
+        breakpoints = np.append(ppoly.x[idx], ppoly.x[idx[-1] + 1])
+        return cls(breakpoints, ppoly.c[:, idx])
+
+    @classmethod
+    def linear(cls, x, y) -> "_PiecewisePolynomial":
+        """
+        Provides the same interpolation as scipy.interpolate.interp1d with kind="linear".
+        """
+        x, y = cls._get_sorted(x, y)
+        slopes = np.diff(y) / np.diff(x)
+        return cls(x, np.array([slopes, y[:-1]]))
+
+    def __call__(self, x):
+        if isinstance(x, (float, int)) or np.ndim(x) == 0:
+            # As with interp1d, a 0-d array is returned for a scalar input.
+            return np.array(self._compute_scalar(float(x)))
+
+        x = np.asarray(x, dtype=float)
+        idx = np.searchsorted(self.breakpoints[1:-1], x, side="right")
+        u = x - self.breakpoints[idx]
+        coefficients = self.coefficients[:, idx]
+        y = coefficients[0]
+        for coefficient in coefficients[1:]:
+            y = y * u + coefficient
+        return y
+
+    def _compute_scalar(self, x: float) -> float:
+        idx = bisect_right(self._breakpoint_list, x, 1, len(self._breakpoint_list) - 1) - 1
+        u = x - self._breakpoint_list[idx]
+        coefficients = self._coefficient_lists[idx]
+        y = coefficients[0]
+        for coefficient in coefficients[1:]:
+            y = y * u + coefficient
+        return y
+
+    @staticmethod
+    def _get_sorted(x, y):
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        idx = np.argsort(x, kind="mergesort")
+        return x[idx], y[idx]
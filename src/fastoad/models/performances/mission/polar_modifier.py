@@ -1,6 +1,6 @@
 """Aerodynamics polar modifier."""
 #  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
-#  Copyright (C) 2023 ONERA & ISAE-SUPAERO
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
 #  FAST is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
 #  the Free Software Foundation, either version 3 of the License, or
@@ -13,12 +13,13 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Optional
 
 from fastoad.model_base.flight_point import FlightPoint
 
 from .base import RegisterElement
-from .polar import Polar
+from .polar import DeltaPolar, Polar
 
 
 @dataclass
@@ -36,6 +37,71 @@ class AbstractPolarModifier(ABC):
         """
 
 
+@dataclass
+class AbstractIncrementalPolarModifier(AbstractPolarModifier, ABC):
+    """
+    Base class for polar modifiers that add to the polar a drag term, scaled by a factor that
+    depends on flight conditions:
+
+        CD = polar.cd(CL) + factor(flight_point) * delta_cd(CL)
+
+    Modified polars are :class:`~fastoad.models.performances.mission.polar.DeltaPolar`
+    instances, that do not need any interpolation to be built.
+
+    If :meth:`get_memo_key` provides a key, modified polars are stored and reused for
+    flight points that provide the same key.
+    """
+
+    # Maximum number of stored modified polars
+    _MAX_MEMO_SIZE = 1000
+
+    _memo: Dict[Hashable, DeltaPolar] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def modify_polar(self, polar: Polar, flight_point: FlightPoint) -> DeltaPolar:
+        """
+        :param polar: an instance of Polar
+        :param flight_point: an intance of FlightPoint containg only floats
+        :return: the modified polar for the flight point
+        """
+        key = self.get_memo_key(flight_point)
+        if key is None:
+            return DeltaPolar(polar, self.delta_cd, self.get_factor(flight_point))
+
+        modified_polar = self._memo.get(key)
+        if modified_polar is None or modified_polar.base_polar is not polar:
+            if len(self._memo) >= self._MAX_MEMO_SIZE:
+                self._memo.clear()
+            modified_polar = DeltaPolar(polar, self.delta_cd, self.get_factor(flight_point))
+            self._memo[key] = modified_polar
+
+        return modified_polar
+
+    @abstractmethod
+    def delta_cd(self, cl):
+        """
+        :param cl: lift coefficient value(s)
+        :return: the drag term to be added to polar CD, before applying factor
+        """
+
+    @abstractmethod
+    def get_factor(self, flight_point: FlightPoint) -> float:
+        """
+        :param flight_point: an intance of FlightPoint containg only floats
+        :return: the multiplier of :meth:`delta_cd` for provided flight point
+        """
+
+    def get_memo_key(self, flight_point: FlightPoint) -> Optional[Hashable]:
+        """
+        Default implementation returns None, meaning that modified polars are not memoized.
+
+        :param flight_point: an intance of FlightPoint containg only floats
+        :return: a key such that flight points with same key get the same modified polar
+        """
+        return None
+
+
 class RegisterPolarModifier(RegisterElement, base_class=AbstractPolarModifier):
     """
     Decorator for registering AbstractPolarModifier classes.
@@ -68,7 +134,7 @@ class UnchangedPolar(AbstractPolarModifier):
 
 @RegisterPolarModifier("ground_effect_raymer")
 @dataclass
-class GroundEffectRaymer(AbstractPolarModifier):
+class GroundEffectRaymer(AbstractIncrementalPolarModifier):
     """
     Evaluates the drag in ground effect, using Raymer's model:
         'Aircraft Design A conceptual approach', D. Raymer p304
@@ -92,36 +158,42 @@ class GroundEffectRaymer(AbstractPolarModifier):
     #: Altitude of ground w.r.t. sea level
     ground_altitude: float = 0.0
 
-    def modify_polar(self, polar: Polar, flight_point: FlightPoint) -> Polar:
+    #: If strictly positive, height above ground is rounded to a multiple of this value, and
+    #: modified polars are reused for a same rounded height.
+    height_step: float = 0.0
+
+    def delta_cd(self, cl):
+        """
+        :param cl: lift coefficient value(s)
+        :return: induced drag at provided CL
         """
-        Compute the ground effect based on altitude from ground and return an updated polar
+        return self.induced_drag_coefficient * self.k_winglet * self.k_cd * cl**2
+
+    def get_factor(self, flight_point: FlightPoint) -> float:
+        """
+        Compute the ground effect based on altitude from ground.
 
-        :param polar: a Polar instance used as basis to apply ground effect
         :param flight_point: a flight point containing the flight conditions
         for calculation of ground effect
-        :return: a copy of polar with ground effect
+        :return: the (negative) variation ratio of induced drag due to ground effect
         """
-
-        h_b = (
-            self.span * 0.1
-            + self.landing_gear_height
-            + flight_point.altitude
-            - self.ground_altitude
-        ) / self.span
+        height = self._get_height(flight_point)
+        h_b = (self.span * 0.1 + self.landing_gear_height + height) / self.span
         k_ground = 33.0 * h_b**1.5 / (1 + 33.0 * h_b**1.5)
-        cd_ground = (
-            self.induced_drag_coefficient
-            * polar.definition_cl**2
-            * self.k_winglet
-            * self.k_cd
-            * (k_ground - 1)
-        )
-
-        # Update polar interpolation
-        modified_polar = Polar(
-            polar.definition_cl,
-            polar.definition_cd + cd_ground,
-            polar.definition_alpha,
-        )
-
-        return modified_polar
+        return k_ground - 1
+
+    def get_memo_key(self, flight_point: FlightPoint) -> Optional[Hashable]:
+        if self.height_step > 0.0:
+            return (
+                self._get_height(flight_point),
+                self.span,
+                self.landing_gear_height,
+            )
+        return None
+
+    def _get_height(self, flight_point: FlightPoint) -> float:
+        """Height above ground, rounded according to :attr:`height_step`."""
+        height = flight_point.altitude - self.ground_altitude
+        if self.height_step > 0.0:
+            height = round(height / self.height_step) * self.height_step
+        return height
@@ -2,7 +2,7 @@
 Classes for computation of routes (i.e. assemblies of climb, cruise and descent phases).
 """
 #  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
-#  Copyright (C) 2023 ONERA & ISAE-SUPAERO
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
 #  FAST is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
 #  the Free Software Foundation, either version 3 of the License, or
@@ -14,12 +14,13 @@ Classes for computation of routes (i.e. assemblies of climb, cruise and descent
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import logging
+from copy import copy
 from dataclasses import dataclass
+from time import perf_counter
 from typing import List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-from scipy.optimize import root_scalar
 
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.datacls import MANDATORY_FIELD
@@ -27,6 +28,14 @@ from fastoad.model_base.datacls import MANDATORY_FIELD
 from .base import FlightSequence, IFlightPart
 from .segments.base import AbstractFlightSegment
 from .segments.registered.cruise import CruiseSegment
+from .solver import SolverState, solve_with_secant
+from .trajectory import SequenceTrajectory
+
+_LOGGER = logging.getLogger(__name__)  # Logger for this module
+
+# Fields of flight points that are offset when descent phases computed for a previous
+# cruise distance are reused (see RangedRoute._solve_cruise_distance()).
+_SHIFTED_FIELDS = ["mass", "consumed_fuel", "time", "ground_distance"]
 
 
 @dataclass
@@ -59,12 +68,35 @@ class RangedRoute(FlightSequence):
     #: If True, cruise distance will be adjusted to match :attr:`flight_distance`
     solve_distance: bool = True
 
+    #: If provided, the solving of cruise distance will start from the solution it contains,
+    #: and the obtained solution will be stored in it.
+    solver_state: Optional[SolverState] = None
+
+    #: If True, the second solver iteration reuses the descent phases computed in first
+    #: iteration, instead of computing them (see :meth:`_solve_cruise_distance`). Obtained
+    #: route is different, but within :attr:`distance_accuracy`.
+    reuse_descent_phases: bool = False
+
     def __post_init__(self):
         super().__post_init__()
         self.extend(self._get_flight_sequence())
 
-        # We will use this to keep data along root_scalar process (see _solve_cruise_distance() )
-        self._flight_points = None
+        self._distance_error = None
+
+        # We will use these to keep data along solving process (see _solve_cruise_distance() )
+        self._climb_start_row = 0
+        self._climb_end_row = 0
+        self._climb_rows = {}
+        self._climb_part_ranges = []
+        self._climb_part_starts = []
+        self._climb_consumed_mass = 0.0
+        self._use_descent_shift = False
+        self._is_descent_shifted = False
+        self._descent_reference = {}
+        self._descent_rows = {}
+        self._descent_dropped_rows = []
+        self._iteration_count = 0
+        self._iteration_duration = 0.0
 
     @property
     def cruise_distance(self):
@@ -96,26 +128,50 @@ class RangedRoute(FlightSequence):
 
         return None
 
-    def compute_from(self, start: FlightPoint) -> pd.DataFrame:
+    @property
+    def needs_distance_solving(self) -> bool:
+        """
+        True if cruise distance has to be solved to match :attr:`flight_distance`, i.e.
+        if :attr:`solve_distance` is True and climb and descent phases do not all have
+        a fixed ground distance.
+        """
+        return self.solve_distance and 0.0 in self._get_climb_descent_distances()
+
+    @property
+    def distance_error(self) -> Optional[float]:
+        """
+        Difference between :attr:`flight_distance` and the ground distance covered during the
+        last computation.
+        """
+        return self._distance_error
+
+    def _compute_into(self, start: FlightPoint, trajectory: SequenceTrajectory):
         # In very simple cases, climb and descent phases can have fixed
         # covered ground distance. In that case, cruise distance is easy to
         # obtain from flight_distance.
         # In other cases, cruise distance is obtained using a solver.
+        first_row = len(trajectory)
+
+        if self.needs_distance_solving:
+            # Solving the needed cruise distance to get target flight distance
+            self._solve_cruise_distance(start, trajectory)
+        else:
+            if self.solve_distance:
+                # climb and descent distances are provided, cruise distance can be
+                # obtained easily.
+                self.cruise_distance = self.flight_distance - np.sum(
+                    self._get_climb_descent_distances()
+                )
+            # Else, using the input target distance for cruise
+            super()._compute_into(start, trajectory)
+
+        self._distance_error = self._get_distance_error(trajectory, first_row)
+
+    def _get_climb_descent_distances(self) -> list:
         climb_descent_distances = []
         for phase in self.climb_phases + self.descent_phases:
             climb_descent_distances.extend(self._get_ground_distances(phase))
-
-        # Using the input target distance for cruise
-        if not self.solve_distance:
-            return super().compute_from(start)
-
-        # Solving the needed cruise distance to get target flight distance
-        if 0.0 in climb_descent_distances:
-            return self._solve_cruise_distance(start)
-
-        # climb and descent distances are provided, cruise distance can be obtained easily.
-        self.cruise_distance = self.flight_distance - np.sum(climb_descent_distances)
-        return super().compute_from(start)
+        return climb_descent_distances
 
     def _get_flight_sequence(self) -> List[IFlightPart]:
         # The preliminary climb segment of the cruise segment is set to the
@@ -138,35 +194,198 @@ class RangedRoute(FlightSequence):
 
         return ground_distances
 
-    def _solve_cruise_distance(self, start: FlightPoint) -> pd.DataFrame:
+    def _get_distance_error(self, trajectory: SequenceTrajectory, first_row: int) -> float:
+        """
+        :param trajectory: the trajectory where route has been computed
+        :param first_row: index of first row of the route in `trajectory`
+        :return: difference between flight_distance and computed distance
+        """
+        ground_distances = trajectory.get_column("ground_distance")
+        return self.flight_distance - (ground_distances[-1] - ground_distances[first_row])
+
+    def _solve_cruise_distance(self, start: FlightPoint, trajectory: SequenceTrajectory):
         """
         Adjusts cruise distance through a solver to have whole route that
         matches provided flight distance.
+
+        Climb phases do not depend on cruise distance. They are computed once, and only
+        cruise and descent phases are computed at each solver iteration.
+
+        Moreover, if :attr:`reuse_descent_phases` is True, the second iteration, that
+        mostly serves to estimate how distance error varies with cruise distance, does not
+        compute descent phases: it reuses the flight points of descent phases from first
+        iteration, with mass, consumed fuel, time and ground distance offset according to
+        the new end of cruise. It assumes, as for target masses in :class:`FlightSequence`,
+        that mass consumption of descent phases does not depend on aircraft mass. If the
+        solver converges on this iteration, descent phases are computed for the obtained
+        cruise distance, and solving goes on if the distance accuracy is no longer satisfied.
+
+        This shortcut is not used if a descent part has a target with an absolute value for
+        one of the offset fields.
         """
+        if self._target is not None:
+            self._sequence[-1].target = self._target
+
+        self._part_ranges = []
+        self._part_starts = []
+        self.consumed_mass_before_input_weight = 0.0
+        climb_start = copy(start)
+        climb_start.scalarize()
+        self._climb_start_row = len(trajectory)
+        cruise_start = self._compute_parts(self.climb_phases, climb_start, trajectory)
+
+        # Climb flight points are stored because they may be modified by the computation
+        # of next parts (completion of last point, or mass offset if a target mass is set
+        # after climb).
+        self._climb_end_row = len(trajectory)
+        self._climb_rows = trajectory.get_rows(self._climb_start_row, self._climb_end_row)
+        self._climb_part_ranges = list(self._part_ranges)
+        self._climb_part_starts = list(self._part_starts)
+        self._climb_consumed_mass = self.consumed_mass_before_input_weight
+        self._use_descent_shift = self.reuse_descent_phases and not self._has_absolute_target(
+            self.descent_phases
+        )
+        self._is_descent_shifted = False
+        self._descent_rows = {}
+        self._iteration_count = 0
+        self._iteration_duration = 0.0
 
-        root_scalar(
-            self._compute_flight,
-            args=(start,),
+        solve_with_secant(
+            lambda cruise_distance: self._compute_flight(cruise_distance, cruise_start, trajectory),
             x0=self.flight_distance * 0.5,
             x1=self.flight_distance * 0.25,
             xtol=self.distance_accuracy,
-            method="secant",
+            state=self.solver_state,
         )
 
-        return self._flight_points
+        if self._is_descent_shifted:
+            # As last iteration reused descent phases, this one computes them.
+            distance_error = self._compute_flight(self.cruise_distance, cruise_start, trajectory)
+            if abs(distance_error) > self.distance_accuracy:
+                _LOGGER.debug(
+                    "Distance error after computation of descent phases is %.1f m. "
+                    "Solving goes on.",
+                    distance_error,
+                )
+                solve_with_secant(
+                    lambda cruise_distance: self._compute_flight(
+                        cruise_distance, cruise_start, trajectory
+                    ),
+                    x0=self.cruise_distance,
+                    x1=self.cruise_distance + distance_error,
+                    xtol=self.distance_accuracy,
+                    state=self.solver_state,
+                )
+
+        _LOGGER.debug(
+            "Cruise distance solved in %i iterations (%.3f s per iteration).",
+            self._iteration_count,
+            self._iteration_duration / self._iteration_count,
+        )
 
-    def _compute_flight(self, cruise_distance, start: FlightPoint):
+    def _compute_flight(self, cruise_distance, start: FlightPoint, trajectory: SequenceTrajectory):
         """
-        Computes flight for provided cruise distance
+        Computes cruise and descent phases for provided cruise distance
 
         :param cruise_distance:
-        :param start:
+        :param start: the end point of climb phases
+        :param trajectory: the trajectory where climb phases have been computed
         :return: difference between computed distance and self.flight_distance
         """
+        iteration_start_time = perf_counter()
         self.cruise_distance = cruise_distance
-        self._flight_points = super().compute_from(start)
-        obtained_distance = (
-            self._flight_points.iloc[-1].ground_distance
-            - self._flight_points.iloc[0].ground_distance
+
+        # Trajectory is set back to the end of climb phases.
+        trajectory.truncate(self._climb_end_row)
+        trajectory.set_rows(self._climb_start_row, self._climb_rows)
+        self._part_ranges = list(self._climb_part_ranges)
+        self._part_starts = list(self._climb_part_starts)
+        self.consumed_mass_before_input_weight = self._climb_consumed_mass
+
+        cruise_end = self._compute_parts([self.cruise_segment], start, trajectory)
+        self._is_descent_shifted = (
+            self._use_descent_shift and bool(self._descent_rows) and self._iteration_count == 1
         )
-        return self.flight_distance - obtained_distance
+        if self._is_descent_shifted:
+            self._add_shifted_descent(cruise_end, trajectory)
+        else:
+            descent_start_row = len(trajectory)
+            self._compute_parts(self.descent_phases, cruise_end, trajectory)
+            if self._use_descent_shift and self._iteration_count == 0:
+                self._store_descent(cruise_end, descent_start_row, trajectory)
+
+        distance_error = self._get_distance_error(trajectory, self._climb_start_row)
+
+        iteration_duration = perf_counter() - iteration_start_time
+        self._iteration_count += 1
+        self._iteration_duration += iteration_duration
+        _LOGGER.debug(
+            "Cruise distance iteration %i: cruise distance = %.1f m, "
+            "distance error = %.1f m (%.3f s).",
+            self._iteration_count,
+            self.cruise_distance,
+            distance_error,
+            iteration_duration,
+        )
+
+        return distance_error
+
+    def _store_descent(
+        self, cruise_end: FlightPoint, descent_start_row: int, trajectory: SequenceTrajectory
+    ):
+        """
+        Keeps flight points of descent phases, so they can be reused in next iterations.
+
+        :param cruise_end: the start point of descent phases
+        :param descent_start_row: index of first row of descent phases in `trajectory`
+        :param trajectory: the trajectory where descent phases have been computed
+        """
+        self._descent_reference = {name: getattr(cruise_end, name) for name in _SHIFTED_FIELDS}
+        if None in self._descent_reference.values():
+            self._descent_rows = {}
+            return
+
+        self._descent_rows = trajectory.get_rows(descent_start_row, len(trajectory))
+        self._descent_dropped_rows = [
+            index - descent_start_row
+            for index in trajectory.dropped_rows
+            if index >= descent_start_row
+        ]
+
+    def _add_shifted_descent(self, cruise_end: FlightPoint, trajectory: SequenceTrajectory):
+        """
+        Adds to `trajectory` the stored flight points of descent phases, offset so they
+        start from provided point.
+
+        Only flight points are added: boundaries of flight parts will be set by the
+        computation of descent phases that ends the solving process.
+
+        :param cruise_end: the start point of descent phases
+        :param trajectory: the trajectory where cruise has been computed
+        """
+        descent_start_row = len(trajectory)
+        rows = dict(self._descent_rows)
+        for name in _SHIFTED_FIELDS:
+            rows[name] = rows[name] + (getattr(cruise_end, name) - self._descent_reference[name])
+        trajectory.extend_from_rows(rows)
+        for index in self._descent_dropped_rows:
+            trajectory.drop_row(descent_start_row + index)
+
+    @classmethod
+    def _has_absolute_target(cls, parts: List[IFlightPart]) -> bool:
+        """
+        :param parts: flight parts, possibly nested
+        :return: True if a target of provided parts has an absolute value for a field that
+                 is offset when reusing descent phases
+        """
+        for part in parts:
+            # As in FlightPoint default values, 0.0 means no target for these fields.
+            if any(
+                getattr(part.target, name) not in [None, 0.0] and not part.target.is_relative(name)
+                for name in _SHIFTED_FIELDS
+            ):
+                return True
+            if isinstance(part, FlightSequence) and cls._has_absolute_target(part):
+                return True
+
+        return False
@@ -13,9 +13,9 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass, field
-from typing import Optional, Type
+from typing import Optional, Tuple, Type
 
 import numpy as np
 import pandas as pd
@@ -25,6 +25,7 @@ from stdatm import AtmosphereSI
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.datacls import MANDATORY_FIELD
 
+from ..atmosphere import AtmosphereProvider, AtmosphereState
 from ..base import IFlightPart, RegisterElement
 from ..exceptions import FastFlightSegmentIncompleteFlightPoint
 
@@ -135,6 +136,9 @@ class AbstractFlightSegment(IFlightPart, ABC):
     #: The temperature offset for ISA atmosphere model.
     isa_offset: float = 0.0
 
+    #: Provider of atmosphere data. Should be shared by all segments of a mission.
+    atmosphere: AtmosphereProvider = field(default_factory=AtmosphereProvider)
+
     #: Using this value will tell to keep the associated parameter constant.
     CONSTANT_VALUE = "constant"  # pylint: disable=invalid-name # used as constant
 
@@ -199,9 +203,22 @@ class AbstractFlightSegment(IFlightPart, ABC):
         :return: a pandas DataFrame where column names match fields of
                  :class:`~fastoad.model_base.flight_point.FlightPoint`
         """
+        start_copy, target_copy = self._get_start_and_target(start)
+        flight_points = self.compute_from_start_to_target(start_copy, target_copy)
+
+        return flight_points
+
+    def _get_start_and_target(self, start: FlightPoint) -> Tuple[FlightPoint, FlightPoint]:
+        """
+        Does the preprocessing of start and target flight points for :meth:`compute_from`.
+
+        :param start: the initial flight point, as provided to :meth:`compute_from`
+        :return: the completed copy of start point, and the target with absolute values
+        """
         # Let's ensure we do not modify the original definitions of start and target
-        # during the process
-        start_copy = deepcopy(start)
+        # during the process. Once scalarized, a shallow copy is enough.
+        start_copy = copy(start)
+        start_copy.scalarize()
 
         if start_copy.altitude is not None:
             try:
@@ -219,9 +236,7 @@ class AbstractFlightSegment(IFlightPart, ABC):
         if start_copy.ground_distance is None:
             start_copy.ground_distance = 0.0
 
-        flight_points = self.compute_from_start_to_target(start_copy, target_copy)
-
-        return flight_points
+        return start_copy, target_copy
 
     def complete_flight_point(self, flight_point: FlightPoint):
         """
@@ -302,26 +317,25 @@ class AbstractFlightSegment(IFlightPart, ABC):
         """
         Computes consistent values between TAS, EAS and Mach, assuming one of them is defined.
         """
-        atm = self._get_atmosphere_point(flight_point.altitude)
-
-        if flight_point.true_airspeed is None:
-            if flight_point.mach is not None:
-                atm.mach = flight_point.mach
-            elif flight_point.equivalent_airspeed is not None:
-                atm.equivalent_airspeed = flight_point.equivalent_airspeed
-            elif raise_error_on_missing_speeds:
+        true_airspeed, equivalent_airspeed, mach = self.atmosphere.compute_speeds(
+            flight_point.altitude,
+            self.isa_offset,
+            true_airspeed=flight_point.true_airspeed,
+            equivalent_airspeed=flight_point.equivalent_airspeed,
+            mach=flight_point.mach,
+        )
+
+        if true_airspeed is None:
+            if raise_error_on_missing_speeds:
                 raise FastFlightSegmentIncompleteFlightPoint(
                     "Flight point should be defined for true_airspeed, "
                     "equivalent_airspeed, or mach."
                 )
-            else:
-                return False
-            flight_point.true_airspeed = atm.true_airspeed
-        else:
-            atm.true_airspeed = flight_point.true_airspeed
-
-        flight_point.mach = atm.mach
-        flight_point.equivalent_airspeed = atm.equivalent_airspeed
+            return False
+
+        flight_point.true_airspeed = true_airspeed
+        flight_point.mach = mach
+        flight_point.equivalent_airspeed = equivalent_airspeed
         return True
 
     def _get_atmosphere_point(self, altitude: float) -> AtmosphereSI:
@@ -331,4 +345,13 @@ class AbstractFlightSegment(IFlightPart, ABC):
         :param altitude: in meters
         :return: AtmosphereSI instantiated from provided altitude and :attr:`delta_isa`
         """
-        return AtmosphereSI(altitude, self.isa_offset)
+        return self.atmosphere.get_atmosphere_point(altitude, self.isa_offset)
+
+    def _get_atmosphere_state(self, altitude: float) -> AtmosphereState:
+        """
+        Faster than :meth:`_get_atmosphere_point` when only atmosphere properties are needed.
+
+        :param altitude: in meters
+        :return: atmosphere properties for provided altitude and :attr:`delta_isa`
+        """
+        return self.atmosphere.get_state(altitude, self.isa_offset)
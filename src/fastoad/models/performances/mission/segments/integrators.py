@@ -0,0 +1,333 @@
+"""Integration schemes for time-step flight segments."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Sequence, Tuple
+
+from fastoad.model_base import FlightPoint
+
+from ..base import RegisterElement
+
+if TYPE_CHECKING:
+    from .time_step_base import AbstractTimeStepFlightSegment
+
+#: Fields for which an error estimate is provided.
+ERROR_CONTROLLED_FIELDS = ("mass", "altitude", "true_airspeed", "ground_distance")
+
+
+@dataclass
+class AbstractIntegrator(ABC):
+    """
+    Base class for integration schemes of time-step segments.
+
+    An integrator computes the next flight point of a segment, using the segment methods:
+
+    - :meth:`~.time_step_base.AbstractTimeStepFlightSegment.compute_next_flight_point`, that
+      does an explicit Euler step from the last flight point,
+    - :meth:`~.time_step_base.AbstractTimeStepFlightSegment.complete_flight_point`, that
+      computes aerodynamics, propulsion and derivatives at a flight point.
+    """
+
+    #: Order of the error estimate w.r.t. time step, as provided by :meth:`compute_step`.
+    #: Used for adapting time step.
+    error_order: int = 2
+
+    @abstractmethod
+    def compute_step(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_step: float,
+        estimate_error: bool = False,
+    ) -> Tuple[FlightPoint, Optional[Dict[str, float]]]:
+        """
+        Computes the flight point after a time step from last flight point.
+
+        :param segment: the segment to be integrated
+        :param flight_points: previous flight points
+        :param time_step: time step for computing next point
+        :param estimate_error: if True, an estimate of integration error is also provided
+        :return: the computed flight point, completed by the segment, and, if required,
+                 the estimated errors for fields in :data:`ERROR_CONTROLLED_FIELDS`
+                 (None otherwise)
+        """
+
+    @abstractmethod
+    def interpolate(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_ratio: float,
+    ) -> FlightPoint:
+        """
+        Computes the flight point inside the last time step (dense output), without calling
+        the propulsion model.
+
+        :param segment: the integrated segment
+        :param flight_points: computed flight points, with at least 2 elements. The last time
+                              step is between the two last ones.
+        :param time_ratio: position of computed point in last time step, from 0.0 (second to
+                           last point) to 1.0 (last point)
+        :return: the flight point, where only fields computed by
+                 :meth:`~.time_step_base.AbstractTimeStepFlightSegment.compute_next_flight_point`
+                 are defined
+        """
+
+
+class RegisterIntegrator(RegisterElement, base_class=AbstractIntegrator):
+    """
+    Decorator for registering AbstractIntegrator classes.
+
+        >>> @RegisterIntegrator("integrator_foo")
+        >>> class FooIntegrator(AbstractIntegrator):
+        >>>     ...
+
+    Then the registered class can be obtained by:
+
+        >>> my_class = RegisterIntegrator.get_class("integrator_foo")
+    """
+
+
+@dataclass
+class ExplicitRungeKuttaIntegrator(AbstractIntegrator, ABC):
+    """
+    Base class for explicit Runge-Kutta schemes, defined by their Butcher tableau.
+
+    Increments of integrated fields for a stage are obtained as the difference between the
+    stage point and the Euler step computed from this stage point by the segment. Fields that
+    the segment does not integrate (see
+    :meth:`~.time_step_base.AbstractTimeStepFlightSegment.get_integrated_field_names`) are
+    computed by the segment from the Euler step, with corrected integrated fields.
+
+    The error estimate is based on embedded weights. If they have one more element than
+    stages, the last one applies to the derivatives at the computed flight point ("first same as
+    last" property), which are available without calling the propulsion model.
+    """
+
+    # Butcher tableau
+    _a: ClassVar[Sequence[Sequence[float]]] = ((),)
+    _b: ClassVar[Sequence[float]] = (1.0,)
+    _c: ClassVar[Sequence[float]] = (0.0,)
+
+    # Weights of the embedded scheme for error estimate.
+    _b_embedded: ClassVar[Sequence[float]] = (0.5, 0.5)
+
+    def compute_step(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_step: float,
+        estimate_error: bool = False,
+    ) -> Tuple[FlightPoint, Optional[Dict[str, float]]]:
+        start = flight_points[0]
+        previous = flight_points[-1]
+        field_names = segment.get_integrated_field_names()
+
+        euler_point = segment.compute_next_flight_point(flight_points, time_step)
+        increments = [self._get_increments(previous, euler_point, field_names)]
+
+        for stage_a, stage_c in zip(self._a[1:], self._c[1:]):
+            stage_point = self._compute_point(
+                segment, flight_points, time_step, stage_c, stage_a, increments
+            )
+            segment.complete_flight_point(stage_point)
+            increments.append(self._get_stage_increments(segment, start, stage_point, time_step))
+
+        new_point = self._compute_point(segment, flight_points, time_step, 1.0, self._b, increments)
+        segment.complete_flight_point(new_point)
+
+        if not estimate_error:
+            return new_point, None
+
+        if len(self._b_embedded) > len(self._b):
+            increments.append(self._get_stage_increments(segment, start, new_point, time_step))
+
+        errors = {}
+        for name in ERROR_CONTROLLED_FIELDS:
+            if name in increments[0]:
+                errors[name] = abs(
+                    sum(
+                        (b_embedded - b) * increment[name]
+                        for b_embedded, b, increment in zip(
+                            self._b_embedded, list(self._b) + [0.0], increments
+                        )
+                    )
+                )
+        return new_point, errors
+
+    def interpolate(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_ratio: float,
+    ) -> FlightPoint:
+        # Cubic Hermite interpolation, from values and derivatives at both ends of time step.
+        start = flight_points[0]
+        previous = flight_points[-2]
+        last = flight_points[-1]
+        time_step = last.time - previous.time
+
+        flight_point = segment.compute_next_flight_point([start, previous], time_ratio * time_step)
+        previous_increments = self._get_stage_increments(segment, start, previous, time_step)
+        last_increments = self._get_stage_increments(segment, start, last, time_step)
+
+        t = time_ratio
+        h00 = (1.0 + 2.0 * t) * (1.0 - t) ** 2
+        h10 = t * (1.0 - t) ** 2
+        h01 = t**2 * (3.0 - 2.0 * t)
+        h11 = t**2 * (t - 1.0)
+        for name, previous_increment in previous_increments.items():
+            if name in last_increments:
+                value = (
+                    h00 * getattr(previous, name)
+                    + h10 * previous_increment
+                    + h01 * getattr(last, name)
+                    + h11 * last_increments[name]
+                )
+                setattr(flight_point, name, value)
+
+        segment.update_non_integrated_fields(flight_point, previous)
+        return flight_point
+
+    @staticmethod
+    def _compute_point(
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_step: float,
+        time_ratio: float,
+        weights: Sequence[float],
+        increments: List[Dict[str, float]],
+    ) -> FlightPoint:
+        """
+        Computes the (uncompleted) flight point at time_ratio*time_step from last flight point,
+        where integrated fields are obtained as weighted sum of increments.
+        """
+        previous = flight_points[-1]
+        flight_point = segment.compute_next_flight_point(flight_points, time_ratio * time_step)
+
+        for name in increments[0]:
+            value = getattr(previous, name) + sum(
+                weight * increment[name] for weight, increment in zip(weights, increments)
+            )
+            setattr(flight_point, name, value)
+
+        segment.update_non_integrated_fields(flight_point, previous)
+        return flight_point
+
+    def _get_stage_increments(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        start: FlightPoint,
+        stage_point: FlightPoint,
+        time_step: float,
+    ) -> Dict[str, float]:
+        """Increments during time_step using derivatives at stage_point."""
+        euler_point = segment.compute_next_flight_point([start, stage_point], time_step)
+        return self._get_increments(stage_point, euler_point, segment.get_integrated_field_names())
+
+    @staticmethod
+    def _get_increments(
+        flight_point: FlightPoint, euler_point: FlightPoint, field_names: Sequence[str]
+    ) -> Dict[str, float]:
+        """Differences of field values from flight_point to euler_point."""
+        increments = {}
+        for name in field_names:
+            next_value = getattr(euler_point, name)
+            value = getattr(flight_point, name)
+            if next_value is not None and value is not None:
+                increments[name] = next_value - value
+        return increments
+
+
+@RegisterIntegrator("euler")
+@dataclass
+class EulerIntegrator(ExplicitRungeKuttaIntegrator):
+    """
+    Explicit Euler scheme (first order, one call to propulsion model per time step).
+
+    This is the default scheme. The error is estimated by comparison with Heun's scheme.
+    """
+
+    def compute_step(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_step: float,
+        estimate_error: bool = False,
+    ) -> Tuple[FlightPoint, Optional[Dict[str, float]]]:
+        # Done directly, to have exactly the same results as before integrators were introduced.
+        new_point = segment.compute_next_flight_point(flight_points, time_step)
+        segment.complete_flight_point(new_point)
+
+        if not estimate_error:
+            return new_point, None
+
+        previous = flight_points[-1]
+        increment = self._get_increments(previous, new_point, ERROR_CONTROLLED_FIELDS)
+        next_increment = self._get_stage_increments(segment, flight_points[0], new_point, time_step)
+        errors = {
+            name: 0.5 * abs(next_increment[name] - increment[name])
+            for name in increment
+            if name in next_increment
+        }
+        return new_point, errors
+
+    def interpolate(
+        self,
+        segment: "AbstractTimeStepFlightSegment",
+        flight_points: List[FlightPoint],
+        time_ratio: float,
+    ) -> FlightPoint:
+        # Euler step is linear w.r.t. time step, so computing a shorter step provides exactly
+        # the flight point that would be obtained by integrating up to the required time.
+        previous = flight_points[-2]
+        time_step = flight_points[-1].time - previous.time
+        return segment.compute_next_flight_point(
+            [flight_points[0], previous], time_ratio * time_step
+        )
+
+
+@RegisterIntegrator("heun")
+@dataclass
+class HeunIntegrator(ExplicitRungeKuttaIntegrator):
+    """
+    Heun's scheme, a.k.a. explicit trapezoidal rule (second order, two calls to propulsion
+    model per time step).
+
+    The error is estimated by comparison with Euler scheme.
+    """
+
+    _a = ((), (1.0,))
+    _b = (0.5, 0.5)
+    _c = (0.0, 1.0)
+    _b_embedded = (1.0, 0.0)
+
+
+@RegisterIntegrator("rk4")
+@dataclass
+class RK4Integrator(ExplicitRungeKuttaIntegrator):
+    """
+    Classic Runge-Kutta scheme (fourth order, four calls to propulsion model per time step).
+
+    The error is estimated by comparison with a third-order scheme that uses derivatives at the
+    computed point.
+    """
+
+    error_order: int = 4
+
+    _a = ((), (0.5,), (0.0, 0.5), (0.0, 0.0, 1.0))
+    _b = (1.0 / 6.0, 1.0 / 3.0, 1.0 / 3.0, 1.0 / 6.0)
+    _c = (0.0, 0.5, 0.5, 1.0)
+    _b_embedded = (1.0 / 6.0, 1.0 / 3.0, 1.0 / 3.0, 0.0, 1.0 / 6.0)
@@ -16,7 +16,7 @@ from copy import copy
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Union
 
-import pandas as pd
+import numpy as np
 from scipy.constants import foot, g
 
 from fastoad.model_base import FlightPoint
@@ -86,7 +86,7 @@ class AltitudeChangeSegment(AbstractManualThrustSegment, AbstractLiftFromWeightS
     #: with max lift/drag ratio.
     OPTIMAL_FLIGHT_LEVEL = "optimal_flight_level"  # pylint: disable=invalid-name # used as constant
 
-    def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
+    def _prepare_start_and_target(self, start: FlightPoint, target: FlightPoint):
         if target.altitude is not None:
             if isinstance(target.altitude, str):
                 # Target altitude will be modified along the process, so we keep track
@@ -108,15 +108,26 @@ class AltitudeChangeSegment(AbstractManualThrustSegment, AbstractLiftFromWeightS
                 self._original_target_altitude = None
                 self.interrupt_if_getting_further_from_target = True
 
-        atm = self._get_atmosphere_point(start.altitude)
         if target.equivalent_airspeed == self.CONSTANT_VALUE:
-            atm.equivalent_airspeed = start.equivalent_airspeed
-            start.true_airspeed = atm.true_airspeed
+            start.true_airspeed, _, _ = self.atmosphere.compute_speeds(
+                start.altitude, self.isa_offset, equivalent_airspeed=start.equivalent_airspeed
+            )
         elif target.mach == self.CONSTANT_VALUE:
-            atm.mach = start.mach
-            start.true_airspeed = atm.true_airspeed
+            start.true_airspeed, _, _ = self.atmosphere.compute_speeds(
+                start.altitude, self.isa_offset, mach=start.mach
+            )
 
-        return super().compute_from_start_to_target(start, target)
+    def _can_compute_in_lockstep(self) -> bool:
+        # Optimal altitude is managed with scalar values, as well as speed targets, which
+        # are then expected to be the same for all members.
+        return (
+            super()._can_compute_in_lockstep()
+            and not isinstance(self.target.altitude, str)
+            and not any(
+                self.target.is_relative(name)
+                for name in ["true_airspeed", "equivalent_airspeed", "mach"]
+            )
+        )
 
     def get_distance_to_target(
         self, flight_points: List[FlightPoint], target: FlightPoint
@@ -127,7 +138,8 @@ class AltitudeChangeSegment(AbstractManualThrustSegment, AbstractLiftFromWeightS
 
         # Max flight level is first priority
         max_authorized_altitude = self.maximum_flight_level * 100.0 * foot
-        if current.altitude >= max_authorized_altitude:
+        is_above_maximum = current.altitude >= max_authorized_altitude
+        if np.all(is_above_maximum):
             distance_to_target = max_authorized_altitude - current.altitude
 
         elif isinstance(target.CL, float):
@@ -150,6 +162,11 @@ class AltitudeChangeSegment(AbstractManualThrustSegment, AbstractLiftFromWeightS
             raise FastFlightSegmentIncompleteFlightPoint(
                 "No valid target definition for altitude change."
             )
+        if np.any(is_above_maximum):
+            # Only some flight points of a batch are above max flight level.
+            distance_to_target = np.where(
+                is_above_maximum, max_authorized_altitude - current.altitude, distance_to_target
+            )
         return distance_to_target
 
     def get_gamma_and_acceleration(self, flight_point: FlightPoint) -> Tuple[float, float]:
@@ -167,17 +184,17 @@ class AltitudeChangeSegment(AbstractManualThrustSegment, AbstractLiftFromWeightS
             if isinstance(getattr(target_speed, speed_param), str):
                 setattr(target_speed, speed_param, getattr(start, speed_param))
         # Now, let's compute target Mach number
-        atm = self._get_atmosphere_point(max(target.altitude, current.altitude))
+        altitude = max(target.altitude, current.altitude)
         if target_speed.equivalent_airspeed:
-            atm.equivalent_airspeed = target_speed.equivalent_airspeed
-            target_speed.true_airspeed = atm.true_airspeed
+            target_speed.true_airspeed, _, _ = self.atmosphere.compute_speeds(
+                altitude, self.isa_offset, equivalent_airspeed=target_speed.equivalent_airspeed
+            )
         if target_speed.true_airspeed:
-            atm.true_airspeed = target_speed.true_airspeed
-            target_speed.mach = atm.mach
+            _, _, target_speed.mach = self.atmosphere.compute_speeds(
+                altitude, self.isa_offset, true_airspeed=target_speed.true_airspeed
+            )
         # Now we compute optimal altitude
-        optimal_altitude = self._get_optimal_altitude(
-            current.mass, target_speed.mach, current.altitude
-        )
+        optimal_altitude = self._get_optimal_altitude(current.mass, target_speed.mach)
         if self._original_target_altitude == self.OPTIMAL_ALTITUDE:
             target.altitude = optimal_altitude
         else:  # self._original_target_altitude == self.OPTIMAL_FLIGHT_LEVEL:
@@ -12,15 +12,15 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass
-from typing import List
+from typing import List, Union
 
 import numpy as np
 import pandas as pd
 from scipy.constants import foot, g
 
-from fastoad.model_base import FlightPoint
+from fastoad.model_base import FlightPoint, FlightPointBatch
 from fastoad.models.performances.mission.segments.base import (
     RegisterSegment,
 )
@@ -78,15 +78,19 @@ class OptimalCruiseSegment(CruiseSegment):
     `true_airspeed` and `equivalent_airspeed`. If not, Mach will be assumed constant.
     """
 
-    def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
+    def _prepare_start_and_target(self, start: FlightPoint, target: FlightPoint):
         start.altitude = self._get_optimal_altitude(start.mass, start.mach)
         self.complete_flight_point(start)
-        return super().compute_from_start_to_target(start, target)
 
     def _compute_next_altitude(self, next_point: FlightPoint, previous_point: FlightPoint):
-        next_point.altitude = self._get_optimal_altitude(
-            next_point.mass, previous_point.mach, altitude_guess=previous_point.altitude
-        )
+        next_point.altitude = self._get_optimal_altitude(next_point.mass, previous_point.mach)
+
+    def get_integrated_field_names(self) -> List[str]:
+        # Altitude is a function of mass
+        return [name for name in super().get_integrated_field_names() if name != "altitude"]
+
+    def update_non_integrated_fields(self, flight_point: FlightPoint, previous_point: FlightPoint):
+        self._compute_next_altitude(flight_point, previous_point)
 
 
 @RegisterSegment("cruise")
@@ -110,6 +114,10 @@ class ClimbAndCruiseSegment(CruiseSegment):
 
     In this case, climb will be done up to the IFR Flight Level (as multiple of 100 feet) that
     ensures minimum mass decrease, while being at most equal to :attr:`maximum_flight_level`.
+    Flight levels are tried in ascending order. Unless :attr:`simulate_all_flight_levels` is
+    True, the climb to a flight level continues the climb to the previous one, and the cruise
+    fuel for each flight level is estimated with Breguet-Leduc formula, so that the cruise is
+    simulated only for the chosen flight level.
     """
 
     #: The AltitudeChangeSegment that can be used if a preliminary climb is needed (its target
@@ -119,6 +127,10 @@ class ClimbAndCruiseSegment(CruiseSegment):
     #: The maximum allowed flight level (i.e. multiple of 100 feet).
     maximum_flight_level: float = 500.0
 
+    #: If True, when looking for the optimal flight level, the complete climb and cruise are
+    #: simulated for each tried flight level (slower, but the choice does not rely on estimates).
+    simulate_all_flight_levels: bool = False
+
     def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
         if self.climb_segment is not None:
             attr_dict = {
@@ -132,17 +144,28 @@ class ClimbAndCruiseSegment(CruiseSegment):
             climb_segment = None
 
         cruise_segment = CruiseSegment(
-            target=deepcopy(target),  # deepcopy needed because altitude will be modified.
+            target=copy(target),  # copy needed because altitude will be modified.
             propulsion=self.propulsion,
             reference_area=self.reference_area,
             polar=self.polar,
             name=self.name,
             engine_setting=self.engine_setting,
+            atmosphere=self.atmosphere,
         )
 
         if (
             self.target.altitude == AltitudeChangeSegment.OPTIMAL_FLIGHT_LEVEL
             and climb_segment is not None
+            and not self.simulate_all_flight_levels
+        ):
+            cruise_segment.target.altitude = None
+            results = self._climb_to_estimated_optimal_flight_level_and_cruise(
+                start, climb_segment, cruise_segment
+            )
+
+        elif (
+            self.target.altitude == AltitudeChangeSegment.OPTIMAL_FLIGHT_LEVEL
+            and climb_segment is not None
         ):
             cruise_segment.target.altitude = None
 
@@ -179,6 +202,92 @@ class ClimbAndCruiseSegment(CruiseSegment):
 
         return results
 
+    def _climb_to_estimated_optimal_flight_level_and_cruise(
+        self,
+        start: FlightPoint,
+        climb_segment: AltitudeChangeSegment,
+        cruise_segment: CruiseSegment,
+    ) -> pd.DataFrame:
+        """
+        Climbs up to the flight level that is estimated to ensure minimum mass decrease, and
+        cruise, while ensuring final ground_distance is equal to self.target.ground_distance.
+
+        Each flight level is reached by continuing the climb to the previous one. The mass at
+        end of cruise is estimated with :meth:`_estimate_cruise_final_mass`. The cruise is
+        simulated only for the chosen flight level.
+
+        :param start:
+        :param climb_segment:
+        :param cruise_segment:
+        :return:
+        """
+        # Go to the next flight level, or keep altitude if already at a flight level
+        cruise_altitude = get_closest_flight_level(start.altitude - 1.0e-3)
+        climb_points = self._climb_to_altitude(
+            start, cruise_altitude, climb_segment, cruise_segment
+        )
+        cruise_start = FlightPoint.create(climb_points.iloc[-1])
+        mass_loss = start.mass - self._estimate_cruise_final_mass(cruise_start, cruise_segment)
+
+        while True:
+            cruise_altitude = get_closest_flight_level(cruise_altitude + 1.0e-3)
+            if cruise_altitude > self.maximum_flight_level * 100.0 * foot:
+                break
+
+            additional_climb_points = self._climb_to_altitude(
+                cruise_start, cruise_altitude, climb_segment, cruise_segment
+            )
+            new_cruise_start = FlightPoint.create(additional_climb_points.iloc[-1])
+            new_mass_loss = start.mass - self._estimate_cruise_final_mass(
+                new_cruise_start, cruise_segment
+            )
+            if new_mass_loss >= mass_loss:
+                break
+
+            # First point of additional climb is the last point of previous climb.
+            climb_points = pd.concat([climb_points, additional_climb_points.iloc[1:]])
+            cruise_start = new_cruise_start
+            mass_loss = new_mass_loss
+
+        cruise_points = cruise_segment.compute_from(cruise_start)
+
+        return pd.concat([climb_points, cruise_points]).reset_index(drop=True)
+
+    @staticmethod
+    def _estimate_cruise_final_mass(
+        cruise_start: FlightPoint, cruise_segment: CruiseSegment
+    ) -> float:
+        """
+        Estimates the mass at end of cruise with Breguet-Leduc formula.
+
+        Lift/drag ratio and SFC are evaluated for the mass at middle of cruise, which is
+        estimated from a first evaluation at start of cruise.
+
+        :param cruise_start: the flight point at start of cruise
+        :param cruise_segment: the cruise segment, with absolute target ground distance
+        :return: the estimated mass at end of cruise
+        """
+        cruise_distance = cruise_segment.target.ground_distance - cruise_start.ground_distance
+        if cruise_distance <= 0.0:
+            return cruise_start.mass
+
+        mass = cruise_start.mass
+        final_mass = mass
+        for _ in range(2):
+            flight_point = copy(cruise_start)
+            flight_point.mass = np.sqrt(mass * final_mass)
+            cruise_segment.complete_flight_point(flight_point)
+            range_factor = (
+                flight_point.true_airspeed
+                * flight_point.CL
+                / flight_point.CD
+                / g
+                / flight_point.sfc
+            )
+            final_mass = mass * np.exp(-cruise_distance / range_factor)
+
+        return final_mass
+
     @staticmethod
     def _climb_to_altitude_and_cruise(
         start: FlightPoint,
@@ -196,19 +305,39 @@ class ClimbAndCruiseSegment(CruiseSegment):
         :param cruise_segment:
         :return:
         """
-        climb_segment.target = FlightPoint(
-            altitude=cruise_altitude,
-            mach=cruise_segment.target.mach,
-            true_airspeed=cruise_segment.target.true_airspeed,
-            equivalent_airspeed=cruise_segment.target.equivalent_airspeed,
+        climb_points = ClimbAndCruiseSegment._climb_to_altitude(
+            start, cruise_altitude, climb_segment, cruise_segment
         )
-        climb_points = climb_segment.compute_from(start)
 
         cruise_start = FlightPoint.create(climb_points.iloc[-1])
         cruise_points = cruise_segment.compute_from(cruise_start)
 
         return pd.concat([climb_points, cruise_points]).reset_index(drop=True)
 
+    @staticmethod
+    def _climb_to_altitude(
+        start: FlightPoint,
+        cruise_altitude: float,
+        climb_segment: AltitudeChangeSegment,
+        cruise_segment: CruiseSegment,
+    ) -> pd.DataFrame:
+        """
+        Climbs up to cruise_altitude, with the constant speed of cruise.
+
+        :param start:
+        :param cruise_altitude:
+        :param climb_segment:
+        :param cruise_segment:
+        :return: the climb flight points
+        """
+        climb_segment.target = FlightPoint(
+            altitude=cruise_altitude,
+            mach=cruise_segment.target.mach,
+            true_airspeed=cruise_segment.target.true_airspeed,
+            equivalent_airspeed=cruise_segment.target.equivalent_airspeed,
+        )
+        return climb_segment.compute_from(start)
+
 
 @RegisterSegment("breguet")
 @dataclass
@@ -233,7 +362,7 @@ class BreguetCruiseSegment(CruiseSegment):
             start, target.ground_distance - start.ground_distance
         )
 
-        end = deepcopy(start)
+        end = copy(start)
         self.consume_fuel(end, previous=start, mass_ratio=cruise_mass_ratio)
         end.ground_distance = target.ground_distance
         end.time = start.time + (end.ground_distance - start.ground_distance) / end.true_airspeed
@@ -242,10 +371,15 @@ class BreguetCruiseSegment(CruiseSegment):
 
         return pd.DataFrame([start, end])
 
-    def _compute_cruise_mass_ratio(self, start: FlightPoint, cruise_distance):
+    def _compute_cruise_mass_ratio(
+        self, start: Union[FlightPoint, FlightPointBatch], cruise_distance
+    ):
         """
         Computes mass ratio between end and start of cruise
 
+        Several cruises can be computed at once by providing start points as a FlightPointBatch
+        instance, and possibly an array of cruise distances.
+
         :param start: the initial flight point, defined for `CL`, `CD`, `mass` and`true_airspeed`
         :param cruise_distance: cruise distance in meters
         :return: (mass at end of cruise) / (mass at start of cruise)
@@ -256,7 +390,10 @@ class BreguetCruiseSegment(CruiseSegment):
         else:
             lift_drag_ratio = start.CL / start.CD
         start.thrust = start.mass / lift_drag_ratio * g
-        self.propulsion.compute_flight_points(start)
+        if isinstance(start, FlightPointBatch):
+            self.propulsion.compute_flight_points_batch(start)
+        else:
+            self.propulsion.compute_flight_points(start)
 
         range_factor = start.true_airspeed * lift_drag_ratio / g / start.sfc
         return 1.0 / np.exp(cruise_distance / range_factor)
@@ -52,16 +52,16 @@ class RotationSegment(AbstractGroundSegment):
         # compute lift, including thrust projection, compare with weight
         current = flight_points[-1]
 
-        atm = self._get_atmosphere_point(current.altitude)
+        density = self._get_atmosphere_state(current.altitude).density
         airspeed = current.true_airspeed
         mass = current.mass
         alpha = current.alpha
         CL = current.CL
         thrust = current.thrust
 
-        lift = 0.5 * atm.density * self.reference_area * airspeed**2 * CL * cos(
+        lift = 0.5 * density * self.reference_area * airspeed**2 * CL * cos(alpha) + thrust * sin(
             alpha
-        ) + thrust * sin(alpha)
+        )
 
         if alpha >= self.alpha_limit:
             # Tail strike, issue warning and continue accelerating without rotation
@@ -15,8 +15,6 @@
 from dataclasses import dataclass
 from typing import Tuple
 
-import pandas as pd
-
 from fastoad.model_base import FlightPoint
 from fastoad.models.performances.mission.polar import Polar
 from fastoad.models.performances.mission.segments.base import (
@@ -49,10 +47,8 @@ class TaxiSegment(
     def get_gamma_and_acceleration(self, flight_point: FlightPoint) -> Tuple[float, float]:
         return 0.0, 0.0
 
-    def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
+    def _prepare_start_and_target(self, start: FlightPoint, target: FlightPoint):
         start.mach = None
         start.equivalent_airspeed = None
         start.true_airspeed = self.true_airspeed
         self.complete_flight_point(start)
-
-        return super().compute_from_start_to_target(start, target)
@@ -10,6 +10,8 @@
 #  GNU General Public License for more details.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 from scipy.constants import foot
 
@@ -56,6 +58,82 @@ def test_climb_fixed_altitude_at_constant_TAS(polar):
     run()
 
 
+def test_climb_with_adaptive_time_step(polar):
+    propulsion = FuelEngineSet(DummyEngine(1.0e5, 1.0e-5), 2)
+
+    segment = AltitudeChangeSegment(
+        target=FlightPoint(altitude=10000.0, equivalent_airspeed="constant"),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        thrust_rate=1.0,
+        time_step=0.2,
+        adaptive_time_step=True,
+        time_step_tolerance=1.0e-3,
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(altitude=5000.0, mass=70000.0, equivalent_airspeed=100.0)
+    )
+
+    # Same reference values as test_climb_fixed_altitude_at_constant_EAS()
+    last_point = flight_points.iloc[-1]
+    assert_allclose(last_point.altitude, 10000.0)
+    assert_allclose(last_point.equivalent_airspeed, 100.0)
+    assert_allclose(last_point.ground_distance, 20915.0, rtol=1e-3)
+    assert_allclose(last_point.time, 145.2, rtol=1e-2)
+    assert_allclose(last_point.true_airspeed, 172.3, atol=0.1)
+    assert_allclose(last_point.mass, 69710.0, rtol=1e-4)
+
+    # Time step has been increased, but not beyond maximum value
+    time_steps = np.diff(flight_points.time)
+    assert len(flight_points) < 145.2 / 0.2 / 3.0
+    assert np.all(time_steps[:-1] >= 0.2)
+    assert np.all(time_steps <= 20.0)
+
+
+@pytest.mark.parametrize("integrator", ["heun", "rk4"])
+def test_climb_with_higher_order_integrator(polar, integrator):
+    propulsion = FuelEngineSet(DummyEngine(1.0e5, 1.0e-5), 2)
+
+    segment = AltitudeChangeSegment(
+        target=FlightPoint(altitude=10000.0, equivalent_airspeed="constant"),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        thrust_rate=1.0,
+        time_step=10.0,
+        integrator=integrator,
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(altitude=5000.0, mass=70000.0, equivalent_airspeed=100.0)
+    )
+
+    # Note: reference values are obtained by running the process with Euler scheme
+    # and 0.01s as time step
+    last_point = flight_points.iloc[-1]
+    assert len(flight_points) == 16
+    assert_allclose(last_point.altitude, 10000.0)
+    assert_allclose(last_point.equivalent_airspeed, 100.0)
+    assert_allclose(last_point.time, 145.247, atol=2e-3)
+    assert_allclose(last_point.mass, 69709.505, atol=3e-3)
+    assert_allclose(last_point.ground_distance, 20915.30, atol=5e-2)
+
+    # With adaptive time step, only a few points are needed
+    segment.time_step = 0.2
+    segment.adaptive_time_step = True
+    flight_points = segment.compute_from(
+        FlightPoint(altitude=5000.0, mass=70000.0, equivalent_airspeed=100.0)
+    )
+    last_point = flight_points.iloc[-1]
+    assert_allclose(last_point.time, 145.247, atol=2e-3)
+    assert_allclose(last_point.mass, 69709.505, atol=3e-3)
+    assert_allclose(last_point.ground_distance, 20915.30, atol=5e-2)
+    if integrator == "rk4":
+        assert len(flight_points) < 15
+
+
 def test_climb_fixed_altitude_at_constant_EAS(polar):
     propulsion = FuelEngineSet(DummyEngine(1.0e5, 1.0e-5), 2)
 
@@ -11,8 +11,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 from numpy.testing import assert_allclose
+from scipy.constants import foot, g
+from stdatm import AtmosphereSI
 
 from fastoad.constants import EngineSetting
 from fastoad.model_base import FlightPoint
@@ -140,6 +145,53 @@ def test_optimal_cruise(polar):
     run()
 
 
+def test_optimal_altitude_profile(polar):
+    segment = OptimalCruiseSegment(
+        target=FlightPoint(ground_distance=5.0e5),
+        propulsion=FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2),
+        reference_area=120.0,
+        polar=polar,
+    )
+    masses = np.linspace(55000.0, 85000.0, 7)
+    altitudes = segment._get_optimal_altitude(masses, 0.78)
+
+    assert altitudes.shape == masses.shape
+    assert_allclose(altitudes, [segment._get_optimal_altitude(m, 0.78) for m in masses])
+    assert_allclose(altitudes[3], 9156.0, atol=1.0)  # same as in test_optimal_cruise()
+    for mass, altitude in zip(masses, altitudes):
+        atm = AtmosphereSI(altitude)
+        true_airspeed = 0.78 * atm.speed_of_sound
+        CL = mass * g / (0.5 * atm.density * true_airspeed**2 * 120.0)
+        assert_allclose(CL, polar.optimal_cl)
+
+
+def test_optimal_cruise_with_rk4(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2)
+
+    segment = OptimalCruiseSegment(
+        target=FlightPoint(ground_distance=5.0e5),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        time_step=600.0,
+        integrator="rk4",
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(mass=70000.0, time=1000.0, ground_distance=1e5, mach=0.78)
+    )
+
+    # Note: reference values are obtained by running the process with Euler scheme
+    # and 0.05s as time step
+    last_point = flight_points.iloc[-1]
+    assert len(flight_points) == 5
+    assert_allclose(flight_points.CL, polar.optimal_cl[0])
+    assert_allclose(last_point.ground_distance, 600000.0)
+    assert_allclose(last_point.altitude, 9196.171, atol=1e-3)
+    assert_allclose(last_point.time, 3115.337, atol=1e-3)
+    assert_allclose(last_point.mass, 69577.201, atol=1e-3)
+
+
 def test_climb_and_cruise_at_optimal_flight_level(polar):
     propulsion = FuelEngineSet(DummyEngine(0.5e5, 3.0e-5), 2)
     reference_area = 120.0
@@ -190,6 +242,50 @@ def test_climb_and_cruise_at_optimal_flight_level(polar):
     run()
 
 
+def test_climb_and_cruise_at_optimal_flight_level_search_modes(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 3.0e-5), 2)
+    reference_area = 120.0
+
+    def run(simulate_all_flight_levels):
+        segment = ClimbAndCruiseSegment(
+            target=FlightPoint(
+                ground_distance=5.0e6, altitude=AltitudeChangeSegment.OPTIMAL_FLIGHT_LEVEL
+            ),
+            propulsion=propulsion,
+            reference_area=reference_area,
+            polar=polar,
+            simulate_all_flight_levels=simulate_all_flight_levels,
+            climb_segment=AltitudeChangeSegment(
+                target=FlightPoint(),
+                propulsion=propulsion,
+                reference_area=reference_area,
+                polar=polar,
+                thrust_rate=0.9,
+            ),
+        )
+        return segment.compute_from(FlightPoint(mass=50000.0, altitude=8000.0, mach=0.78))
+
+    with patch.object(
+        FuelEngineSet,
+        "compute_flight_points",
+        autospec=True,
+        side_effect=FuelEngineSet.compute_flight_points,
+    ) as compute_flight_points:
+        reference_points = run(True)
+        reference_call_count = compute_flight_points.call_count
+        compute_flight_points.reset_mock()
+        flight_points = run(False)
+        assert compute_flight_points.call_count < reference_call_count / 5
+
+    # Same flight level is chosen, with same results, though cruise has been computed only once.
+    # (climb is done by steps to each flight level, which gives slightly different time steps)
+    assert_allclose(flight_points.altitude.iloc[-1], reference_points.altitude.iloc[-1])
+    assert_allclose(flight_points.altitude.iloc[-1] / foot, 38000.0)
+    assert_allclose(flight_points.ground_distance.iloc[-1], 5.0e6)
+    assert_allclose(flight_points.mass.iloc[-1], reference_points.mass.iloc[-1], rtol=1e-6)
+    assert_allclose(flight_points.time.iloc[-1], reference_points.time.iloc[-1], rtol=1e-6)
+
+
 def test_climb_and_cruise_at_optimal_flight_level_with_unpickable(polar, tmp_path):
     # Create temporary folder containing a dummy data file
     d = tmp_path / "sub"
@@ -12,6 +12,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import pytest
 from numpy.testing import assert_allclose
 
 from fastoad.constants import EngineSetting
@@ -55,6 +56,33 @@ def test_acceleration_to_TAS(polar):
     run()
 
 
+@pytest.mark.parametrize("integrator", ["euler", "rk4"])
+def test_acceleration_target_crossing(polar, integrator):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2)
+
+    segment = SpeedChangeSegment(
+        target=FlightPoint(equivalent_airspeed=200.0),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        thrust_rate=1.0,
+        time_step=2.0,
+        integrator=integrator,
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(altitude=5000.0, true_airspeed=150.0, mass=70000.0)
+    )
+    assert_allclose(flight_points.iloc[-1].equivalent_airspeed, 200.0, atol=1.0e-5)
+
+    # Crossing of target is located using interpolation, then only one flight point is computed.
+    counter = segment.target_crossing_counter
+    assert counter.crossings == 1
+    assert counter.point_evaluations == 1
+    assert counter.interpolated_evaluations > 1
+    assert counter.saved_evaluations == counter.interpolated_evaluations
+
+
 def test_acceleration_to_EAS(polar):
     propulsion = FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2)
 
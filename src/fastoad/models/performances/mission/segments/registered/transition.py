@@ -12,7 +12,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass
 
 import pandas as pd
@@ -54,7 +54,7 @@ class DummyTransitionSegment(AbstractFlightSegment):
     fuel_is_consumed: bool = True
 
     def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
-        end = deepcopy(target)
+        end = copy(target)
         end.name = self.name
         end.consumed_fuel = start.consumed_fuel
         if end.mass is None:
@@ -68,7 +68,7 @@ class DummyTransitionSegment(AbstractFlightSegment):
         flight_points = [start, end]
 
         if self.reserve_mass_ratio > 0.0:
-            reserve = deepcopy(end)
+            reserve = copy(end)
             reserve.mass = end.mass / (1.0 + self.reserve_mass_ratio)
             self.consume_fuel(
                 reserve, previous=end, mass_ratio=1.0 / (1.0 + self.reserve_mass_ratio)
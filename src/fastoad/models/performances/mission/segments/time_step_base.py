@@ -15,29 +15,72 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from deprecated import deprecated
 from numpy import cos, sin
 from scipy.constants import g
-from scipy.optimize import root_scalar
+from scipy.optimize import brentq, root_scalar
+from stdatm.state_parameters import GAMMA
 
 from fastoad.constants import EngineSetting
-from fastoad.model_base import FlightPoint
+from fastoad.model_base import FlightPoint, FlightPointBatch
 from fastoad.model_base.datacls import MANDATORY_FIELD
 from fastoad.model_base.propulsion import IPropulsion
 
 from .base import AbstractFlightSegment
+from .integrators import AbstractIntegrator, RegisterIntegrator
+from ..ensemble import (
+    MEMBER_COLUMN,
+    get_member_rows,
+    make_shared_batch,
+    select_members,
+)
 from ..polar import Polar
 from ..polar_modifier import AbstractPolarModifier, UnchangedPolar
+from ..trajectory import TrajectoryBuffer
 
 DEFAULT_TIME_STEP = 0.2
 
+# Absolute tolerances of integration error for adaptive time step, for fields that are
+# checked. They mostly matter when a field has a quasi-null variation.
+_ADAPTIVE_TIME_STEP_ABSOLUTE_TOLERANCES = {
+    "mass": 1.0e-3,  # kg
+    "altitude": 1.0e-2,  # m
+    "true_airspeed": 1.0e-3,  # m/s
+    "ground_distance": 1.0e-1,  # m
+}
+
 _LOGGER = logging.getLogger(__name__)  # Logger for this module
 
 
+@dataclass
+class TargetCrossingCounter:
+    """
+    Counts evaluations done when locating the point where a segment target is reached.
+    """
+
+    #: Number of times the target has been crossed.
+    crossings: int = 0
+
+    #: Number of computed flight points (each one needs calls to propulsion model).
+    point_evaluations: int = 0
+
+    #: Number of distance-to-target evaluations on interpolated flight points (no call to
+    #: propulsion model).
+    interpolated_evaluations: int = 0
+
+    @property
+    def saved_evaluations(self) -> int:
+        """
+        Estimate of the number of flight point evaluations that have been avoided, assuming each
+        evaluation on an interpolated point would otherwise need a computed flight point.
+        """
+        return self.interpolated_evaluations - (self.point_evaluations - self.crossings)
+
+
 @dataclass
 class AbstractTimeStepFlightSegment(
     AbstractFlightSegment,
@@ -71,6 +114,29 @@ class AbstractTimeStepFlightSegment(
     #: the flight path).
     time_step: float = DEFAULT_TIME_STEP
 
+    #: The integration scheme, among "euler" (default, one call to propulsion model per time
+    #: step), "heun" (second order, two calls) and "rk4" (fourth order, four calls).
+    #: Higher-order schemes allow larger time steps for a same accuracy.
+    integrator: str = "euler"
+
+    #: If True, time step is adapted at each step from an estimate of integration error,
+    #: between :attr:`minimum_time_step` and :attr:`maximum_time_step`.
+    #: :attr:`time_step` is then used for the first step.
+    adaptive_time_step: bool = False
+
+    #: Minimum time step when :attr:`adaptive_time_step` is True. If not provided,
+    #: :attr:`time_step` is used, i.e. time steps can only be larger than in fixed step mode.
+    minimum_time_step: Optional[float] = None
+
+    #: Maximum time step when :attr:`adaptive_time_step` is True. If not provided,
+    #: 100 times :attr:`time_step` is used.
+    maximum_time_step: Optional[float] = None
+
+    #: Relative tolerance when :attr:`adaptive_time_step` is True. For each time step, the
+    #: estimated integration error on mass, altitude, true airspeed and ground distance is kept
+    #: below this ratio of their variation during the time step.
+    time_step_tolerance: float = 1.0e-3
+
     # The maximum lift coefficient for optimal climb and cruise segments
     maximum_CL: float = None
 
@@ -90,6 +156,21 @@ class AbstractTimeStepFlightSegment(
     #: propulsion model.
     engine_setting: EngineSetting = EngineSetting.CLIMB
 
+    # Counts of evaluations done for reaching target
+    _target_crossing_counter: TargetCrossingCounter = field(
+        default_factory=TargetCrossingCounter, init=False, repr=False
+    )
+
+    # Integration scheme, resolved from :attr:`integrator` once per computation
+    _integrator: Optional[AbstractIntegrator] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def target_crossing_counter(self) -> TargetCrossingCounter:
+        """Counts of evaluations done for reaching target in all computations of the segment."""
+        return self._target_crossing_counter
+
     @abstractmethod
     def get_distance_to_target(
         self, flight_points: List[FlightPoint], target: FlightPoint
@@ -126,7 +207,7 @@ class AbstractTimeStepFlightSegment(
 
         Generally, this method should end with::
 
-            self.propulsion.compute_flight_points(flight_point)
+            self._run_propulsion_model(flight_point)
 
         :param flight_point:
         """
@@ -154,6 +235,38 @@ class AbstractTimeStepFlightSegment(
         """
         return 0.0
 
+    def get_integrated_field_names(self) -> List[str]:
+        """
+        Provides names of flight point fields that are integrated over time.
+
+        Fields that are computed by :meth:`compute_next_flight_point` and that are not listed
+        here are recomputed by :meth:`update_non_integrated_fields` when the integration scheme
+        needs intermediate points.
+
+        :return: list of field names
+        """
+        return [
+            "mass",
+            "consumed_fuel",
+            "ground_distance",
+            "altitude",
+            "true_airspeed",
+            "alpha",
+            "slope_angle",
+        ]
+
+    def update_non_integrated_fields(self, flight_point: FlightPoint, previous_point: FlightPoint):
+        """
+        Updates fields that are computed by :meth:`compute_next_flight_point` without being
+        integrated (see :meth:`get_integrated_field_names`), once integrated fields of
+        flight_point have been set by the integration scheme.
+
+        Does nothing by default.
+
+        :param flight_point: the (not completed) flight point to update
+        :param previous_point: the flight point from which flight_point is computed
+        """
+
     def complete_flight_point(self, flight_point: FlightPoint):
         super().complete_flight_point(flight_point)
         flight_point.engine_setting = self.engine_setting
@@ -166,45 +279,29 @@ class AbstractTimeStepFlightSegment(
         flight_point.scalarize()
 
     def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
-        flight_points = [start]
+        self._prepare_start_and_target(start, target)
+        self._integrator = RegisterIntegrator.get_class(self.integrator)()
+        flight_points = TrajectoryBuffer([start])
         previous_point_to_target = self.get_distance_to_target(flight_points, target)
         tol = 1.0e-5  # Such accuracy is not needed, but ensures reproducibility of results.
+        time_step = next_time_step = self.time_step
         while np.abs(previous_point_to_target) > tol:
-            self._add_new_flight_point(flight_points, self.time_step)
+            if self.adaptive_time_step:
+                time_step, next_time_step = self._add_new_flight_point_with_adaptive_time_step(
+                    flight_points, next_time_step
+                )
+            else:
+                self._add_new_flight_point(flight_points, time_step)
             last_point_to_target = self.get_distance_to_target(flight_points, target)
 
             if (
                 np.abs(last_point_to_target) > tol
                 and last_point_to_target * previous_point_to_target < 0.0
             ):
-                # Target has been exceeded. Let's look for the exact time step using root_scalar.
-                def replace_last_point(time_step):
-                    """
-                    Replaces last point of flight_points.
-
-                    :param time_step: time step for new point
-                    :return: new distance to target
-                    """
-
-                    if isinstance(time_step, np.ndarray):
-                        # root_scalar() will provide time_step ad (1,) array, resulting
-                        # in all parameters of the new flight point being also (1,) arrays.
-                        # We want to avoid that
-                        time_step = time_step.item()
-                    del flight_points[-1]
-                    self._add_new_flight_point(flight_points, time_step)
-                    return self.get_distance_to_target(flight_points, target)
-
-                rtol = tol
-                while np.abs(last_point_to_target) > tol:
-                    rtol *= 0.1
-                    root_scalar(
-                        replace_last_point,
-                        x0=self.time_step,
-                        x1=self.time_step / 2.0,
-                        rtol=rtol,
-                    )
-                    last_point_to_target = self.get_distance_to_target(flight_points, target)
+                # Target has been exceeded. Let's look for the exact time step.
+                last_point_to_target = self._replace_last_point_on_target(
+                    flight_points, target, tol
+                )
             elif (
                 np.abs(last_point_to_target) > np.abs(previous_point_to_target)
                 # If self.target.CL is defined, it means that we look for an optimal altitude and
@@ -220,15 +317,298 @@ class AbstractTimeStepFlightSegment(
                 del flight_points[-1]
                 break
 
-            msg = self._check_values(flight_points[-1])
-            if msg:
-                _LOGGER.warning('%s Segment computation interrupted in "%s".', msg, self.name)
+            if self._log_invalid_values(flight_points[-1]):
                 break
 
             previous_point_to_target = last_point_to_target
 
-        flight_points_df = pd.DataFrame(flight_points)
-        return flight_points_df
+        return flight_points.to_dataframe()
+
+    def compute_ensemble_from(self, starts: Sequence[FlightPoint]) -> pd.DataFrame:
+        """
+        Members are integrated in lockstep: at each time step, the flight points of all members
+        that have not reached their target yet are computed at once, as arrays of a
+        :class:`~fastoad.model_base.flight_point.FlightPointBatch` instance. Therefore, the
+        propulsion model is called with
+        :meth:`~fastoad.model_base.propulsion.IPropulsion.compute_flight_points_batch`
+        once per evaluation for all members. When a member has reached its target, it is
+        removed from the batch. Its last time step, that reaches the target, is computed
+        alone, as in :meth:`compute_from`.
+
+        Methods that are called at each time step (e.g. :meth:`get_distance_to_target`,
+        :meth:`compute_propulsion`) have to accept flight points with array values.
+        Members are computed one by one if the segment overloads :meth:`compute_from`,
+        :meth:`compute_from_start_to_target` or :meth:`_check_values`, or if
+        :attr:`adaptive_time_step` is True, since members would need different time steps.
+        """
+        if not starts or not self._can_compute_in_lockstep():
+            return super().compute_ensemble_from(starts)
+
+        member_starts = []
+        member_targets = []
+        for start in starts:
+            start_copy, target_copy = self._get_start_and_target(start)
+            self._prepare_start_and_target(start_copy, target_copy)
+            member_starts.append(start_copy)
+            member_targets.append(target_copy)
+
+        return self._compute_in_lockstep(member_starts, member_targets)
+
+    def _prepare_start_and_target(self, start: FlightPoint, target: FlightPoint):
+        """
+        Modifies in place start and target flight points, if needed, before time steps are
+        computed.
+
+        It is called for each computed trajectory, once generic preprocessing of
+        :meth:`compute_from` has been done. Does nothing by default.
+
+        :param start: the start point of the segment
+        :param target: the target of the segment, with absolute values
+        """
+
+    def _can_compute_in_lockstep(self) -> bool:
+        """
+        :return: True if :meth:`compute_ensemble_from` can integrate all members at once
+        """
+        segment_class = type(self)
+        return (
+            not self.adaptive_time_step
+            and segment_class.compute_from is AbstractFlightSegment.compute_from
+            and segment_class.compute_from_start_to_target
+            is AbstractTimeStepFlightSegment.compute_from_start_to_target
+            and segment_class._check_values is AbstractTimeStepFlightSegment._check_values
+        )
+
+    def _compute_in_lockstep(
+        self, starts: List[FlightPoint], targets: List[FlightPoint]
+    ) -> pd.DataFrame:
+        """
+        Time loop of :meth:`compute_ensemble_from`, equivalent to the one of
+        :meth:`compute_from_start_to_target` for each member.
+
+        :param starts: the start point of each member, once prepared
+        :param targets: the target of each member, with absolute values
+        :return: flight points of all members, in long format
+        """
+        self._integrator = RegisterIntegrator.get_class(self.integrator)()
+        tol = 1.0e-5  # Same as in compute_from_start_to_target()
+
+        # Computed flight points of all members, in computation order
+        flight_points = TrajectoryBuffer(starts)
+        members = list(range(len(starts)))
+
+        # Indices of members that have not reached their target, and their data as batches
+        active = np.arange(len(starts))
+        start = FlightPointBatch.from_flight_points(starts)
+        target = make_shared_batch(targets)
+        previous = start
+        previous_point_to_target = self._get_distances_to_target([start], target, len(active))
+
+        is_active = np.abs(previous_point_to_target) > tol
+        while np.any(is_active):
+            if not np.all(is_active):
+                active = active[is_active]
+                start = select_members(start, is_active)
+                target = select_members(target, is_active)
+                previous = select_members(previous, is_active)
+                previous_point_to_target = previous_point_to_target[is_active]
+
+            last, _ = self._integrator.compute_step(self, [start, previous], self.time_step)
+            last_point_to_target = self._get_distances_to_target([start, last], target, len(active))
+
+            crossed = (np.abs(last_point_to_target) > tol) & (
+                last_point_to_target * previous_point_to_target < 0.0
+            )
+            further = (
+                ~crossed
+                & (np.abs(last_point_to_target) > np.abs(previous_point_to_target))
+                & self.interrupt_if_getting_further_from_target
+            )
+            stepped = ~crossed & ~further
+
+            if np.all(stepped):
+                flight_points.extend_from_rows(get_member_rows(last, len(active)), len(active))
+            elif np.any(stepped):
+                flight_points.extend_from_rows(
+                    get_member_rows(select_members(last, stepped), np.count_nonzero(stepped))
+                )
+            members.extend(active[stepped])
+
+            if np.any(further):
+                # We get further from target. Let's stop without this point.
+                _LOGGER.warning(
+                    'Target cannot be reached in "%s" for ensemble members %s. Segment '
+                    "computation interrupted. Please review the segment settings, "
+                    "especially thrust_rate.",
+                    self.name,
+                    active[further].tolist(),
+                )
+
+            # Target has been exceeded. Let's look for the exact time step, member by member.
+            stopped = further.copy()
+            for index in np.flatnonzero(crossed):
+                member = active[index]
+                member_points = [starts[member], previous[index], last[index]]
+                last_point_to_target[index] = self._replace_last_point_on_target(
+                    member_points, targets[member], tol
+                )
+                flight_points.append(member_points[-1])
+                members.append(member)
+                stopped[index] = self._log_invalid_values(member_points[-1])
+
+            for index in np.flatnonzero(stepped & self._get_out_of_bounds_mask(last)):
+                stopped[index] = self._log_invalid_values(last[index])
+
+            is_active = ~stopped & (np.abs(last_point_to_target) > tol)
+            previous = last
+            previous_point_to_target = last_point_to_target
+
+        order = np.argsort(members, kind="stable")
+        ensemble_flight_points = flight_points.to_dataframe(order)
+        ensemble_flight_points.insert(0, MEMBER_COLUMN, np.asarray(members)[order])
+        return ensemble_flight_points
+
+    def _get_distances_to_target(
+        self, flight_points: List[FlightPointBatch], target: FlightPointBatch, member_count: int
+    ) -> np.ndarray:
+        """
+        :param flight_points: flight points of members, as batches
+        :param target: targets of members
+        :param member_count: number of members in batches
+        :return: the distance to target of each member
+        """
+        distances = self.get_distance_to_target(flight_points, target)
+        return np.array(np.broadcast_to(distances, (member_count,)), dtype=float)
+
+    def _get_out_of_bounds_mask(self, flight_points: FlightPointBatch) -> np.ndarray:
+        """
+        Array version of the checks of :meth:`_check_values`.
+
+        :param flight_points:
+        :return: True for flight points where computation should be interrupted
+        """
+        mach = flight_points.mach
+        altitude = flight_points.altitude
+        return (
+            ~((self.mach_bounds[0] <= mach) & (mach <= self.mach_bounds[1]))
+            | ~((self.altitude_bounds[0] <= altitude) & (altitude <= self.altitude_bounds[1]))
+            | (flight_points.mass <= 0.0)
+        )
+
+    def _log_invalid_values(self, flight_point: FlightPoint) -> bool:
+        """
+        :param flight_point:
+        :return: True if :meth:`_check_values` found inconsistent values, that have been logged
+        """
+        msg = self._check_values(flight_point)
+        if msg:
+            _LOGGER.warning('%s Segment computation interrupted in "%s".', msg, self.name)
+        return bool(msg)
+
+    def _replace_last_point_on_target(
+        self, flight_points: List[FlightPoint], target: FlightPoint, tol: float
+    ) -> float:
+        """
+        Replaces last flight point, that is beyond target, by a flight point on target.
+
+        The time step that reaches the target is searched using the dense output of the
+        integrator (see :meth:`~.integrators.AbstractIntegrator.interpolate`), that needs no
+        call to propulsion model. Generally, the flight point computed with this time step is
+        on target. Otherwise, the time step is refined using root_scalar.
+
+        :param flight_points: list of flight points, modified in place.
+        :param target: segment target
+        :param tol: accepted absolute value for distance to target
+        :return: the distance to target of the new last flight point
+        """
+        counter = self.target_crossing_counter
+        counter.crossings += 1
+        integrator = self._get_integrator()
+        last_step_points = [flight_points[0], flight_points[-2], flight_points[-1]]
+        time_step = last_step_points[2].time - last_step_points[1].time
+
+        def get_interpolated_distance(time_ratio):
+            counter.interpolated_evaluations += 1
+            flight_point = self._compute_interpolated_flight_point(
+                integrator, last_step_points, time_ratio
+            )
+            return self.get_distance_to_target([last_step_points[0], flight_point], target)
+
+        try:
+            time_ratio = brentq(get_interpolated_distance, 0.0, 1.0, xtol=1.0e-12)
+        except ValueError:
+            # Target is not crossed by the interpolation. Let's use a linear one.
+            previous_distance = self.get_distance_to_target(last_step_points[:2], target)
+            last_distance = self.get_distance_to_target(last_step_points, target)
+            time_ratio = previous_distance / (previous_distance - last_distance)
+
+        def replace_last_point(time_step):
+            """
+            Replaces last point of flight_points.
+
+            :param time_step: time step for new point
+            :return: new distance to target
+            """
+            if isinstance(time_step, np.ndarray):
+                # root_scalar() will provide time_step ad (1,) array, resulting
+                # in all parameters of the new flight point being also (1,) arrays.
+                # We want to avoid that
+                time_step = time_step.item()
+            counter.point_evaluations += 1
+            del flight_points[-1]
+            self._add_new_flight_point(flight_points, time_step)
+            return self.get_distance_to_target(flight_points, target)
+
+        last_point_to_target = replace_last_point(time_ratio * time_step)
+
+        rtol = tol
+        while np.abs(last_point_to_target) > tol:
+            rtol *= 0.1
+            root_scalar(
+                replace_last_point,
+                x0=time_ratio * time_step,
+                x1=time_step,
+                rtol=rtol,
+            )
+            last_point_to_target = self.get_distance_to_target(flight_points, target)
+
+        _LOGGER.debug(
+            '"%s": target reached with %i flight point evaluation(s).',
+            self.name,
+            counter.point_evaluations,
+        )
+        return last_point_to_target
+
+    def _compute_interpolated_flight_point(
+        self, integrator: AbstractIntegrator, flight_points: List[FlightPoint], time_ratio: float
+    ) -> FlightPoint:
+        """
+        Computes a flight point inside the last time step, without calling propulsion model.
+
+        Integrated fields come from the dense output of the integrator, speeds are made
+        consistent, and other fields are linearly interpolated between the two last points.
+
+        :param integrator: the integration scheme
+        :param flight_points: list of flight points, with at least 2 elements
+        :param time_ratio: position of computed point in last time step, from 0.0 to 1.0
+        :return: the interpolated flight point
+        """
+        previous = flight_points[-2]
+        last = flight_points[-1]
+        flight_point = integrator.interpolate(self, flight_points, time_ratio)
+        self._complete_speed_values(flight_point)
+
+        for name in FlightPoint.get_field_names():
+            if getattr(flight_point, name) is None:
+                previous_value = getattr(previous, name)
+                last_value = getattr(last, name)
+                if isinstance(last_value, float) and isinstance(previous_value, float):
+                    value = previous_value + time_ratio * (last_value - previous_value)
+                else:
+                    value = last_value
+                setattr(flight_point, name, value)
+
+        return flight_point
 
     def compute_next_flight_point(
         self, flight_points: List[FlightPoint], time_step: float
@@ -242,7 +622,7 @@ class AbstractTimeStepFlightSegment(
         """
         start = flight_points[0]
         previous = flight_points[-1]
-        next_point = FlightPoint()
+        next_point = FlightPointBatch() if isinstance(previous, FlightPointBatch) else FlightPoint()
 
         next_point.isa_offset = self.isa_offset
         consumed_mass = self.propulsion.get_consumed_mass(previous, time_step)
@@ -274,13 +654,23 @@ class AbstractTimeStepFlightSegment(
         """
         Fills values for `CL`, `CD`, `lift` and `drag` in provided `flight_point`.
         """
-        atm = self._get_atmosphere_point(flight_point.altitude)
-        reference_force = 0.5 * atm.density * flight_point.true_airspeed**2 * self.reference_area
-        if self.polar and reference_force:
+        density = self._get_atmosphere_state(flight_point.altitude).density
+        reference_force = 0.5 * density * flight_point.true_airspeed**2 * self.reference_area
+        if self.polar and np.all(reference_force):
             modified_polar = self.polar_modifier.modify_polar(self.polar, flight_point)
             self.compute_lift(flight_point, reference_force, modified_polar)
             flight_point.CD = modified_polar.cd(flight_point.CL)
             flight_point.drag = flight_point.CD * reference_force
+        elif self.polar and np.any(reference_force):
+            # Flight points of a batch where speed is null get null aerodynamic forces.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                modified_polar = self.polar_modifier.modify_polar(self.polar, flight_point)
+                self.compute_lift(flight_point, reference_force, modified_polar)
+                is_flying = reference_force != 0.0
+                flight_point.CL = np.where(is_flying, flight_point.CL, 0.0)
+                flight_point.lift = np.where(is_flying, flight_point.lift, 0.0)
+                flight_point.CD = np.where(is_flying, modified_polar.cd(flight_point.CL), 0.0)
+                flight_point.drag = flight_point.CD * reference_force
         else:
             flight_point.CL = flight_point.CD = flight_point.lift = flight_point.drag = 0.0
 
@@ -302,16 +692,95 @@ class AbstractTimeStepFlightSegment(
             return "Negative mass value."
         return None
 
-    def _add_new_flight_point(self, flight_points: List[FlightPoint], time_step):
+    def _run_propulsion_model(self, flight_point: FlightPoint):
+        """
+        Computes propulsion data for provided flight point, or for all flight points of
+        provided FlightPointBatch instance.
+
+        :param flight_point: the flight point, modified in place
+        """
+        if isinstance(flight_point, FlightPointBatch):
+            self.propulsion.compute_flight_points_batch(flight_point)
+        else:
+            self.propulsion.compute_flight_points(flight_point)
+
+    def _add_new_flight_point(
+        self, flight_points: List[FlightPoint], time_step, estimate_error: bool = False
+    ) -> Optional[Dict[str, float]]:
         """
         Appends a new flight point to provided flight point list.
 
         :param flight_points: list of previous flight points, modified in place.
         :param time_step: time step for new computed flight point.
+        :param estimate_error: if True, the integration error of the new point is estimated.
+        :return: the estimated integration errors if required, None otherwise
         """
-        new_point = self.compute_next_flight_point(flight_points, time_step)
-        self.complete_flight_point(new_point)
+        new_point, errors = self._get_integrator().compute_step(
+            self, flight_points, time_step, estimate_error=estimate_error
+        )
         flight_points.append(new_point)
+        return errors
+
+    def _get_integrator(self) -> AbstractIntegrator:
+        if self._integrator is None:
+            self._integrator = RegisterIntegrator.get_class(self.integrator)()
+        return self._integrator
+
+    def _add_new_flight_point_with_adaptive_time_step(
+        self, flight_points: List[FlightPoint], time_step: float
+    ) -> Tuple[float, float]:
+        """
+        Appends a new flight point to provided flight point list, with a time step that is
+        reduced as long as estimated integration error is too large.
+
+        :param flight_points: list of previous flight points, modified in place.
+        :param time_step: first tried time step
+        :return: the time step used for the new flight point, and the time step to be tried
+                 for next flight point
+        """
+        minimum_time_step = self.minimum_time_step or self.time_step
+        maximum_time_step = self.maximum_time_step or 100.0 * self.time_step
+        time_step = np.clip(time_step, minimum_time_step, maximum_time_step)
+        error_order = self._get_integrator().error_order
+
+        while True:
+            errors = self._add_new_flight_point(flight_points, time_step, estimate_error=True)
+            error_ratio = self._get_integration_error_ratio(flight_points, errors)
+
+            # Integration error is in time_step**error_order.
+            # The 0.9 factor avoids being always at limit of tolerance.
+            step_factor = 0.9 * error_ratio ** (-1.0 / error_order) if error_ratio > 0.0 else np.inf
+            if error_ratio <= 1.0 or time_step <= minimum_time_step:
+                next_time_step = np.clip(
+                    time_step * min(step_factor, 5.0), minimum_time_step, maximum_time_step
+                )
+                return time_step, next_time_step
+
+            del flight_points[-1]
+            time_step = max(time_step * max(step_factor, 0.2), minimum_time_step)
+
+    def _get_integration_error_ratio(
+        self, flight_points: List[FlightPoint], errors: Dict[str, float]
+    ) -> float:
+        """
+        Compares the estimated integration errors of last time step to tolerances.
+
+        :param flight_points: list of flight points, with at least 2 elements.
+        :param errors: estimated errors, as provided by the integrator
+        :return: the max ratio between estimated error and tolerance for checked fields. A value
+                 above 1.0 means the time step should be reduced.
+        """
+        previous = flight_points[-2]
+        last = flight_points[-1]
+
+        error_ratio = 0.0
+        for name, error in errors.items():
+            absolute_tolerance = _ADAPTIVE_TIME_STEP_ABSOLUTE_TOLERANCES[name]
+            variation = getattr(last, name) - getattr(previous, name)
+            tolerance = absolute_tolerance + self.time_step_tolerance * abs(variation)
+            error_ratio = max(error_ratio, error / tolerance)
+
+        return error_ratio
 
     @staticmethod
     def _compute_next_altitude(next_point: FlightPoint, previous_point: FlightPoint):
@@ -322,36 +791,30 @@ class AbstractTimeStepFlightSegment(
         )
 
     def _get_optimal_altitude(
-        self, mass: float, mach: float, altitude_guess: float = None
-    ) -> float:
+        self, mass: Union[float, np.ndarray], mach: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
         Computes optimal altitude for provided mass and Mach number.
 
+        As lift is 0.5 * GAMMA * pressure * mach**2 * reference_area * CL, the optimal altitude
+        is obtained analytically from the pressure that matches optimal CL.
+
+        Arrays can be provided for mass and Mach number to get an optimal altitude profile.
+
         :param mass:
         :param mach:
         :return: altitude that matches optimal CL
         """
+        optimal_pressure = (
+            2.0 * np.asarray(mass) * g / (GAMMA * self.reference_area * np.asarray(mach) ** 2)
+        ) / self._get_optimal_cl()
+        return self.atmosphere.get_altitude_from_pressure(optimal_pressure)
 
-        if altitude_guess is None:
-            altitude_guess = 10000.0
-
-        def distance_to_optimum(altitude):
-            atm = self._get_atmosphere_point(altitude)
-            true_airspeed = mach * atm.speed_of_sound
-            if self.maximum_CL is not None:
-                CL_optimal = min(self.polar.optimal_cl, self.maximum_CL)
-            else:
-                CL_optimal = self.polar.optimal_cl
-            optimal_air_density = (
-                2.0 * mass * g / (self.reference_area * true_airspeed**2 * CL_optimal)
-            )
-            return (atm.density - optimal_air_density) * 100.0
-
-        optimal_altitude = root_scalar(
-            distance_to_optimum, x0=altitude_guess, x1=altitude_guess - 1000.0
-        ).root
-
-        return optimal_altitude
+    def _get_optimal_cl(self) -> float:
+        optimal_cl = np.asarray(self.polar.optimal_cl).item()
+        if self.maximum_CL is not None:
+            return min(optimal_cl, self.maximum_CL)
+        return optimal_cl
 
 
 @dataclass
@@ -367,7 +830,7 @@ class AbstractManualThrustSegment(AbstractTimeStepFlightSegment, ABC):
     def compute_propulsion(self, flight_point: FlightPoint):
         flight_point.thrust_rate = self.thrust_rate
         flight_point.thrust_is_regulated = False
-        self.propulsion.compute_flight_points(flight_point)
+        self._run_propulsion_model(flight_point)
 
 
 @dataclass
@@ -385,7 +848,7 @@ class AbstractRegulatedThrustSegment(AbstractTimeStepFlightSegment, ABC):
     def compute_propulsion(self, flight_point: FlightPoint):
         flight_point.thrust = flight_point.drag
         flight_point.thrust_is_regulated = True
-        self.propulsion.compute_flight_points(flight_point)
+        self._run_propulsion_model(flight_point)
 
     def get_gamma_and_acceleration(self, flight_point: FlightPoint) -> Tuple[float, float]:
         return 0.0, 0.0
@@ -0,0 +1,149 @@
+"""
+Secant solver used for adjusting cruise distances, with warm-start capability.
+"""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)  # Logger for this module
+
+
+@dataclass
+class SolverState:
+    """
+    Result of a solving process, used to warm-start the next solving of a similar problem.
+    """
+
+    #: The last obtained solution.
+    solution: Optional[np.ndarray] = None
+
+    #: The last estimate of the jacobian matrix of residuals with respect to unknowns.
+    jacobian: Optional[np.ndarray] = None
+
+    #: Number of residual evaluations during last solving process.
+    evaluation_count: int = 0
+
+    def is_usable_for(self, x0: np.ndarray) -> bool:
+        """
+        :param x0: initial guess of the problem to solve
+        :return: True if current state can be used for warm-starting the problem
+        """
+        return (
+            self.solution is not None
+            and self.jacobian is not None
+            and np.shape(self.solution) == np.shape(x0)
+        )
+
+    def reset(self):
+        """Forgets the last solution, so that next solving process will be cold-started."""
+        self.solution = None
+        self.jacobian = None
+        self.evaluation_count = 0
+
+
+def solve_with_secant(
+    func: Callable,
+    x0,
+    x1,
+    xtol,
+    state: Optional[SolverState] = None,
+    maxiter: int = 50,
+) -> np.ndarray:
+    """
+    Finds a root of `func` with the secant method.
+
+    With several unknowns, the secant method is generalized with Broyden's method.
+
+    On cold start, the initial jacobian matrix is estimated by finite differences
+    between `x0` and `x1`, coordinate by coordinate. With only one unknown, the process is
+    the one of :func:`scipy.optimize.root_scalar` with `method="secant"`.
+
+    If `state` contains a previous solution with same dimension, the process starts from this
+    solution and its jacobian matrix (`x0` and `x1` are then ignored). If the
+    problem did not change much, only one evaluation of `func` may be needed.
+    At the end of the process, `state` is updated with the obtained solution.
+
+    As with :func:`scipy.optimize.root_scalar`, the process stops when the next step is below
+    `xtol`, without evaluating `func` at the returned solution.
+
+    :param func: the function that provides the residuals, as a 1D array, for a 1D array of
+                 unknowns
+    :param x0: initial guess
+    :param x1: second guess, for estimating the initial jacobian matrix
+    :param xtol: the tolerance on unknowns (scalar or one value per unknown)
+    :param state: if provided, used for warm start, and updated with the new solution
+    :param maxiter: maximum number of steps
+    :return: the solution
+    """
+    x0 = np.atleast_1d(np.asarray(x0, dtype=float))
+    x1 = np.atleast_1d(np.asarray(x1, dtype=float))
+    xtol = np.broadcast_to(xtol, x0.shape)
+
+    evaluation_count = 0
+
+    def _evaluate(x):
+        nonlocal evaluation_count
+        evaluation_count += 1
+        return np.atleast_1d(np.asarray(func(x), dtype=float))
+
+    if state is not None and state.is_usable_for(x0):
+        x = np.array(state.solution, dtype=float)
+        jacobian = np.array(state.jacobian, dtype=float)
+        residuals = _evaluate(x)
+    else:
+        x = x0
+        residuals = _evaluate(x)
+        jacobian = np.zeros((len(x0), len(x0)))
+        for i, value in enumerate(x1):
+            next_x = x.copy()
+            next_x[i] = value
+            next_residuals = _evaluate(next_x)
+            jacobian[:, i] = (next_residuals - residuals) / (next_x[i] - x[i])
+            x, residuals = next_x, next_residuals
+
+    solution = x
+    is_singular = False
+    for _ in range(maxiter):
+        try:
+            step = -np.linalg.solve(jacobian, residuals)
+        except np.linalg.LinAlgError:
+            _LOGGER.warning("Secant solver stopped on singular jacobian matrix.")
+            is_singular = True
+            break
+
+        solution = x + step
+        if np.all(np.abs(step) < xtol):
+            break
+
+        new_residuals = _evaluate(solution)
+        jacobian += np.outer(new_residuals - residuals - jacobian @ step, step) / (step @ step)
+        x, residuals = solution, new_residuals
+    else:
+        _LOGGER.warning("Secant solver did not converge after %i iterations.", maxiter)
+
+    _LOGGER.debug("Secant solver ended after %i evaluations.", evaluation_count)
+
+    if state is not None:
+        if not is_singular and np.all(np.isfinite(solution)) and np.all(np.isfinite(jacobian)):
+            state.solution = solution
+            state.jacobian = jacobian
+        else:
+            state.reset()
+        state.evaluation_count = evaluation_count
+
+    return solution
@@ -0,0 +1,134 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from stdatm import AtmosphereSI
+
+from ..atmosphere import AtmosphereProvider
+
+ALTITUDES = [-500.0, 0.0, 1234.5, 10999.0, 11000.0, 11001.0, 13456.7, 30000.0]
+
+
+@pytest.mark.parametrize("isa_offset", [0.0, 15.0, -10.0])
+def test_atmosphere_provider_states(isa_offset):
+    exact_provider = AtmosphereProvider()
+    tabulated_provider = AtmosphereProvider(tabulated=True)
+
+    for altitude in ALTITUDES:
+        atm = AtmosphereSI(altitude, isa_offset)
+        expected = [atm.temperature, atm.pressure, atm.density, atm.speed_of_sound]
+
+        assert_allclose(exact_provider.get_state(altitude, isa_offset), expected, rtol=1e-12)
+        assert_allclose(tabulated_provider.get_state(altitude, isa_offset), expected, rtol=1e-6)
+
+        atm_point = exact_provider.get_atmosphere_point(altitude, isa_offset)
+        atm_point.mach = 0.5
+        assert_allclose(atm_point.density, atm.density, rtol=1e-12)
+        assert_allclose(atm_point.true_airspeed, 0.5 * atm.speed_of_sound, rtol=1e-12)
+
+    # Arrays of altitudes
+    for provider in [exact_provider, tabulated_provider]:
+        states = provider.get_state(np.array(ALTITUDES), isa_offset)
+        expected = [provider.get_state(altitude, isa_offset) for altitude in ALTITUDES]
+        assert_allclose(np.transpose(states), expected, rtol=1e-12)
+
+
+def test_atmosphere_provider_speeds():
+    atmosphere = AtmosphereProvider()
+    atm = AtmosphereSI(5000.0, 10.0)
+    atm.mach = 0.6
+    expected = (atm.true_airspeed, atm.equivalent_airspeed, atm.mach)
+
+    assert_allclose(atmosphere.compute_speeds(5000.0, 10.0, mach=0.6), expected, rtol=1e-12)
+    assert_allclose(
+        atmosphere.compute_speeds(5000.0, 10.0, true_airspeed=atm.true_airspeed),
+        expected,
+        rtol=1e-12,
+    )
+    assert_allclose(
+        atmosphere.compute_speeds(5000.0, 10.0, equivalent_airspeed=atm.equivalent_airspeed),
+        expected,
+        rtol=1e-12,
+    )
+
+    # True airspeed has priority
+    assert_allclose(
+        atmosphere.compute_speeds(5000.0, 10.0, true_airspeed=atm.true_airspeed, mach=0.1),
+        expected,
+        rtol=1e-12,
+    )
+
+    assert atmosphere.compute_speeds(5000.0, 10.0) == (None, None, None)
+
+
+def test_atmosphere_provider_cache():
+    atmosphere = AtmosphereProvider(cache_size=10)
+    first_state = atmosphere.get_state(0.0)
+    for altitude in np.linspace(100.0, 1000.0, 9):
+        atmosphere.get_state(altitude)
+
+    # Cache is full, and stored states are reused
+    assert len(atmosphere._cache) == 10
+    assert atmosphere.get_state(0.0) is first_state
+
+    # Least recently used state is removed when needed
+    atmosphere.get_state(5000.0)
+    assert len(atmosphere._cache) == 10
+    assert (100.0, 0.0) not in atmosphere._cache
+    assert (0.0, 0.0) in atmosphere._cache
+
+    copied_atmosphere = deepcopy(atmosphere)
+    assert copied_atmosphere.get_state(0.0) == first_state
+
+    atmosphere.clear_cache()
+    assert len(atmosphere._cache) == 0
+
+
+@pytest.mark.parametrize("isa_offset", [0.0, 15.0, -10.0])
+def test_atmosphere_provider_inverse(isa_offset):
+    altitudes = np.array(ALTITUDES + [np.nextafter(11000.0, 0.0)])
+    atm = AtmosphereSI(altitudes, isa_offset)
+
+    assert_allclose(
+        AtmosphereProvider.get_altitude_from_pressure(atm.pressure), altitudes, atol=1e-8
+    )
+    assert_allclose(
+        AtmosphereProvider.get_altitude_from_density(atm.density, isa_offset),
+        altitudes,
+        atol=1e-8,
+    )
+    assert_allclose(
+        AtmosphereProvider.get_altitude_from_temperature(atm.temperature, isa_offset),
+        np.minimum(altitudes, 11000.0),
+        atol=1e-8,
+    )
+
+    # Scalar values
+    for altitude in ALTITUDES:
+        atm = AtmosphereSI(altitude, isa_offset)
+        altitude_from_density = AtmosphereProvider.get_altitude_from_density(
+            atm.density, isa_offset
+        )
+        assert isinstance(altitude_from_density, float)
+        assert_allclose(altitude_from_density, altitude, atol=1e-8)
+        assert_allclose(
+            AtmosphereProvider.get_altitude_from_pressure(atm.pressure), altitude, atol=1e-8
+        )
+
+    # Pressure values that are between the two sides of the discontinuity at tropopause
+    pressure = 0.5 * (AtmosphereSI(11000.0).pressure + AtmosphereSI(10999.9999999).pressure)
+    assert AtmosphereProvider.get_altitude_from_pressure(pressure) == 11000.0
@@ -0,0 +1,177 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import patch
+
+import pytest
+from numpy.testing import assert_allclose
+from scipy.constants import foot, knot
+
+from fastoad.constants import EngineSetting
+from fastoad.model_base import FlightPoint
+from fastoad.model_base.propulsion import FuelEngineSet
+
+from ..base import FlightSequence
+from ..ensemble import MEMBER_COLUMN
+from ..segments.registered.altitude_change import AltitudeChangeSegment
+from ..segments.registered.cruise import CruiseSegment, OptimalCruiseSegment
+from ..segments.registered.hold import HoldSegment
+from ..segments.registered.speed_change import SpeedChangeSegment
+
+MASSES = [60000.0, 70000.0, 80000.0]
+
+
+@pytest.fixture
+def flight_sequence(propulsion, high_speed_polar) -> FlightSequence:
+    kwargs = dict(propulsion=propulsion, reference_area=120.0, polar=high_speed_polar)
+    sequence = FlightSequence()
+    sequence.extend(
+        [
+            SpeedChangeSegment(
+                **kwargs,
+                target=FlightPoint(equivalent_airspeed=250.0 * knot),
+                name="acceleration",
+            ),
+            AltitudeChangeSegment(
+                **kwargs,
+                target=FlightPoint(altitude=25000.0 * foot, equivalent_airspeed="constant"),
+                thrust_rate=0.9,
+                name="climb",
+            ),
+            AltitudeChangeSegment(
+                **kwargs,
+                target=FlightPoint(mach=0.78, equivalent_airspeed="constant"),
+                thrust_rate=0.9,
+                name="climb",
+            ),
+            CruiseSegment(
+                **kwargs,
+                target=FlightPoint(ground_distance=300.0e3),
+                engine_setting=EngineSetting.CRUISE,
+                name="cruise",
+            ),
+            OptimalCruiseSegment(
+                **kwargs,
+                target=FlightPoint(ground_distance=200.0e3, mach="constant"),
+                engine_setting=EngineSetting.CRUISE,
+                name="cruise",
+            ),
+            HoldSegment(**kwargs, target=FlightPoint(time=600.0), name="hold"),
+            AltitudeChangeSegment(
+                **kwargs,
+                target=FlightPoint(altitude=10000.0 * foot, equivalent_airspeed="constant"),
+                thrust_rate=0.1,
+                time_step=5.0,
+                name="descent",
+            ),
+        ]
+    )
+    return sequence
+
+
+def get_starts(masses=MASSES):
+    return [
+        FlightPoint(true_airspeed=150.0 * knot, altitude=1500.0 * foot, mass=mass)
+        for mass in masses
+    ]
+
+
+def check_members(ensemble_flight_points, flight_part, starts):
+    """Checks that members are computed as they would be one by one."""
+    assert ensemble_flight_points.columns[0] == MEMBER_COLUMN
+    assert list(ensemble_flight_points[MEMBER_COLUMN].unique()) == list(range(len(starts)))
+
+    for member, start in enumerate(starts):
+        expected_points = flight_part.compute_from(start)
+        member_points = ensemble_flight_points.loc[
+            ensemble_flight_points[MEMBER_COLUMN] == member
+        ].drop(columns=MEMBER_COLUMN)
+        assert len(member_points) == len(expected_points)
+        assert list(member_points.columns) == list(expected_points.columns)
+        for name in ["time", "altitude", "mass", "ground_distance", "mach", "thrust", "CD"]:
+            assert_allclose(member_points[name], expected_points[name], rtol=1.0e-10)
+        assert list(member_points.name) == list(expected_points.name)
+        assert list(member_points.engine_setting) == list(expected_points.engine_setting)
+
+
+def patch_batch_calls():
+    return patch.object(
+        FuelEngineSet,
+        "compute_flight_points_batch",
+        autospec=True,
+        side_effect=FuelEngineSet.compute_flight_points_batch,
+    )
+
+
+def test_compute_ensemble_from_sequence(flight_sequence):
+    starts = get_starts()
+    with patch_batch_calls() as compute_flight_points_batch:
+        flight_points = flight_sequence.compute_ensemble_from(starts)
+
+    check_members(flight_points, flight_sequence, starts)
+
+    # Propulsion model is called once per time step for all active members.
+    batch_sizes = [len(call.args[1]) for call in compute_flight_points_batch.call_args_list]
+    assert max(batch_sizes) == len(starts)
+    assert len(batch_sizes) < sum(batch_sizes)
+
+
+def test_compute_ensemble_from_segment_with_masking(propulsion, high_speed_polar):
+    segment = SpeedChangeSegment(
+        target=FlightPoint(true_airspeed=200.0),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=high_speed_polar,
+        time_step=1.0,
+    )
+    # The heaviest member accelerates more slowly, and the last one starts on target.
+    starts = [
+        FlightPoint(true_airspeed=150.0, altitude=5000.0, mass=mass)
+        for mass in [50000.0, 70000.0, 90000.0]
+    ] + [FlightPoint(true_airspeed=200.0, altitude=5000.0, mass=70000.0)]
+
+    with patch_batch_calls() as compute_flight_points_batch:
+        flight_points = segment.compute_ensemble_from(starts)
+
+    check_members(flight_points, segment, starts)
+
+    # Members are removed from the batch once they have reached their target.
+    batch_sizes = [len(call.args[1]) for call in compute_flight_points_batch.call_args_list]
+    assert batch_sizes[0] == 3
+    assert batch_sizes == sorted(batch_sizes, reverse=True)
+    assert batch_sizes[-1] == 1
+    assert len(batch_sizes) == len(flight_points.loc[flight_points[MEMBER_COLUMN] == 2]) - 1
+
+    point_counts = flight_points[MEMBER_COLUMN].value_counts().sort_index()
+    assert point_counts.iloc[0] < point_counts.iloc[1] < point_counts.iloc[2]
+    assert point_counts.iloc[3] == 1
+
+
+def test_compute_ensemble_from_with_fallback(propulsion, high_speed_polar):
+    # With adaptive time step, members are computed one by one.
+    segment = AltitudeChangeSegment(
+        target=FlightPoint(altitude=25000.0 * foot, equivalent_airspeed="constant"),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=high_speed_polar,
+        thrust_rate=0.9,
+        adaptive_time_step=True,
+    )
+    starts = get_starts()
+    with patch_batch_calls() as compute_flight_points_batch:
+        flight_points = segment.compute_ensemble_from(starts)
+
+    compute_flight_points_batch.assert_not_called()
+    check_members(flight_points, segment, starts)
+
+    assert list(FlightSequence().compute_ensemble_from(starts).columns) == [MEMBER_COLUMN]
@@ -0,0 +1,64 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy.interpolate import interp1d
+
+from ..polar import Polar
+
+
+def test_polar_cd():
+    # Unsorted, irregularly spaced definition points
+    cl = np.array([0.9, 0.0, 0.35, 0.1, 1.2, 0.6, 0.5, 0.2])
+    cd = 0.05 * cl**2 + 0.02 + 0.03 * cl**6
+    polar = Polar(cl, cd)
+    reference = interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")
+
+    # Extrapolation is also checked
+    cl_values = np.linspace(-0.5, 1.5, 201)
+    assert_allclose(polar.cd(cl_values), reference(cl_values), rtol=1e-10)
+    assert_allclose(polar.cd(cl_values.reshape((-1, 3))), reference(cl_values.reshape((-1, 3))))
+    for value in cl_values:
+        assert_allclose(polar.cd(value), reference(value), rtol=1e-10)
+        assert_allclose(polar.cd(np.array(value)), reference(value), rtol=1e-10)
+        assert isinstance(polar.cd(value), np.ndarray)
+        assert np.ndim(polar.cd(value)) == 0
+    assert_allclose(polar.cd(), cd, rtol=1e-10)
+
+
+def test_polar_cl():
+    alpha = np.radians([-2.0, 0.0, 4.0, 10.0])
+    cl = np.array([0.1, 0.3, 0.7, 1.2])
+    polar = Polar(cl, 0.05 * cl**2 + 0.02, alpha)
+    reference = interp1d(alpha, cl, kind="linear", fill_value="extrapolate")
+
+    alpha_values = np.radians(np.linspace(-5.0, 15.0, 41))
+    assert_allclose(polar.cl(alpha_values), reference(alpha_values))
+    assert_allclose(polar.cl(np.radians(2.0)), 0.5)
+
+    with pytest.raises(ValueError):
+        Polar(cl, 0.05 * cl**2 + 0.02).cl(0.0)
+
+
+def test_polar_optimal_cl():
+    cl = np.arange(0.0, 1.5, 0.01)
+    polar = Polar(cl, 0.06 * cl**2 + 0.016)
+    assert_allclose(polar.optimal_cl, np.sqrt(0.016 / 0.06), rtol=1e-4)
+    assert np.shape(polar.optimal_cl) == (1,)
+
+    # Optimum is searched on extrapolated polar, out of the polar definition
+    cl = np.linspace(0.0, 0.3, 7)
+    polar = Polar(cl, 0.06 * cl**2 + 0.016)
+    assert_allclose(polar.optimal_cl, np.sqrt(0.016 / 0.06), rtol=1e-4)
@@ -0,0 +1,62 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from fastoad.model_base import FlightPoint
+
+from ..polar import Polar
+from ..polar_modifier import GroundEffectRaymer
+
+
+def test_ground_effect_raymer():
+    cl = np.linspace(0.0, 1.5, 31)
+    cd = 0.05 * cl**2 + 0.01
+    alpha = np.radians(np.linspace(-2.0, 15.0, 31))
+    polar = Polar(cl, cd, alpha)
+
+    modifier = GroundEffectRaymer(
+        span=34.5,
+        landing_gear_height=2.5,
+        induced_drag_coefficient=0.034,
+        k_winglet=1.0,
+        k_cd=1.0,
+        ground_altitude=100.0,
+    )
+
+    flight_point = FlightPoint(altitude=105.0)
+    modified_polar = modifier.modify_polar(polar, flight_point)
+
+    # Modified polar is the same as the polar built from modified definition values.
+    h_b = (34.5 * 0.1 + 2.5 + 5.0) / 34.5
+    k_ground = 33.0 * h_b**1.5 / (1 + 33.0 * h_b**1.5)
+    expected_cd = cd + 0.034 * cl**2 * (k_ground - 1)
+    expected_polar = Polar(cl, expected_cd, alpha)
+
+    cl_values = np.linspace(-0.1, 1.6, 35)
+    assert_allclose(modified_polar.definition_cd, expected_cd, rtol=1e-12)
+    assert_allclose(modified_polar.cd(cl_values), expected_polar.cd(cl_values), rtol=1e-10)
+    assert_allclose(modified_polar.cd(0.5), expected_polar.cd(0.5), rtol=1e-10)
+    assert_allclose(modified_polar.optimal_cl, expected_polar.optimal_cl, rtol=1e-10)
+    assert_allclose(modified_polar.cl(0.1), polar.cl(0.1))
+
+    # No memoization by default
+    assert modifier.modify_polar(polar, flight_point) is not modified_polar
+
+    # With memoization
+    modifier.height_step = 1.0
+    modified_polar = modifier.modify_polar(polar, flight_point)
+    assert modifier.modify_polar(polar, FlightPoint(altitude=105.3)) is modified_polar
+    assert modifier.modify_polar(polar, FlightPoint(altitude=105.6)) is not modified_polar
+    assert_allclose(modified_polar.cd(cl_values), expected_polar.cd(cl_values), rtol=1e-10)
@@ -14,6 +14,7 @@
 
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from numpy.testing import assert_allclose
@@ -77,7 +78,18 @@ def test_ranged_route(low_speed_polar, high_speed_polar, propulsion, cleanup):
     start = FlightPoint(
         true_airspeed=150.0 * knot, altitude=100.0 * foot, mass=70000.0, ground_distance=100000.0
     )
-    flight_points = flight_calculator.compute_from(start)
+    with (
+        patch.object(
+            initial_climb, "_compute_into", wraps=initial_climb._compute_into
+        ) as initial_climb_computation,
+        patch.object(cruise, "_compute_into", wraps=cruise._compute_into) as cruise_computation,
+        patch.object(descent, "_compute_into", wraps=descent._compute_into) as descent_computation,
+    ):
+        flight_points = flight_calculator.compute_from(start)
+
+    # Climb phases are computed only once along the solving process
+    assert initial_climb_computation.call_count == 1
+    assert descent_computation.call_count == cruise_computation.call_count
 
     # plot_flight(flight_points, "test_ranged_flight.png", RESULTS_FOLDER_PATH)
 
@@ -86,3 +98,24 @@ def test_ranged_route(low_speed_polar, high_speed_polar, propulsion, cleanup):
         total_distance + start.ground_distance,
         atol=flight_calculator.distance_accuracy,
     )
+
+    # Some iterations can reuse descent phases of previous iteration
+    flight_calculator.reuse_descent_phases = True
+    with (
+        patch.object(cruise, "_compute_into", wraps=cruise._compute_into) as cruise_computation,
+        patch.object(descent, "_compute_into", wraps=descent._compute_into) as descent_computation,
+    ):
+        flight_points = flight_calculator.compute_from(start)
+    assert descent_computation.call_count < cruise_computation.call_count
+    assert_allclose(
+        flight_points.iloc[-1].ground_distance,
+        total_distance + start.ground_distance,
+        atol=flight_calculator.distance_accuracy,
+    )
+
+    # Route computed in one go with the solved cruise distance gives the same result
+    flight_calculator.solve_distance = False
+    direct_flight_points = flight_calculator.compute_from(start)
+    assert len(direct_flight_points) == len(flight_points)
+    assert_allclose(direct_flight_points.mass, flight_points.mass)
+    assert_allclose(direct_flight_points.ground_distance, flight_points.ground_distance)
@@ -0,0 +1,59 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.optimize import root_scalar
+
+from ..solver import SolverState, solve_with_secant
+
+
+def test_solve_with_secant_one_unknown():
+    def func(x):
+        return np.cos(x) - x
+
+    scipy_result = root_scalar(func, x0=0.0, x1=1.0, xtol=1.0e-6, method="secant")
+
+    state = SolverState()
+    solution = solve_with_secant(func, 0.0, 1.0, 1.0e-6, state=state)
+    assert_allclose(solution, scipy_result.root, rtol=1.0e-9)
+    assert state.evaluation_count == scipy_result.function_calls
+
+    # Warm start on a slightly modified problem
+    solution = solve_with_secant(lambda x: np.cos(x) - 1.001 * x, 0.0, 1.0, 1.0e-6, state=state)
+    assert_allclose(np.cos(solution) - 1.001 * solution, 0.0, atol=1.0e-6)
+    assert state.evaluation_count < scipy_result.function_calls
+
+
+def test_solve_with_secant_several_unknowns():
+    matrix = np.array([[-2.0, 0.5], [0.1, -1.0]])
+    rhs = np.array([1.0, 3.0])
+
+    def func(x):
+        return matrix @ x + 1.0e-3 * x**2 - rhs
+
+    state = SolverState()
+    solution = solve_with_secant(func, [0.0, 0.0], [1.0, 1.0], 1.0e-8, state=state)
+    assert_allclose(func(solution), 0.0, atol=1.0e-7)
+    cold_start_evaluation_count = state.evaluation_count
+
+    # Warm start on the same problem needs only one evaluation
+    warm_solution = solve_with_secant(func, [0.0, 0.0], [1.0, 1.0], 1.0e-8, state=state)
+    assert_allclose(warm_solution, solution, atol=1.0e-8)
+    assert state.evaluation_count == 1
+    assert cold_start_evaluation_count > 1
+
+    # State is not used if problem size changed
+    solve_with_secant(lambda x: x - 1.0, 0.0, 2.0, 1.0e-8, state=state)
+    assert state.evaluation_count == 3
+    assert_allclose(state.solution, [1.0])
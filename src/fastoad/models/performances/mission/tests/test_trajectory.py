@@ -0,0 +1,141 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+from pandas.testing import assert_frame_equal
+
+from fastoad.constants import EngineSetting
+from fastoad.model_base import FlightPoint
+
+from ..trajectory import SequenceTrajectory, TrajectoryBuffer
+
+
+def _get_flight_points(count):
+    return [
+        FlightPoint(
+            time=float(i),
+            mass=70000.0 - i,
+            altitude=None if i == 0 else 10.0 * i,
+            engine_setting=EngineSetting.CLIMB,
+            thrust_is_regulated=bool(i % 2),
+            name="foo",
+        )
+        for i in range(count)
+    ]
+
+
+def test_trajectory_buffer_dataframe():
+    flight_points = _get_flight_points(10)
+
+    # Small capacity to check buffer growth
+    buffer = TrajectoryBuffer(flight_points, capacity=3)
+    assert len(buffer) == 10
+
+    assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(flight_points))
+    assert_allclose(buffer.get_column("mass"), [70000.0 - i for i in range(10)])
+
+    # Float fields are stored as float64, undefined values being NaN
+    assert buffer.get_column("mass").dtype == np.float64
+    assert np.isnan(buffer.get_column("altitude")[0])
+    assert buffer[0].altitude is None
+    assert buffer.get_column("engine_setting").dtype == object
+
+    # A float field that receives non-float values is stored as object
+    buffer.append(FlightPoint(mass=1.0, equivalent_airspeed="constant"))
+    assert buffer.to_dataframe().equivalent_airspeed.iloc[-1] == "constant"
+    assert buffer[3].equivalent_airspeed is None
+
+    empty_df = TrajectoryBuffer().to_dataframe()
+    assert len(empty_df) == 0
+    assert list(empty_df.columns) == FlightPoint.get_field_names()
+
+
+def test_trajectory_buffer_access():
+    flight_points = _get_flight_points(5)
+    buffer = TrajectoryBuffer(flight_points)
+
+    # First and last points are the provided instances
+    assert buffer[0] is flight_points[0]
+    assert buffer[-1] is flight_points[-1]
+
+    # Other points are rebuilt from stored data
+    assert buffer[2] == flight_points[2]
+    assert buffer[1:3] == flight_points[1:3]
+    assert list(buffer) == flight_points
+
+    # Last points are written only when needed, so in-place modification is taken into account
+    assert buffer[-2] is flight_points[-2]
+    buffer[-1].mass = 42.0
+    assert buffer.to_dataframe().mass.iloc[-1] == 42.0
+
+    del buffer[-1]
+    assert len(buffer) == 4
+    assert buffer[-1] == flight_points[3]
+    with pytest.raises(IndexError):
+        del buffer[0]
+    with pytest.raises(IndexError):
+        _ = buffer[4]
+
+    buffer.append(flight_points[4])
+    assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(flight_points))
+
+    buffer.clear()
+    assert len(buffer) == 0
+    with pytest.raises(IndexError):
+        buffer.pop()
+
+
+def test_sequence_trajectory():
+    flight_points = _get_flight_points(6)
+    trajectory = SequenceTrajectory(flight_points[:3])
+    trajectory.extend_from_dataframe(pd.DataFrame(flight_points[3:]))
+    assert len(trajectory) == 6
+    assert trajectory[4] == flight_points[4]
+
+    rows = trajectory.get_rows(1, 3)
+    trajectory.get_column("mass")[1:3] = 0.0
+    trajectory.set_rows(1, rows)
+    assert_frame_equal(trajectory.to_dataframe(), pd.DataFrame(flight_points))
+
+    # Dropped rows are kept in storage but not in the DataFrame
+    trajectory.drop_row(3)
+    assert len(trajectory) == 6
+    assert trajectory.get_position(2) == 2
+    assert trajectory.get_position(4) == 3
+    assert_frame_equal(
+        trajectory.to_dataframe().reset_index(drop=True),
+        pd.DataFrame(flight_points[:3] + flight_points[4:]),
+    )
+
+    trajectory.truncate(3)
+    assert len(trajectory) == 3
+    trajectory.extend_from_dataframe(pd.DataFrame(flight_points[3:]))
+    assert_frame_equal(trajectory.to_dataframe(), pd.DataFrame(flight_points))
+
+
+def test_trajectory_buffer_first_point():
+    flight_points = _get_flight_points(5)
+    buffer = TrajectoryBuffer(flight_points)
+
+    # First point is the only copy of start point until data are extracted, so in-place
+    # modification is taken into account even if the point has been written in arrays.
+    buffer[0].mass = 42.0
+    assert buffer.get_column("mass")[0] == 42.0
+
+    # Then stored data are the only copy.
+    buffer[0].mass = 0.0
+    assert buffer[0] is not flight_points[0]
+    assert buffer[0].mass == 42.0
@@ -0,0 +1,395 @@
+"""Columnar storage of flight points."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from copy import copy
+from dataclasses import fields
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from fastoad._utils.arrays import scalarize
+from fastoad.model_base import FlightPoint
+
+#: Number of rows that are allocated when no capacity is specified.
+DEFAULT_CAPACITY = 64
+
+#: Number of last appended points that are kept as FlightPoint instances.
+LIVE_POINT_COUNT = 2
+
+
+class TrajectoryBuffer:
+    """
+    Growable storage of flight points, with one NumPy array per FlightPoint field.
+
+    It is meant to replace a list of FlightPoint instances in time-step computations:
+
+        >>> buffer = TrajectoryBuffer([start])
+        >>> buffer.append(next_point)
+        >>> buffer[-1] is next_point
+        True
+        >>> df = buffer.to_dataframe()
+
+    Storage capacity is doubled each time it is exhausted, so appending a point has an
+    amortized constant cost.
+
+    The last appended points are kept "alive": a point is written in the arrays only when
+    enough points have been appended after it, or when data are extracted. The last points,
+    which are the ones used for computing next time step, can therefore be read, modified in
+    place or removed (``del buffer[-1]``) at no cost.
+
+    The first point is also kept as provided, as the start point is often needed. It is the
+    only copy of this point until data are extracted: it is then written in the arrays and
+    no longer kept.
+
+    Fields that are declared as float in FlightPoint are stored in float64 arrays, where
+    undefined values are NaN. Other fields are stored in arrays of object type. A float field
+    that receives a value that cannot be converted to float is stored as object too.
+    """
+
+    def __init__(self, flight_points: Iterable[FlightPoint] = (), capacity: int = None):
+        """
+        :param flight_points: initial content of the buffer
+        :param capacity: initial number of allocated rows
+        """
+        self._field_names: List[str] = FlightPoint.get_field_names()
+        self._capacity = max(1, capacity or DEFAULT_CAPACITY)
+
+        field_types = {cls_field.name: cls_field.type for cls_field in fields(FlightPoint)}
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.full(self._capacity, np.nan)
+            if field_types[name] is float
+            else np.empty(self._capacity, dtype=object)
+            for name in self._field_names
+        }
+
+        # Number of rows actually written in self._columns
+        self._size = 0
+
+        # Last appended points, not yet written in self._columns
+        self._live_points: List[FlightPoint] = []
+
+        # First point, kept for quick access until arrays are read or modified from outside.
+        self._first: Optional[FlightPoint] = None
+
+        for flight_point in flight_points:
+            self.append(flight_point)
+
+    @property
+    def field_names(self) -> List[str]:
+        """Names of stored fields."""
+        return self._field_names
+
+    def append(self, flight_point: FlightPoint):
+        """
+        Adds a flight point at the end of the buffer.
+
+        :param flight_point:
+        """
+        if len(self) == 0:
+            self._first = flight_point
+        if len(self._live_points) == LIVE_POINT_COUNT:
+            self._write_point(self._live_points.pop(0))
+        self._live_points.append(flight_point)
+
+    def extend(self, flight_points: Iterable[FlightPoint]):
+        """
+        Adds flight points at the end of the buffer.
+
+        :param flight_points:
+        """
+        for flight_point in flight_points:
+            self.append(flight_point)
+
+    def pop(self) -> FlightPoint:
+        """
+        Removes and returns the last flight point.
+        """
+        if len(self) == 0:
+            raise IndexError("pop from empty TrajectoryBuffer")
+
+        if self._live_points:
+            flight_point = self._live_points.pop()
+        else:
+            flight_point = self._get_row(self._size - 1)
+            self._size -= 1
+
+        if len(self) == 0:
+            self._first = None
+        return flight_point
+
+    def clear(self):
+        """Removes all flight points. Allocated memory is kept."""
+        self._size = 0
+        self._live_points = []
+        self._first = None
+
+    def truncate(self, size: int):
+        """
+        Removes all flight points after the `size` first ones. Allocated memory is kept.
+
+        :param size: the number of flight points to keep
+        """
+        self._flush()
+        self._size = min(size, self._size)
+
+    def copy(self) -> "TrajectoryBuffer":
+        """
+        :return: a copy of the buffer, with its own storage
+        """
+        self._flush()
+        buffer_copy = copy(self)
+        buffer_copy._columns = {name: column.copy() for name, column in self._columns.items()}
+        buffer_copy._live_points = []
+        return buffer_copy
+
+    def extend_from_dataframe(self, flight_points: pd.DataFrame):
+        """
+        Adds rows of provided DataFrame at the end of the buffer, column by column.
+
+        Columns that do not match a FlightPoint field are ignored. Fields that have no
+        matching column are set to None.
+
+        :param flight_points: a DataFrame as returned by segment computations
+        """
+        self.extend_from_rows(
+            {
+                name: flight_points[name].to_numpy()
+                for name in self._field_names
+                if name in flight_points.columns
+            },
+            len(flight_points),
+        )
+
+    def extend_from_rows(self, rows: Dict[str, np.ndarray], count: Optional[int] = None):
+        """
+        Adds provided values at the end of the buffer, field by field.
+
+        Fields that are not in `rows` are set to None.
+
+        :param rows: a dict of arrays, as provided by :meth:`get_rows`
+        :param count: number of added rows, needed only if `rows` is empty
+        """
+        self._flush()
+        if count is None:
+            count = len(next(iter(rows.values())))
+        while self._size + count > self._capacity:
+            self._grow()
+
+        end = self._size + count
+        for name in self._field_names:
+            self._set_values(name, slice(self._size, end), rows.get(name))
+        self._size = end
+
+    def get_rows(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        :param start: index of first row
+        :param stop: index after last row
+        :return: a copy of stored values between provided indices, as a dict of arrays
+        """
+        self._flush()
+        return {name: self._columns[name][start:stop].copy() for name in self._field_names}
+
+    def set_rows(self, start: int, rows: Dict[str, np.ndarray]):
+        """
+        Overwrites stored values, from provided index, with provided values.
+
+        :param start: index of first row to overwrite
+        :param rows: a dict of arrays, as provided by :meth:`get_rows`
+        """
+        self._flush()
+        for name, values in rows.items():
+            self._set_values(name, slice(start, start + len(values)), values)
+
+    def get_column(self, field_name: str) -> np.ndarray:
+        """
+        :param field_name:
+        :return: a view on stored values for provided field (no copy)
+        """
+        self._flush()
+        return self._columns[field_name][: self._size]
+
+    def to_dataframe(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Float fields that are undefined for all rows are provided as None values, like
+        when building a DataFrame from FlightPoint instances.
+
+        :param rows: if provided, indices of the rows to be put in the DataFrame
+        :return: a pandas DataFrame where column names match fields of
+                 :class:`~fastoad.model_base.flight_point.FlightPoint`
+        """
+        self._flush()
+        data = {}
+        for name in self._field_names:
+            if rows is None:
+                values = self._columns[name][: self._size]
+            else:
+                values = self._columns[name][rows]
+            if values.dtype.kind == "f" and np.all(np.isnan(values)):
+                values = np.full(len(values), None, dtype=object)
+            data[name] = values
+        return pd.DataFrame(data, copy=False).infer_objects()
+
+    def __len__(self):
+        return self._size + len(self._live_points)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[FlightPoint, List[FlightPoint]]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+
+        length = len(self)
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError("TrajectoryBuffer index out of range")
+
+        if item >= self._size:
+            return self._live_points[item - self._size]
+        if item == 0 and self._first is not None:
+            return self._first
+        return self._get_row(item)
+
+    def __delitem__(self, item: int):
+        if item not in [-1, len(self) - 1]:
+            raise IndexError("Only last element of a TrajectoryBuffer can be deleted.")
+        self.pop()
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _flush(self):
+        """
+        Writes live points in arrays, and makes arrays the only storage of first point.
+        """
+        for flight_point in self._live_points:
+            self._write_point(flight_point)
+        self._live_points = []
+
+        if self._first is not None:
+            # First point may have been modified in place since it has been written.
+            self._write_point(self._first, 0)
+            self._first = None
+
+    def _write_point(self, flight_point: FlightPoint, index: Optional[int] = None):
+        """
+        Writes provided point in arrays, at provided index, or after last row if index
+        is not provided.
+        """
+        if index is None:
+            if self._size == self._capacity:
+                self._grow()
+            index = self._size
+            self._size += 1
+
+        for name in self._field_names:
+            value = getattr(flight_point, name)
+            if isinstance(value, np.ndarray):
+                value = scalarize(value)
+            self._set_values(name, index, value)
+
+    def _set_values(self, name: str, index: Union[int, slice], values):
+        """
+        Writes provided values in the array of named field.
+
+        None values are stored as NaN in float arrays. If values cannot be converted to
+        float, the array is converted to object type.
+        """
+        column = self._columns[name]
+        if column.dtype.kind == "f" and isinstance(values, np.ndarray) and values.dtype == object:
+            # Values may be one-element arrays, e.g. when coming from a DataFrame built by
+            # a non-time-step segment.
+            values = np.array([scalarize(value) for value in values], dtype=object)
+        try:
+            column[index] = values
+        except (TypeError, ValueError):
+            object_column = column.astype(object)
+            if column.dtype.kind == "f":
+                object_column[np.isnan(column)] = None
+            object_column[index] = values
+            self._columns[name] = object_column
+
+    def _grow(self):
+        """Doubles storage capacity."""
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            new_column = np.empty(self._capacity, dtype=column.dtype)
+            new_column[: self._size] = column[: self._size]
+            self._columns[name] = new_column
+
+    def _get_row(self, index: int) -> FlightPoint:
+        """Builds a FlightPoint instance from stored values."""
+        values = {}
+        for name, column in self._columns.items():
+            value = column[index]
+            if column.dtype.kind == "f":
+                value = None if np.isnan(value) else float(value)
+            values[name] = value
+        return FlightPoint(**values)
+
+
+class SequenceTrajectory(TrajectoryBuffer):
+    """
+    Trajectory buffer that is shared by all parts of a flight sequence, including
+    nested sequences.
+
+    Flight parts append their flight points in the buffer, and the flight sequences
+    keep track of their part boundaries as row indices.
+
+    When assembling parts, the first point of a part is generally the same as the last point
+    of previous part. Such a point is marked as dropped instead of being removed, so that
+    row indices remain valid. Dropped points are ignored by :meth:`to_dataframe`.
+    """
+
+    def __init__(self, flight_points: Iterable[FlightPoint] = (), capacity: int = None):
+        super().__init__(flight_points, capacity)
+        self._dropped_rows = set()
+
+    def drop_row(self, index: int):
+        """
+        Marks the row at provided index as dropped.
+
+        :param index: a row index
+        """
+        self._dropped_rows.add(index)
+
+    @property
+    def dropped_rows(self) -> List[int]:
+        """Indices of dropped rows, in ascending order."""
+        return sorted(self._dropped_rows)
+
+    def get_position(self, index: int) -> int:
+        """
+        :param index: a row index
+        :return: the position of the row in the DataFrame provided by :meth:`to_dataframe`
+        """
+        return index - sum(1 for dropped_index in self._dropped_rows if dropped_index < index)
+
+    def copy(self) -> "SequenceTrajectory":
+        trajectory_copy = super().copy()
+        trajectory_copy._dropped_rows = set(self._dropped_rows)
+        return trajectory_copy
+
+    def truncate(self, size: int):
+        super().truncate(size)
+        self._dropped_rows = {index for index in self._dropped_rows if index < self._size}
+
+    def clear(self):
+        super().clear()
+        self._dropped_rows.clear()
+
+    def to_dataframe(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        if rows is None and self._dropped_rows:
+            rows = np.setdiff1d(np.arange(len(self)), list(self._dropped_rows))
+        return super().to_dataframe(rows)
@@ -0,0 +1,411 @@
+"""Tabulated surrogate of propulsion models."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from openmdao.core.component import Component
+from scipy.interpolate import RegularGridInterpolator
+
+from fastoad.model_base import FlightPoint, FlightPointBatch
+from fastoad.model_base.propulsion import IOMPropulsionWrapper, IPropulsion
+from fastoad.module_management.service_registry import RegisterPropulsion
+
+_LOGGER = logging.getLogger(__name__)  # Logger for this module
+
+#: Default Mach values of the tabulation grid.
+DEFAULT_MACH_VALUES = tuple(np.linspace(0.0, 1.0, 21))
+
+#: Default altitude values of the tabulation grid, in meters.
+DEFAULT_ALTITUDE_VALUES = tuple(np.linspace(0.0, 14000.0, 29))
+
+#: Default thrust rate values of the tabulation grid.
+DEFAULT_THRUST_RATE_VALUES = tuple(np.linspace(0.0, 1.0, 21))
+
+# Key of tables: (engine setting, ISA temperature offset). Engine setting is None if undefined.
+_TableKey = Tuple[Optional[int], float]
+
+# Value used for undefined engine setting in arrays of engine settings.
+_NO_ENGINE_SETTING = -1
+
+
+@dataclass
+class TabulatedPropulsion(IPropulsion):
+    """
+    Surrogate of a propulsion model, that interpolates in tables of precomputed values.
+
+    The wrapped model is computed on a regular grid of Mach numbers, altitudes and thrust
+    rates. Tables are computed for each (engine_setting, isa_offset) couple, at first usage
+    of the couple, or beforehand with :meth:`compute_tables`.
+
+    In regulated thrust mode, the thrust rate that matches the required thrust is obtained by
+    inverting the interpolated thrust along the thrust rate axis, assuming thrust increases
+    with thrust rate.
+
+    Outside of the grid, values are extrapolated.
+
+    If :attr:`error_check_interval` is not 0, results are regularly checked against the
+    wrapped model, and a warning is issued if relative error exceeds :attr:`error_tolerance`.
+
+    Usage::
+
+        >>> propulsion = TabulatedPropulsion(engine_model, method="cubic")
+        >>> propulsion.compute_flight_points(flight_point)
+    """
+
+    #: The propulsion model to tabulate.
+    propulsion: IPropulsion
+
+    #: Mach values of the grid.
+    mach_values: Sequence[float] = DEFAULT_MACH_VALUES
+
+    #: Altitude values of the grid, in meters.
+    altitude_values: Sequence[float] = DEFAULT_ALTITUDE_VALUES
+
+    #: Thrust rate values of the grid.
+    thrust_rate_values: Sequence[float] = DEFAULT_THRUST_RATE_VALUES
+
+    #: Interpolation method, as in :class:`scipy.interpolate.RegularGridInterpolator`, e.g.
+    #: "linear" for multilinear interpolation or "cubic" for spline interpolation.
+    method: str = "linear"
+
+    #: Fields computed by the wrapped model that are interpolated, in addition to thrust and
+    #: thrust rate.
+    output_fields: Sequence[str] = ("sfc",)
+
+    #: If not 0, results of one call out of this number (starting with the first one) are
+    #: checked against the wrapped model.
+    error_check_interval: int = 0
+
+    #: Accepted relative error when results are checked against the wrapped model.
+    error_tolerance: float = 1.0e-3
+
+    #: Maximum relative error that has been found when checking results.
+    max_relative_error: float = field(default=0.0, init=False)
+
+    _tables: Dict[_TableKey, Dict[str, RegularGridInterpolator]] = field(
+        default_factory=dict, init=False
+    )
+    _call_count: int = field(default=0, init=False)
+
+    @property
+    def interpolated_fields(self) -> List[str]:
+        """Names of fields that are obtained from tables."""
+        return ["thrust", *self.output_fields]
+
+    def compute_flight_points(self, flight_points: Union[FlightPoint, pd.DataFrame]):
+        field_names = FlightPoint.get_field_names()
+        if isinstance(flight_points, pd.DataFrame):
+            batch = FlightPointBatch(
+                **{
+                    name: flight_points[name].to_numpy()
+                    for name in field_names
+                    if name in flight_points.columns
+                }
+            )
+        else:
+            batch = FlightPointBatch(**{name: getattr(flight_points, name) for name in field_names})
+
+        self.compute_flight_points_batch(batch)
+
+        for name in ["thrust_rate", *self.interpolated_fields]:
+            value = getattr(batch, name)
+            if isinstance(flight_points, pd.DataFrame):
+                flight_points[name] = value
+            else:
+                setattr(flight_points, name, value.item() if np.ndim(value) == 0 else value)
+
+    def compute_flight_points_batch(self, flight_points: FlightPointBatch):
+        shape = flight_points.shape
+        mach = self._get_values(flight_points, "mach", shape)
+        altitude = self._get_values(flight_points, "altitude", shape)
+        isa_offset = self._get_values(flight_points, "isa_offset", shape, default=0.0)
+        engine_setting = self._get_values(
+            flight_points, "engine_setting", shape, default=_NO_ENGINE_SETTING
+        )
+        thrust_rate = self._get_values(flight_points, "thrust_rate", shape)
+        thrust = self._get_values(flight_points, "thrust", shape)
+
+        # As stated in IPropulsion, thrust rate is used as input if thrust_is_regulated
+        # is not defined and thrust rate is defined.
+        thrust_is_regulated = self._get_values(flight_points, "thrust_is_regulated", shape)
+        thrust_is_regulated = np.where(
+            np.isnan(thrust_is_regulated), np.isnan(thrust_rate), thrust_is_regulated
+        ).astype(bool)
+
+        results = {name: np.empty(mach.size) for name in ["thrust_rate", *self.interpolated_fields]}
+        table_keys, key_indices = np.unique(
+            np.column_stack([engine_setting, isa_offset]), axis=0, return_inverse=True
+        )
+        for key_index, (setting, offset) in enumerate(table_keys):
+            idx = np.flatnonzero(key_indices.ravel() == key_index)
+            tables = self._get_tables(self._get_table_key(setting, offset))
+
+            point_thrust_rate = thrust_rate[idx]
+            regulated = thrust_is_regulated[idx]
+            if np.any(regulated):
+                point_thrust_rate[regulated] = self._get_thrust_rate(
+                    tables["thrust"],
+                    mach[idx][regulated],
+                    altitude[idx][regulated],
+                    thrust[idx][regulated],
+                )
+
+            grid_points = np.column_stack([mach[idx], altitude[idx], point_thrust_rate])
+            results["thrust_rate"][idx] = point_thrust_rate
+            for name in self.interpolated_fields:
+                results[name][idx] = tables[name](grid_points)
+            results["thrust"][idx[regulated]] = thrust[idx][regulated]
+
+        self._call_count += 1
+        if self.error_check_interval and (self._call_count - 1) % self.error_check_interval == 0:
+            reference = FlightPointBatch(
+                mach=mach,
+                altitude=altitude,
+                isa_offset=isa_offset,
+                engine_setting=np.where(engine_setting == _NO_ENGINE_SETTING, None, engine_setting),
+                thrust_is_regulated=thrust_is_regulated,
+                thrust_rate=thrust_rate,
+                thrust=thrust,
+            )
+            self.propulsion.compute_flight_points_batch(reference)
+            self._check_error(reference, results)
+
+        for name, values in results.items():
+            setattr(flight_points, name, values.reshape(shape))
+
+    def get_consumed_mass(self, flight_point: FlightPoint, time_step: float) -> float:
+        return self.propulsion.get_consumed_mass(flight_point, time_step)
+
+    def compute_tables(self, engine_settings: Sequence[Optional[int]], isa_offsets=(0.0,)):
+        """
+        Computes tables for all combinations of provided engine settings and ISA temperature
+        offsets, so that they will not be computed at first usage.
+
+        :param engine_settings: engine settings, as in FlightPoint.engine_setting
+        :param isa_offsets: ISA temperature offsets in K
+        """
+        for engine_setting in engine_settings:
+            for isa_offset in isa_offsets:
+                self._get_tables(self._get_table_key(engine_setting, isa_offset))
+
+    def _get_tables(self, key: _TableKey) -> Dict[str, RegularGridInterpolator]:
+        """
+        :param key: engine setting and ISA temperature offset
+        :return: interpolators for each interpolated field, computed if needed
+        """
+        tables = self._tables.get(key)
+        if tables is None:
+            engine_setting, isa_offset = key
+            grid = (
+                np.asarray(self.mach_values, dtype=float),
+                np.asarray(self.altitude_values, dtype=float),
+                np.asarray(self.thrust_rate_values, dtype=float),
+            )
+            mach, altitude, thrust_rate = np.meshgrid(*grid, indexing="ij")
+            samples = FlightPointBatch(
+                mach=mach.ravel(),
+                altitude=altitude.ravel(),
+                thrust_rate=thrust_rate.ravel(),
+                thrust_is_regulated=False,
+                engine_setting=engine_setting,
+                isa_offset=isa_offset,
+            )
+            self.propulsion.compute_flight_points_batch(samples)
+            tables = {
+                name: RegularGridInterpolator(
+                    grid,
+                    np.reshape(np.asarray(getattr(samples, name), dtype=float), mach.shape),
+                    method=self.method,
+                    bounds_error=False,
+                    fill_value=None,
+                )
+                for name in self.interpolated_fields
+            }
+            self._tables[key] = tables
+            _LOGGER.debug(
+                "Propulsion tables computed for engine setting %s and ISA offset %.1f K.",
+                engine_setting,
+                isa_offset,
+            )
+
+        return tables
+
+    def _get_thrust_rate(
+        self,
+        thrust_table: RegularGridInterpolator,
+        mach: np.ndarray,
+        altitude: np.ndarray,
+        thrust: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Computes thrust rates that provide required thrust values.
+
+        :param thrust_table: interpolator for thrust
+        :param mach:
+        :param altitude:
+        :param thrust: required thrust values
+        :return: thrust rate values
+        """
+        thrust_rate_values = np.asarray(self.thrust_rate_values, dtype=float)
+        count = len(thrust_rate_values)
+        grid_thrusts = thrust_table(
+            np.column_stack(
+                [
+                    np.repeat(mach, count),
+                    np.repeat(altitude, count),
+                    np.tile(thrust_rate_values, len(mach)),
+                ]
+            )
+        ).reshape(len(mach), count)
+
+        # Index of the thrust rate interval that contains the required thrust
+        # (first or last interval is used for extrapolation)
+        interval_index = np.clip(np.sum(grid_thrusts < thrust[:, None], axis=1) - 1, 0, count - 2)
+        rows = np.arange(len(mach))
+        lower_thrust = grid_thrusts[rows, interval_index]
+        upper_thrust = grid_thrusts[rows, interval_index + 1]
+        lower_rate = thrust_rate_values[interval_index]
+        upper_rate = thrust_rate_values[interval_index + 1]
+
+        thrust_delta = upper_thrust - lower_thrust
+        ratio = np.divide(
+            thrust - lower_thrust,
+            thrust_delta,
+            out=np.zeros_like(thrust_delta),
+            where=thrust_delta != 0.0,
+        )
+        return lower_rate + ratio * (upper_rate - lower_rate)
+
+    def _check_error(self, reference: FlightPointBatch, results: Dict[str, np.ndarray]):
+        """
+        Compares interpolated results with results of the wrapped model.
+
+        :param reference: flight points computed by the wrapped model
+        :param results: interpolated values
+        """
+        relative_error = 0.0
+        for name in ["thrust_rate", *self.interpolated_fields]:
+            reference_values = np.asarray(getattr(reference, name), dtype=float).ravel()
+            scale = np.maximum(np.abs(reference_values), np.finfo(float).tiny)
+            relative_error = max(
+                relative_error, np.max(np.abs(results[name] - reference_values) / scale)
+            )
+
+        self.max_relative_error = max(self.max_relative_error, relative_error)
+        if relative_error > self.error_tolerance:
+            _LOGGER.warning(
+                "Relative error of tabulated propulsion is %.3g, which exceeds tolerance (%.3g). "
+                "The tabulation grid may need to be refined.",
+                relative_error,
+                self.error_tolerance,
+            )
+
+    @staticmethod
+    def _get_values(
+        flight_points: FlightPointBatch, name: str, shape: Tuple[int, ...], default=np.nan
+    ) -> np.ndarray:
+        """
+        :return: the values of the field as a flat float array, where undefined values are
+                 replaced by `default`
+        """
+        value = getattr(flight_points, name)
+        if value is None:
+            return np.full(int(np.prod(shape)), default, dtype=float)
+
+        values = np.broadcast_to(value, shape).ravel()
+        if values.dtype == object:
+            values = [default if item is None else item for item in values]
+        return np.array(values, dtype=float)
+
+    @staticmethod
+    def _get_table_key(engine_setting, isa_offset) -> _TableKey:
+        if engine_setting is None or engine_setting == _NO_ENGINE_SETTING:
+            return None, float(isa_offset)
+        return int(engine_setting), float(isa_offset)
+
+
+class TabulatedPropulsionWrapper(IOMPropulsionWrapper):
+    """
+    Provides a :class:`TabulatedPropulsion` surrogate of the model of another registered
+    propulsion wrapper.
+
+    This class has to be subclassed for defining the wrapped propulsion and, if needed, the
+    tabulation settings. The subclass can then be registered as any propulsion wrapper, and
+    its identifier can be used as `propulsion_id` of mission components, without modifying
+    the engine plugin::
+
+        @RegisterPropulsion("my.tabulated.engine")
+        class MyTabulatedEngine(TabulatedPropulsionWrapper):
+            wrapped_propulsion_id = "my.engine"
+            tabulation_options = {"method": "cubic", "error_check_interval": 100}
+
+    The same surrogate is provided by :meth:`get_model` as long as input values of the
+    wrapped propulsion model do not change, so tables are not computed again.
+    """
+
+    #: Identifier of the registered propulsion wrapper to tabulate.
+    wrapped_propulsion_id: str = ""
+
+    #: Keyword arguments for instantiating :class:`TabulatedPropulsion`.
+    tabulation_options: Dict[str, Any] = {}
+
+    def __init__(self):
+        self._wrapped_wrapper: Optional[IOMPropulsionWrapper] = None
+        self._input_names: List[str] = []
+        self._input_values: List[np.ndarray] = []
+        self._model: Optional[TabulatedPropulsion] = None
+
+    def setup(self, component: Component):
+        self._wrapped_wrapper = RegisterPropulsion.get_provider(self.wrapped_propulsion_id)
+
+        # Inputs of the wrapped model are identified to know when tables have to be recomputed.
+        recorder = _InputRecorder(component)
+        self._wrapped_wrapper.setup(recorder)
+        self._input_names = recorder.input_names
+        self._model = None
+
+    def get_model(self, inputs) -> IPropulsion:
+        input_values = [np.array(inputs[name]) for name in self._input_names]
+        if self._model is None or not all(
+            np.array_equal(value, previous_value)
+            for value, previous_value in zip(input_values, self._input_values)
+        ):
+            self._model = TabulatedPropulsion(
+                self._wrapped_wrapper.get_model(inputs), **self.tabulation_options
+            )
+            self._input_values = input_values
+
+        return self._model
+
+
+class _InputRecorder:
+    """
+    Forwards all calls to an OpenMDAO component, and records names of inputs that are added
+    with :meth:`add_input`.
+    """
+
+    def __init__(self, component: Component):
+        self.input_names: List[str] = []
+        self._component = component
+
+    def add_input(self, name, *args, **kwargs):
+        self.input_names.append(name)
+        return self._component.add_input(name, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._component, name)
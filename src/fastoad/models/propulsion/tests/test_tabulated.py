@@ -0,0 +1,184 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose
+
+from fastoad.constants import EngineSetting
+from fastoad.io import DataFile
+from fastoad.model_base import FlightPoint, FlightPointBatch
+from fastoad.model_base.propulsion import AbstractFuelPropulsion
+from fastoad.models.performances.mission.openmdao.mission_run import MissionComp
+from fastoad.testing import run_system
+
+from ..tabulated import TabulatedPropulsion, TabulatedPropulsionWrapper
+
+MISSION_DATA_FOLDER_PATH = (
+    Path(__file__).parents[2] / "performances" / "mission" / "openmdao" / "tests" / "data"
+)
+
+
+class SmoothEngine(AbstractFuelPropulsion):
+    """Vectorized engine model with smooth (but not linear) variations."""
+
+    def __init__(self):
+        self.call_count = 0
+
+    def compute_flight_points(self, flight_points):
+        self.call_count += 1
+        mach = np.asarray(flight_points.mach)
+        altitude = np.asarray(flight_points.altitude)
+        setting_factor = np.where(np.asarray(flight_points.engine_setting) == 1, 1.0, 0.9)
+        max_thrust = 1.0e5 * setting_factor * (1.0 - 0.3 * mach) * np.exp(-altitude / 1.0e4)
+
+        thrust_is_regulated = np.asarray(flight_points.thrust_is_regulated, dtype=bool)
+        thrust_rate = np.where(
+            thrust_is_regulated,
+            np.asarray(flight_points.thrust, dtype=float) / max_thrust,
+            np.asarray(flight_points.thrust_rate, dtype=float),
+        )
+        flight_points.thrust_rate = thrust_rate
+        flight_points.thrust = thrust_rate * max_thrust
+        flight_points.sfc = 1.0e-5 * (1.0 + 0.5 * mach) * (1.0 + (thrust_rate - 0.8) ** 2)
+
+    def compute_flight_points_batch(self, flight_points: FlightPointBatch):
+        self.compute_flight_points(flight_points)
+
+
+def _get_batch():
+    return FlightPointBatch(
+        mach=[0.2, 0.5, 0.78, 0.78],
+        altitude=[500.0, 4321.0, 10500.0, 10500.0],
+        engine_setting=[1, 1, 3, 1],
+        thrust_is_regulated=[False, True, True, False],
+        thrust_rate=[0.93, 0.0, 0.0, 0.55],
+        thrust=[0.0, 4.0e4, 1.5e4, 0.0],
+    )
+
+
+def test_tabulated_propulsion():
+    engine = SmoothEngine()
+    reference = _get_batch()
+    engine.compute_flight_points_batch(reference)
+
+    for method, rtol in [("linear", 2.0e-3), ("cubic", 1.0e-5)]:
+        tabulated_engine = TabulatedPropulsion(engine, method=method)
+        batch = _get_batch()
+        tabulated_engine.compute_flight_points_batch(batch)
+        for name in ["thrust_rate", "thrust", "sfc"]:
+            assert_allclose(getattr(batch, name), getattr(reference, name), rtol=rtol)
+
+        # One table per engine setting, computed at first usage only
+        assert set(tabulated_engine._tables) == {(1, 0.0), (3, 0.0)}
+        call_count = engine.call_count
+        tabulated_engine.compute_flight_points_batch(_get_batch())
+        assert engine.call_count == call_count
+
+    # Tables can be computed beforehand
+    tabulated_engine = TabulatedPropulsion(engine)
+    tabulated_engine.compute_tables([EngineSetting.TAKEOFF, EngineSetting.CRUISE], [0.0, 15.0])
+    assert set(tabulated_engine._tables) == {(1, 0.0), (1, 15.0), (3, 0.0), (3, 15.0)}
+
+    # Scalar interface, with FlightPoint and DataFrame
+    flight_point = FlightPoint(
+        mach=0.5, altitude=4321.0, engine_setting=1, thrust_is_regulated=True, thrust=4.0e4
+    )
+    tabulated_engine.compute_flight_points(flight_point)
+    assert isinstance(flight_point.sfc, float)
+    assert_allclose(flight_point.thrust, 4.0e4)
+    assert_allclose(flight_point.thrust_rate, reference.thrust_rate[1], rtol=2.0e-3)
+    assert_allclose(flight_point.sfc, reference.sfc[1], rtol=2.0e-3)
+
+    flight_points = pd.DataFrame(_get_batch().to_flight_points())
+    tabulated_engine.compute_flight_points(flight_points)
+    assert_allclose(flight_points.sfc, reference.sfc, rtol=2.0e-3)
+    assert_allclose(
+        tabulated_engine.get_consumed_mass(FlightPoint.create(flight_points.iloc[0]), 10.0),
+        reference.sfc[0] * reference.thrust[0] * 10.0,
+        rtol=2.0e-3,
+    )
+
+
+def test_tabulated_propulsion_error_check(caplog):
+    engine = SmoothEngine()
+
+    tabulated_engine = TabulatedPropulsion(
+        engine, altitude_values=[0.0, 14000.0], error_check_interval=2, error_tolerance=1.0e-3
+    )
+    for _ in range(3):
+        tabulated_engine.compute_flight_points_batch(_get_batch())
+    assert tabulated_engine.max_relative_error > 1.0e-3
+    assert len([record for record in caplog.records if record.levelname == "WARNING"]) == 2
+
+    caplog.clear()
+    tabulated_engine = TabulatedPropulsion(engine, method="cubic", error_check_interval=1)
+    tabulated_engine.compute_flight_points_batch(_get_batch())
+    assert 0.0 < tabulated_engine.max_relative_error < 1.0e-3
+    assert not [record for record in caplog.records if record.levelname == "WARNING"]
+
+
+class TabulatedDummyEngineWrapper(TabulatedPropulsionWrapper):
+    wrapped_propulsion_id = "test.wrapper.propulsion.dummy_engine"
+    tabulation_options = {"error_check_interval": 100}
+
+
+class TabulatedMissionComp(MissionComp):
+    def get_engine_wrapper(self):
+        # Registering TabulatedDummyEngineWrapper would need a plugin.
+        return TabulatedDummyEngineWrapper()
+
+
+def test_tabulated_propulsion_wrapper(with_dummy_plugin_2):
+    ivc = DataFile(MISSION_DATA_FOLDER_PATH / "test_mission_run.xml").to_ivc()
+
+    problems = []
+    for component_class in [MissionComp, TabulatedMissionComp]:
+        problems.append(
+            run_system(
+                component_class(
+                    propulsion_id="test.wrapper.propulsion.dummy_engine",
+                    mission_file_path=MISSION_DATA_FOLDER_PATH / "test_mission.yml",
+                    mission_name="operational",
+                    reference_area_variable="data:geometry:aircraft:reference_area",
+                    variable_prefix="data:payload_range",
+                ),
+                ivc,
+            )
+        )
+
+    reference, problem = problems
+    wrapper = problem.model.component._engine_wrapper
+    assert wrapper._input_names == [
+        "data:propulsion:dummy_engine:max_thrust",
+        "data:propulsion:dummy_engine:max_sfc",
+        "data:geometry:propulsion:engine_count",
+    ]
+    model = wrapper.get_model(problem.model.component._inputs)
+    assert isinstance(model, TabulatedPropulsion)
+    assert wrapper.get_model(problem.model.component._inputs) is model
+
+    # Dummy engine is linear wrt thrust rate and does not depend on Mach and altitude,
+    # so tabulation is exact.
+    assert_allclose(
+        problem["data:payload_range:operational:needed_block_fuel"],
+        reference["data:payload_range:operational:needed_block_fuel"],
+        rtol=1.0e-8,
+    )
+    assert_allclose(
+        problem["data:payload_range:operational:main_route:cruise:distance"],
+        reference["data:payload_range:operational:main_route:cruise:distance"],
+        rtol=1.0e-8,
+    )